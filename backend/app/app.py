@@ -8,6 +8,7 @@ from backend.app.routes.user import user
 from backend.app.routes.admin import admin
 from backend.app.routes.ppt_gen import ppt_bp
 from backend.app.routes.ml import ml
+from backend.app.utils.metrics import init_metrics
 from flask_migrate import Migrate
 
 
@@ -36,6 +37,8 @@ def create_app():
     app.register_blueprint(ppt_bp)
     app.register_blueprint(ml)
 
+    init_metrics(app)
+
     return app
 
 app = create_app()
@@ -1,6 +1,17 @@
 from celery import Celery, Task
+from celery.signals import worker_init
 from flask import Flask
 
+from backend.app.ml_inference.micro_batcher import disable_batching
+
+
+@worker_init.connect
+def _score_inline(**kwargs):
+    # A prefork child runs one task at a time: a request would only ever
+    # wait out the batching window alone. Pool children inherit this.
+    disable_batching()
+
+
 def celery_init_app(app: Flask) -> Celery:
     class FlaskTask(Task):
         def __call__(self, *args: object, **kwargs: object) -> object:
@@ -14,6 +14,18 @@ import json
 import redis
 import hashlib
 from backend.app.utils.job_fetcher import fetch_jobs_from_adzuna
+from backend.app.utils.resume_parser import extract_text
+from backend.app.utils.resume_pipeline import (
+    LLM_ASYNC_ENRICH_DEADLINE,
+    analyze_text,
+    cached_analysis,
+    cached_enrichment,
+    enrich,
+    job_stage,
+    take_upload,
+    unavailable_enrichment,
+    update_job,
+)
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -100,3 +112,57 @@ def fetch_and_cache_jobs(self, roles, location="india"):
     redis_client.setex(cache_key + ":status", JOB_CACHE_TTL, "ready")
 
     return {"count": len(unique_jobs)}
+
+
+def schedule_job_fetch(roles, location="india"):
+    """Queue fetch_and_cache_jobs unless a fetch for these roles is pending / cached."""
+    cache_key = job_cache_key(roles, location)
+
+    # Prevent duplicate Celery jobs
+    status = redis_client.get(cache_key + ":status")
+    if not status:
+        redis_client.setex(
+            cache_key + ":status",
+            JOB_CACHE_TTL,
+            "pending"
+        )
+        fetch_and_cache_jobs.delay(roles, location)
+
+    return cache_key
+
+
+# -------------------------------------------------
+# RESUME ANALYSIS CHAIN (submitted by /user/api/resume/jobs)
+# -------------------------------------------------
+# extract -> analyze -> enrich; each stage writes its progress and
+# partial results to the job (utils/resume_pipeline.py).
+
+@shared_task(bind=True)
+def resume_extract_stage(self, job_id, filename):
+    with job_stage(job_id, "extract"):
+        return extract_text(take_upload(job_id), filename=filename)
+
+
+@shared_task(bind=True)
+def resume_analyze_stage(self, resume_text, job_id, digest):
+    with job_stage(job_id, "analyze"):
+        analysis = cached_analysis(digest) or analyze_text(resume_text, digest)
+        update_job(job_id, "running", "analyze", analysis=analysis)
+    return {"resume_text": resume_text, "analysis": analysis}
+
+
+@shared_task(bind=True)
+def resume_enrich_stage(self, payload, job_id, digest):
+    with job_stage(job_id, "enrich"):
+        analysis = payload["analysis"]
+        enrichment = cached_enrichment(digest)
+        if enrichment is None:
+            try:
+                enrichment = enrich(analysis, payload["resume_text"], digest,
+                                    deadline=LLM_ASYNC_ENRICH_DEADLINE)
+            except Exception:
+                enrichment = unavailable_enrichment()
+
+        jobs_cache_key = schedule_job_fetch(analysis["job_roles"])
+        update_job(job_id, "done", "enrich", enrichment=enrichment, jobs_cache_key=jobs_cache_key)
+    return {"job_id": job_id}
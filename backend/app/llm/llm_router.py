@@ -1,8 +1,14 @@
 # backend/app/llm/llm_router.py
 
+import logging
 import os
+import time
 import requests
 
+from backend.app.utils.metrics import record_error, timed
+
+logger = logging.getLogger(__name__)
+
 OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 
@@ -14,10 +20,28 @@ GROQ_MODELS = [
 ]
 
 
-def call_llm(messages, timeout=12):
+class LLMDeadlineExceeded(RuntimeError):
+    pass
+
+
+def _provider_timeout(timeout, deadline):
+    """Per-request timeout, cut to what is left before ``deadline`` (monotonic)."""
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise LLMDeadlineExceeded("LLM deadline exceeded")
+    return min(timeout, remaining)
+
+
+def call_llm(messages, timeout=12, deadline=None):
     """
     Try OpenRouter first, fallback to Groq models.
     Returns raw text output.
+
+    ``deadline`` (a ``time.monotonic()`` value) bounds the whole call:
+    provider timeouts shrink to the time left and no further fallback
+    is tried once it has passed.
     """
 
     # -------------------------
@@ -26,29 +50,34 @@ def call_llm(messages, timeout=12):
     openrouter_key = os.getenv("OPENROUTER_API_KEY")
 
     if openrouter_key:
+        request_timeout = _provider_timeout(timeout, deadline)
         try:
-            response = requests.post(
-                OPENROUTER_URL,
-                headers={
-                    "Authorization": f"Bearer {openrouter_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "http://localhost",
-                    "X-Title": "Mentora Resume Analyzer",
-                },
-                json={
-                    "model": OPENROUTER_MODEL,
-                    "messages": messages
-                },
-                timeout=timeout
-            )
-
-            data = response.json()
+            with timed("llm", f"openrouter/{OPENROUTER_MODEL}"):
+                response = requests.post(
+                    OPENROUTER_URL,
+                    headers={
+                        "Authorization": f"Bearer {openrouter_key}",
+                        "Content-Type": "application/json",
+                        "HTTP-Referer": "http://localhost",
+                        "X-Title": "Mentora Resume Analyzer",
+                    },
+                    json={
+                        "model": OPENROUTER_MODEL,
+                        "messages": messages
+                    },
+                    timeout=request_timeout
+                )
+
+                data = response.json()
 
             if "choices" in data:
                 return data["choices"][0]["message"]["content"]
 
+            record_error("llm", f"openrouter/{OPENROUTER_MODEL}", "no_choices")
+            logger.warning("OpenRouter returned no choices: %s", data.get("error"))
+
         except Exception as e:
-            print("OpenRouter failed →", e)
+            logger.warning("OpenRouter failed: %s", e)
 
     # -------------------------
     # Groq fallback
@@ -56,26 +85,31 @@ def call_llm(messages, timeout=12):
     groq_key = os.getenv("GROQ_API_KEY")
 
     for model in GROQ_MODELS:
+        request_timeout = _provider_timeout(timeout, deadline)
         try:
-            response = requests.post(
-                GROQ_URL,
-                headers={
-                    "Authorization": f"Bearer {groq_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": model,
-                    "messages": messages
-                },
-                timeout=timeout
-            )
-
-            data = response.json()
+            with timed("llm", f"groq/{model}"):
+                response = requests.post(
+                    GROQ_URL,
+                    headers={
+                        "Authorization": f"Bearer {groq_key}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "model": model,
+                        "messages": messages
+                    },
+                    timeout=request_timeout
+                )
+
+                data = response.json()
 
             if "choices" in data:
                 return data["choices"][0]["message"]["content"]
 
+            record_error("llm", f"groq/{model}", "no_choices")
+            logger.warning("GROQ %s returned no choices: %s", model, data.get("error"))
+
         except Exception as e:
-            print(f"GROQ {model} failed →", e)
+            logger.warning("GROQ %s failed: %s", model, e)
 
     raise RuntimeError("All LLM providers failed")
@@ -4,11 +4,11 @@ from backend.app.llm.llm_router import call_llm
 from backend.app.llm.prompts import SUMMARY_PROMPT
 
 
-def generate_resume_summary(context: dict) -> str:
+def generate_resume_summary(context: dict, deadline=None) -> str:
     prompt = SUMMARY_PROMPT.format(context=context)
 
     messages = [
         {"role": "user", "content": prompt}
     ]
 
-    return call_llm(messages).strip()
+    return call_llm(messages, deadline=deadline).strip()
@@ -6,7 +6,7 @@ from backend.app.llm.llm_router import call_llm
 from backend.app.llm.prompts import SKILL_LEVEL_PROMPT
 
 
-def infer_skill_levels(resume_text: str, skills: list) -> dict:
+def infer_skill_levels(resume_text: str, skills: list, deadline=None) -> dict:
     if not skills:
         return {}
 
@@ -19,7 +19,7 @@ def infer_skill_levels(resume_text: str, skills: list) -> dict:
         {"role": "user", "content": prompt}
     ]
 
-    raw = call_llm(messages)
+    raw = call_llm(messages, deadline=deadline)
 
     # Cleanup markdown / HTML
     raw = re.sub(r"<[^>]+>", "", raw).strip()
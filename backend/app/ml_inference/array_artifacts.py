@@ -0,0 +1,435 @@
+import datetime
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import zipfile
+
+import numpy as np
+import sklearn
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import LinearSVC
+
+from backend.app.ml_inference.compiled_forest import CompiledForest, compile_forest
+
+
+# -------------------------------------------------
+# ARRAY MODEL ARTIFACTS
+# -------------------------------------------------
+# A model is stored as plain arrays in an uncompressed ``<name>.npz``
+# plus a ``<name>.json`` manifest (format version, model kind, params,
+# and shape/dtype/SHA-256 of every array). Nothing is unpickled:
+# estimators are rebuilt from their constructor params and fitted
+# arrays, so artifacts survive sklearn upgrades. Members of the npz are
+# stored uncompressed, so large arrays are memory-mapped straight from
+# the file and shared through the page cache by every worker process.
+#
+# The manifest also records the pickle an artifact was exported from
+# (SHA-256, size, mtime). A pickle replaced after the export makes the
+# artifact stale: loading it with ``source=`` raises StaleArtifactError.
+
+ARRAY_DIR = "arrays"
+FORMAT_NAME = "mentora-array-model"
+FORMAT_VERSION = 1
+
+# Arrays smaller than this are read into memory instead of mapped
+_MMAP_MIN_BYTES = 64 * 1024
+
+_LOCAL_HEADER = struct.Struct("<4s22xHH")
+
+
+class ArtifactIntegrityError(ValueError):
+    """Manifest and array data don't match (corrupt or partial artifact)."""
+
+
+class StaleArtifactError(ArtifactIntegrityError):
+    """The pickle an artifact was exported from has changed since."""
+
+
+# -------------------------
+# Codecs: model <-> (params, attributes, arrays)
+# -------------------------
+
+_LINEAR_MODELS = {
+    cls.__name__: cls for cls in (LinearRegression, LogisticRegression, LinearSVC)
+}
+
+
+def _json_params(estimator):
+    params = {}
+    for key, value in estimator.get_params(deep=False).items():
+        if isinstance(value, tuple):
+            value = list(value)
+        elif isinstance(value, frozenset):
+            value = sorted(value)
+        elif isinstance(value, type) and issubclass(value, np.generic):
+            value = np.dtype(value).name
+        if value is not None and not isinstance(value, (bool, int, float, str, list, dict)):
+            raise TypeError(f"{type(estimator).__name__}.{key} can't be exported: {value!r}")
+        params[key] = value
+    return params
+
+
+def _plain_array(value):
+    array = np.asarray(value)
+    # String labels are held as object arrays; store them as unicode
+    if array.dtype.hasobject and all(isinstance(item, str) for item in array.flat):
+        array = array.astype(str)
+    return array
+
+
+def _fitted_arrays(estimator, names):
+    arrays = {}
+    for name in names:
+        if hasattr(estimator, name):
+            arrays[name] = _plain_array(getattr(estimator, name))
+    if hasattr(estimator, "feature_names_in_"):
+        arrays["feature_names_in_"] = np.asarray(estimator.feature_names_in_, dtype=str)
+    return arrays
+
+
+def _restore_arrays(estimator, arrays):
+    for name, value in arrays.items():
+        if value.dtype.kind == "U":
+            # sklearn keeps string labels / feature names as object arrays
+            value = value.astype(object)
+        # 0-d arrays were numpy scalars (e.g. LinearRegression.intercept_)
+        setattr(estimator, name, value[()] if value.ndim == 0 else value)
+    return estimator
+
+
+def _encode_linear(model):
+    arrays = _fitted_arrays(model, ["coef_", "intercept_", "classes_"])
+    return _json_params(model), {"n_features_in_": int(model.n_features_in_)}, arrays
+
+
+def _decode_linear(manifest, arrays):
+    model = _LINEAR_MODELS[manifest["class"]](**manifest["params"])
+    model.n_features_in_ = manifest["attributes"]["n_features_in_"]
+    return _restore_arrays(model, arrays)
+
+
+def _encode_scaler(scaler):
+    arrays = _fitted_arrays(scaler, ["mean_", "var_", "scale_", "n_samples_seen_"])
+    return _json_params(scaler), {"n_features_in_": int(scaler.n_features_in_)}, arrays
+
+
+def _decode_scaler(manifest, arrays):
+    scaler = StandardScaler(**manifest["params"])
+    scaler.n_features_in_ = manifest["attributes"]["n_features_in_"]
+    return _restore_arrays(scaler, arrays)
+
+
+def _encode_tfidf(vectorizer):
+    params = _json_params(vectorizer)
+    params.pop("vocabulary", None)
+
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+    encoded = [term.encode("utf-8") for term in terms]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(term) for term in encoded])
+
+    arrays = {
+        "idf_": np.asarray(vectorizer.idf_),
+        "terms": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "term_offsets": offsets,
+    }
+    return params, {}, arrays
+
+
+def _decode_tfidf(manifest, arrays):
+    params = dict(manifest["params"])
+    params["ngram_range"] = tuple(params["ngram_range"])
+    params["dtype"] = np.dtype(params["dtype"]).type
+
+    blob = arrays["terms"].tobytes()
+    offsets = arrays["term_offsets"]
+    vocabulary = {
+        blob[offsets[i]:offsets[i + 1]].decode("utf-8"): i
+        for i in range(len(offsets) - 1)
+    }
+
+    vectorizer = TfidfVectorizer(vocabulary=vocabulary, **params)
+    vectorizer.idf_ = arrays["idf_"]
+    return vectorizer
+
+
+_FOREST_ARRAYS = ["feature", "threshold", "left", "right", "value", "roots", "classes"]
+
+
+def _encode_forest(forest):
+    compiled = compile_forest(forest)
+    arrays = {
+        "feature": compiled.feature,
+        "threshold": compiled.threshold,
+        "left": compiled.left,
+        "right": compiled.right,
+        "value": compiled.value,
+        "roots": compiled.roots,
+        "classes": _plain_array(compiled.classes_),
+    }
+    return {}, {"n_trees": compiled.n_trees, "n_features_in_": int(forest.n_features_in_)}, arrays
+
+
+def _decode_forest(manifest, arrays):
+    # Loaded as the array evaluator: sklearn trees can't be rebuilt
+    # from public attributes
+    forest = {name: arrays[name] for name in _FOREST_ARRAYS}
+    if forest["classes"].dtype.kind == "U":
+        forest["classes"] = forest["classes"].astype(object)
+    return CompiledForest(**forest)
+
+
+# kind -> (matches(model), encode, decode)
+CODECS = {
+    "linear_model": (
+        lambda m: type(m).__name__ in _LINEAR_MODELS and type(m) is _LINEAR_MODELS[type(m).__name__],
+        _encode_linear, _decode_linear,
+    ),
+    "standard_scaler": (lambda m: type(m) is StandardScaler, _encode_scaler, _decode_scaler),
+    "tfidf_vectorizer": (lambda m: type(m) is TfidfVectorizer, _encode_tfidf, _decode_tfidf),
+    "random_forest": (
+        lambda m: type(m).__name__ == "RandomForestClassifier", _encode_forest, _decode_forest,
+    ),
+}
+
+
+def codec_for(model):
+    """Kind name that can export ``model``, or None."""
+    for kind, (matches, _, _) in CODECS.items():
+        if matches(model):
+            return kind
+    return None
+
+
+# -------------------------
+# Writing
+# -------------------------
+
+def _order(array):
+    return "F" if array.flags.f_contiguous and not array.flags.c_contiguous else "C"
+
+
+def _stored(array):
+    # Keep Fortran-ordered arrays (e.g. liblinear coef_) as they are: the
+    # memory layout decides BLAS summation order, so it must round-trip
+    array = np.asarray(array)
+    return array if array.flags.c_contiguous or array.flags.f_contiguous else np.ascontiguousarray(array)
+
+
+def _digest(array):
+    # SHA-256 of the raw buffer in storage order
+    buffer = array.T if _order(array) == "F" else np.ascontiguousarray(array)
+    return hashlib.sha256(buffer.data).hexdigest()
+
+
+def manifest_path(base_path):
+    return base_path + ".json"
+
+
+def export_model(model, base_path, source=None):
+    """
+    Write ``<base_path>.npz`` and ``<base_path>.json`` for ``model``.
+
+    Args:
+        model: fitted estimator supported by one of CODECS
+        base_path (str): output path without extension
+        source (str | None): pickle the model came from, recorded with its
+            hash, size and mtime
+
+    Returns:
+        dict: the manifest
+    """
+    kind = codec_for(model)
+    if kind is None:
+        raise TypeError(f"No array codec for {type(model).__name__}")
+
+    params, attributes, arrays = CODECS[kind][1](model)
+    arrays = {name: _stored(value) for name, value in arrays.items()}
+    for name, value in arrays.items():
+        if value.dtype.hasobject:
+            raise TypeError(f"Array '{name}' has object dtype")
+
+    npz_name = os.path.basename(base_path) + ".npz"
+    manifest = {
+        "format": FORMAT_NAME,
+        "format_version": FORMAT_VERSION,
+        "kind": kind,
+        "class": type(model).__name__,
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "sklearn_version": sklearn.__version__,
+        "numpy_version": np.__version__,
+        "source": source and _source_record(source),
+        "params": params,
+        "attributes": attributes,
+        "npz": npz_name,
+        "arrays": {
+            name: {
+                "dtype": value.dtype.str,
+                "shape": list(value.shape),
+                "order": _order(value),
+                "sha256": _digest(value),
+            }
+            for name, value in arrays.items()
+        },
+    }
+
+    directory = os.path.dirname(os.path.abspath(base_path))
+    os.makedirs(directory, exist_ok=True)
+
+    # npz first, manifest last: a manifest always describes a complete npz
+    fd, tmp_npz = tempfile.mkstemp(dir=directory, suffix=".npz.tmp")
+    with os.fdopen(fd, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_npz, os.path.join(directory, npz_name))
+
+    fd, tmp_manifest = tempfile.mkstemp(dir=directory, suffix=".json.tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_manifest, manifest_path(base_path))
+
+    return manifest
+
+
+def _source_record(path):
+    st = os.stat(path)
+    return {
+        "file": os.path.basename(path),
+        "sha256": _file_sha256(path),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+    }
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# -------------------------
+# Reading
+# -------------------------
+
+def _open_members(npz_path, mmap):
+    """
+    Read every .npy member of an uncompressed npz, memory-mapping the
+    large ones at their offset inside the zip file.
+    """
+    arrays = {}
+    with open(npz_path, "rb") as f, zipfile.ZipFile(f) as archive:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ArtifactIntegrityError(f"{info.filename} is compressed; expected np.savez output")
+
+            f.seek(info.header_offset)
+            signature, name_len, extra_len = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+            if signature != b"PK\x03\x04":
+                raise ArtifactIntegrityError(f"Bad zip entry header for {info.filename}")
+            f.seek(info.header_offset + _LOCAL_HEADER.size + name_len + extra_len)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ArtifactIntegrityError(f"{info.filename} holds Python objects")
+
+            order = "F" if fortran else "C"
+            nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+
+            if mmap and nbytes >= _MMAP_MIN_BYTES:
+                mapped = np.memmap(npz_path, dtype=dtype, mode="r", offset=f.tell(),
+                                   shape=shape, order=order)
+                array = np.asarray(mapped)
+            else:
+                array = np.frombuffer(f.read(nbytes), dtype=dtype).reshape(shape, order=order)
+
+            arrays[os.path.splitext(info.filename)[0]] = array
+    return arrays
+
+
+def read_manifest(base_path):
+    with open(manifest_path(base_path)) as f:
+        manifest = json.load(f)
+
+    if manifest.get("format") != FORMAT_NAME:
+        raise ArtifactIntegrityError(f"{manifest_path(base_path)} is not an array model manifest")
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ArtifactIntegrityError(
+            f"Unsupported artifact format version {manifest.get('format_version')} "
+            f"(expected {FORMAT_VERSION})"
+        )
+    if manifest.get("kind") not in CODECS:
+        raise ArtifactIntegrityError(f"Unknown model kind: {manifest.get('kind')}")
+    return manifest
+
+
+def check_source(manifest, source):
+    """
+    Raise StaleArtifactError unless ``source`` is still the pickle the
+    manifest was exported from. Size and mtime are compared first; the
+    file is only hashed when they differ (e.g. a copy with the same
+    bytes). Nothing to compare if the export recorded no source or the
+    pickle is gone.
+    """
+    recorded = manifest.get("source")
+    if not recorded:
+        return
+    try:
+        st = os.stat(source)
+    except FileNotFoundError:
+        return
+
+    if (st.st_size, st.st_mtime_ns) == (recorded.get("size"), recorded.get("mtime_ns")):
+        return
+    if st.st_size == recorded.get("size", st.st_size) and _file_sha256(source) == recorded["sha256"]:
+        return
+    raise StaleArtifactError(f"{source} changed since it was exported to {manifest['npz']}")
+
+
+def load_array_model(base_path, mmap=True, verify=True, source=None):
+    """
+    Load a model written by ``export_model``.
+
+    Args:
+        base_path (str): artifact path without extension
+        mmap (bool): memory-map large arrays (read-only)
+        verify (bool): check every array's SHA-256 against the manifest
+        source (str | None): pickle the artifact must still match, see
+            ``check_source``
+
+    Raises:
+        ArtifactIntegrityError: on format, shape/dtype or checksum mismatch
+        StaleArtifactError: ``source`` changed since the export
+    """
+    manifest = read_manifest(base_path)
+    if source is not None:
+        check_source(manifest, source)
+    npz_path = os.path.join(os.path.dirname(base_path), manifest["npz"])
+    try:
+        arrays = _open_members(npz_path, mmap)
+    except zipfile.BadZipFile as e:
+        raise ArtifactIntegrityError(f"{npz_path}: {e}") from e
+
+    expected = manifest["arrays"]
+    if set(arrays) != set(expected):
+        raise ArtifactIntegrityError(
+            f"{npz_path}: arrays {sorted(arrays)} don't match manifest {sorted(expected)}"
+        )
+
+    for name, spec in expected.items():
+        array = arrays[name]
+        if (array.dtype.str != spec["dtype"] or list(array.shape) != spec["shape"]
+                or _order(array) != spec["order"]):
+            raise ArtifactIntegrityError(f"{npz_path}: '{name}' has unexpected dtype/shape/order")
+        if verify and _digest(array) != spec["sha256"]:
+            raise ArtifactIntegrityError(f"{npz_path}: checksum mismatch for '{name}'")
+
+    return CODECS[manifest["kind"]][2](manifest, arrays)
@@ -0,0 +1,153 @@
+import numpy as np
+
+
+# -------------------------------------------------
+# ARRAY-COMPILED RANDOM FOREST
+# -------------------------------------------------
+# Every tree of a fitted RandomForestClassifier is flattened into shared
+# node arrays (feature, threshold, left, right, leaf value). All rows
+# walk all trees together, one vectorized step per tree level, so class
+# and probabilities come out of a single pass. Leaves point to
+# themselves in ``left``/``right``; a level only advances the
+# (row, tree) pairs that have not reached a leaf yet.
+
+# Rows evaluated at once; bounds the (rows x trees x classes) buffer
+_BATCH_ROWS = 2048
+
+
+class CompiledForest:
+    """
+    Vectorized evaluator for a flattened forest, optionally preceded by
+    StandardScaler-style standardization.
+
+    Mirrors sklearn exactly: inputs are cast to float32 before the
+    threshold comparisons, and tree probabilities are summed in tree
+    order before dividing by the number of trees.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, classes,
+                 mean=None, scale=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes_ = classes
+        self.mean = mean
+        self.scale = scale
+        self.is_leaf = left == np.arange(len(left))
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def with_scaler(self, scaler):
+        """Same trees (arrays shared), preceded by a fitted StandardScaler."""
+        return CompiledForest(
+            self.feature, self.threshold, self.left, self.right, self.value,
+            self.roots, self.classes_,
+            mean=scaler.mean_ if scaler.with_mean else None,
+            scale=scaler.scale_ if scaler.with_std else None,
+        )
+
+    def standardize(self, X):
+        """The scaler step alone: a standardized float64 copy of ``X``."""
+        X = np.array(X, dtype=np.float64, ndmin=2)
+        if self.mean is not None:
+            X -= self.mean
+        if self.scale is not None:
+            X /= self.scale
+        return X
+
+    def _leaves(self, X):
+        # Trees compare float32 inputs against float64 thresholds
+        X = X.astype(np.float32).astype(np.float64)
+        n_rows, n_features = X.shape
+        flat_X = X.ravel()
+
+        # One slot per (row, tree), row-major
+        nodes = np.tile(self.roots, n_rows)
+        row_offset = np.repeat(np.arange(n_rows) * n_features, self.n_trees)
+        active = np.flatnonzero(~self.is_leaf[nodes])
+
+        while active.size:
+            current = nodes[active]
+            go_left = flat_X[row_offset[active] + self.feature[current]] <= self.threshold[current]
+            current = np.where(go_left, self.left[current], self.right[current])
+            nodes[active] = current
+            active = active[~self.is_leaf[current]]
+
+        return nodes.reshape(n_rows, self.n_trees)
+
+    def predict_with_proba(self, X):
+        """
+        Args:
+            X (array-like): shape (n_samples, n_features), unscaled
+
+        Returns:
+            (labels, proba): labels shape (n_samples,), proba shape
+            (n_samples, n_classes)
+        """
+        X = self.standardize(X)
+        proba = np.empty((len(X), len(self.classes_)), dtype=np.float64)
+
+        for start in range(0, len(X), _BATCH_ROWS):
+            stop = start + _BATCH_ROWS
+            per_tree = self.value[self._leaves(X[start:stop])]
+            # cumsum adds trees strictly in order, like sklearn's accumulator
+            proba[start:stop] = np.cumsum(per_tree, axis=1)[:, -1]
+
+        proba /= self.n_trees
+        labels = self.classes_.take(np.argmax(proba, axis=1), axis=0)
+        return labels, proba
+
+    def predict_proba(self, X):
+        return self.predict_with_proba(X)[1]
+
+    def predict(self, X):
+        return self.predict_with_proba(X)[0]
+
+
+def compile_forest(forest, scaler=None):
+    """
+    Flatten a fitted single-output RandomForestClassifier (and an
+    optional fitted StandardScaler applied before it).
+    """
+    if forest.n_outputs_ != 1:
+        raise TypeError("Only single-output forests are supported")
+
+    n_classes = len(forest.classes_)
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        n = tree.node_count
+        node_ids = np.arange(n)
+        is_leaf = tree.children_left == -1
+
+        features.append(np.where(is_leaf, 0, tree.feature))
+        thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+        lefts.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+        rights.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+        values.append(tree.value[:, 0, :n_classes])
+        roots.append(offset)
+        offset += n
+
+    mean = scale = None
+    if scaler is not None:
+        mean = scaler.mean_ if scaler.with_mean else None
+        scale = scaler.scale_ if scaler.with_std else None
+
+    return CompiledForest(
+        feature=np.concatenate(features).astype(np.intp),
+        threshold=np.concatenate(thresholds).astype(np.float64),
+        left=np.concatenate(lefts).astype(np.intp),
+        right=np.concatenate(rights).astype(np.intp),
+        value=np.ascontiguousarray(np.concatenate(values), dtype=np.float64),
+        roots=np.asarray(roots, dtype=np.intp),
+        classes=forest.classes_,
+        mean=mean,
+        scale=scale,
+    )
@@ -0,0 +1,220 @@
+import json
+import os
+import pickle
+import shutil
+
+import numpy as np
+
+
+# -------------------------------------------------
+# TOP-K COURSE NEIGHBOR TABLE
+# -------------------------------------------------
+
+DEFAULT_TOP_K = 50
+
+# Rows copied out of the similarity matrix at a time while building
+_BUILD_CHUNK = 1024
+
+# Legacy dense N x N pickle and the CSR directory that replaces it
+DENSE_SIMILARITY_FILE = "course_similarity_matrix.pkl"
+CSR_SIMILARITY_DIR = "course_similarity_csr"
+CSR_FORMAT_VERSION = 1
+CSR_FILES = ("meta.json", "indptr.npy", "indices.npy", "data.npy")
+
+
+def _select_top(row, k):
+    """
+    Indices of the ``k`` best scores in ``row``, ordered by descending
+    score with ties broken by lower index - the same order the old
+    ``sorted(..., reverse=True)`` over the whole row produced.
+    """
+    candidates = np.argpartition(row, -k)[-k:]
+    cutoff = row[candidates].min()
+
+    # argpartition picks arbitrarily among scores equal to the cutoff,
+    # so keep the lowest-index ones explicitly
+    above = np.flatnonzero(row > cutoff)
+    tied = np.flatnonzero(row == cutoff)[:k - len(above)]
+    selected = np.concatenate((above, tied))
+
+    order = np.lexsort((selected, -row[selected]))
+    return selected[order]
+
+
+def top_n_from_row(row, top_n, exclude=None):
+    """
+    Best ``top_n`` columns of one similarity row using argpartition,
+    optionally skipping ``exclude`` (the course itself).
+    """
+    row = np.asarray(row, dtype=np.float64)
+    if exclude is not None:
+        row = row.copy()
+        row[exclude] = -np.inf
+
+    available = len(row) - (exclude is not None)
+    top_n = max(0, min(top_n, available))
+    if top_n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    return _select_top(row, top_n)
+
+
+def build_neighbor_table(sim_matrix, k=DEFAULT_TOP_K):
+    """
+    Precompute the ``k`` most similar courses for every course.
+
+    Returns:
+        (indices, scores): arrays of shape (N, k), best match first,
+        with each course excluded from its own neighbor list.
+    """
+    n = sim_matrix.shape[0]
+    k = max(0, min(k, n - 1))
+
+    indices = np.empty((n, k), dtype=np.int32)
+    scores = np.empty((n, k), dtype=np.float32)
+
+    if k == 0:
+        return indices, scores
+
+    for start in range(0, n, _BUILD_CHUNK):
+        stop = min(start + _BUILD_CHUNK, n)
+        block = np.array(sim_matrix[start:stop], dtype=np.float64)
+        block[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+
+        for offset, row in enumerate(block):
+            row_indices = _select_top(row, k)
+            indices[start + offset] = row_indices
+            scores[start + offset] = row[row_indices]
+
+    return indices, scores
+
+
+class CourseNeighbors:
+    """
+    Constant-time ``top_n`` lookups backed by a precomputed neighbor
+    table stored CSR-style: row ``i`` holds the neighbors of course
+    ``i`` in ``indices[indptr[i]:indptr[i + 1]]``, best match first.
+
+    When the dense similarity matrix is available, requests larger
+    than a row fall back to argpartition over the full matrix row.
+    Tables loaded from the CSR artifact only know their stored
+    neighbors.
+    """
+
+    def __init__(self, indptr, indices, scores, sim_matrix=None):
+        self.indptr = indptr
+        self.indices = indices
+        self.scores = scores
+        self.sim_matrix = sim_matrix
+
+    @classmethod
+    def from_matrix(cls, sim_matrix, k=DEFAULT_TOP_K):
+        indices, scores = build_neighbor_table(sim_matrix, k)
+        n, k = indices.shape
+        indptr = np.arange(n + 1, dtype=np.int64) * k
+        return cls(indptr, indices.ravel(), scores.ravel(), sim_matrix=sim_matrix)
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def top_n(self, idx: int, top_n: int = 5) -> np.ndarray:
+        start, stop = int(self.indptr[idx]), int(self.indptr[idx + 1])
+
+        if top_n <= stop - start or self.sim_matrix is None:
+            return np.asarray(self.indices[start:min(start + max(top_n, 0), stop)])
+        return top_n_from_row(self.sim_matrix[idx], top_n, exclude=idx)
+
+
+# -------------------------------------------------
+# ARTIFACT I/O
+# -------------------------------------------------
+
+def save_csr_neighbors(sim_matrix, out_dir, k=DEFAULT_TOP_K, threshold=0.0):
+    """
+    Write the top-``k`` neighbors of every course whose similarity is
+    at least ``threshold`` as plain ``.npy`` arrays (indptr, indices,
+    data) plus ``meta.json``. Plain ``.npy`` files can be memory-mapped,
+    so every worker shares the same page-cache pages.
+    """
+    indices, scores = build_neighbor_table(sim_matrix, k)
+    keep = scores >= threshold
+
+    indptr = np.zeros(len(indices) + 1, dtype=np.int64)
+    np.cumsum(keep.sum(axis=1), out=indptr[1:])
+
+    tmp_dir = out_dir + ".tmp"
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    np.save(os.path.join(tmp_dir, "indptr.npy"), indptr)
+    np.save(os.path.join(tmp_dir, "indices.npy"), indices[keep])
+    np.save(os.path.join(tmp_dir, "data.npy"), scores[keep])
+
+    meta = {
+        "format": "course-neighbors-csr",
+        "version": CSR_FORMAT_VERSION,
+        "n_courses": int(len(indices)),
+        "top_k": int(indices.shape[1]),
+        "threshold": float(threshold),
+        "nnz": int(indptr[-1]),
+    }
+    with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+    # Swap the finished directory in so readers never see a partial artifact
+    if os.path.isdir(out_dir):
+        old_dir = out_dir + ".old"
+        os.rename(out_dir, old_dir)
+        os.rename(tmp_dir, out_dir)
+        shutil.rmtree(old_dir)
+    else:
+        os.rename(tmp_dir, out_dir)
+
+    return meta
+
+
+def load_csr_neighbors(csr_dir):
+    with open(os.path.join(csr_dir, "meta.json")) as f:
+        meta = json.load(f)
+
+    if meta.get("version") != CSR_FORMAT_VERSION:
+        raise ValueError(f"Unsupported course similarity format: {meta}")
+
+    return CourseNeighbors(
+        np.load(os.path.join(csr_dir, "indptr.npy"), mmap_mode="r"),
+        np.load(os.path.join(csr_dir, "indices.npy"), mmap_mode="r"),
+        np.load(os.path.join(csr_dir, "data.npy"), mmap_mode="r"),
+    )
+
+
+def course_neighbor_files(model_dir):
+    """
+    Files (relative to ``model_dir``) ``load_course_neighbors`` reads:
+    the CSR metadata and arrays when converted, else the dense pickle.
+    """
+    if os.path.isdir(os.path.join(model_dir, CSR_SIMILARITY_DIR)):
+        return tuple(os.path.join(CSR_SIMILARITY_DIR, name) for name in CSR_FILES)
+    return (DENSE_SIMILARITY_FILE,)
+
+
+def load_course_neighbors(model_dir, k=DEFAULT_TOP_K):
+    """
+    Load the course neighbor table from ``model_dir``.
+
+    Prefers the memory-mapped CSR directory; falls back to the legacy
+    dense pickle, building the top-``k`` table in memory.
+    """
+    csr_dir = os.path.join(model_dir, CSR_SIMILARITY_DIR)
+    if os.path.isdir(csr_dir):
+        return load_csr_neighbors(csr_dir)
+
+    dense_path = os.path.join(model_dir, DENSE_SIMILARITY_FILE)
+    if not os.path.exists(dense_path):
+        raise FileNotFoundError(
+            f"No course similarity artifact in {model_dir} "
+            f"(expected {CSR_SIMILARITY_DIR}/ or {DENSE_SIMILARITY_FILE})"
+        )
+
+    with open(dense_path, "rb") as f:
+        sim_matrix = pickle.load(f)
+
+    return CourseNeighbors.from_matrix(sim_matrix, k)
@@ -0,0 +1,177 @@
+import re
+
+import numpy as np
+
+
+# -------------------------------------------------
+# COURSE NAME INDEX
+# -------------------------------------------------
+# Built once over ``clean_name``:
+#   * exact-match hash        name -> positions
+#   * prefix trie             char nodes holding the first matching positions
+#   * trigram postings        trigram -> positions (substring + typo tolerance)
+#
+# Matches are ranked exact > prefix > substring > fuzzy, ties by catalog
+# position (the order ``str.contains`` used to report them in).
+
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+SUBSTRING_SCORE = 0.8
+FUZZY_WEIGHT = 0.7
+
+# Dice similarity of padded trigram sets. One typo in a 15-char name
+# still scores ~0.8; at 0.3 unrelated names sharing a few common
+# trigrams ("machine learning" -> "teaching fi rights running") matched
+MIN_FUZZY_SIMILARITY = 0.5
+
+# Trie nodes above this depth keep only the first ``_NODE_POSTINGS``
+# positions; the node at the depth cap keeps all of them.
+_MAX_TRIE_DEPTH = 16
+_NODE_POSTINGS = 32
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_course_name(name) -> str:
+    if not isinstance(name, str):
+        return ""
+    return _WHITESPACE.sub(" ", name.lower()).strip()
+
+
+def _trigrams(text: str, padded: bool):
+    if padded:
+        text = f" {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "positions")
+
+    def __init__(self):
+        self.children = {}
+        self.positions = []
+
+
+class CourseNameIndex:
+    def __init__(self, names):
+        self.names = [normalize_course_name(n) for n in names]
+        self.exact = {}
+        self.trie = _TrieNode()
+
+        postings = {}
+        trigram_counts = np.zeros(len(self.names), dtype=np.int32)
+
+        for position, name in enumerate(self.names):
+            if not name:
+                continue
+
+            self.exact.setdefault(name, []).append(position)
+            self._insert_prefix(name, position)
+
+            grams = _trigrams(name, padded=True)
+            trigram_counts[position] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(position)
+
+        self.postings = {
+            gram: np.asarray(positions, dtype=np.int32)
+            for gram, positions in postings.items()
+        }
+        self.trigram_counts = trigram_counts
+
+    def _insert_prefix(self, name, position):
+        node = self.trie
+        for depth, char in enumerate(name[:_MAX_TRIE_DEPTH], start=1):
+            node = node.children.setdefault(char, _TrieNode())
+            if depth == _MAX_TRIE_DEPTH or len(node.positions) < _NODE_POSTINGS:
+                node.positions.append(position)
+
+    # -------------------------
+    # Individual match tiers
+    # -------------------------
+
+    def _prefix_matches(self, query):
+        node = self.trie
+        for char in query[:_MAX_TRIE_DEPTH]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        if len(query) <= _MAX_TRIE_DEPTH:
+            return node.positions
+        return [p for p in node.positions if self.names[p].startswith(query)]
+
+    def _shared_trigrams(self, grams):
+        lists = [self.postings[g] for g in grams if g in self.postings]
+        if not lists:
+            return None
+        return np.bincount(np.concatenate(lists), minlength=len(self.names))
+
+    def _substring_matches(self, query):
+        if len(query) < 3:
+            # Too short for trigrams; the catalog scan is cheap at this length
+            return [p for p, name in enumerate(self.names) if query in name]
+
+        grams = _trigrams(query, padded=False)
+        shared = self._shared_trigrams(grams)
+        if shared is None:
+            return []
+
+        candidates = np.flatnonzero(shared == len(grams))
+        return [int(p) for p in candidates if query in self.names[p]]
+
+    def _fuzzy_matches(self, query, limit):
+        grams = _trigrams(query, padded=True)
+        shared = self._shared_trigrams(grams)
+        if shared is None:
+            return []
+
+        # Dice coefficient between the query and name trigram sets
+        similarity = 2.0 * shared / (len(grams) + self.trigram_counts).clip(min=1)
+        candidates = np.flatnonzero(similarity >= MIN_FUZZY_SIMILARITY)
+        if len(candidates) > limit:
+            best = np.argpartition(-similarity[candidates], limit - 1)[:limit]
+            candidates = candidates[best]
+
+        order = np.lexsort((candidates, -similarity[candidates]))
+        return [(int(p), float(similarity[p])) for p in candidates[order]]
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    def search(self, query: str, limit: int = 10):
+        """
+        Ranked matches for ``query``.
+
+        Returns:
+            list[tuple[int, float]]: (catalog position, score), best first
+        """
+        query = normalize_course_name(query)
+        if not query or limit <= 0:
+            return []
+
+        results = []
+        seen = set()
+
+        def add(positions, score):
+            for position in positions:
+                if len(results) >= limit:
+                    return
+                if position not in seen:
+                    seen.add(position)
+                    results.append((position, score))
+
+        add(self.exact.get(query, []), EXACT_SCORE)
+        add(self._prefix_matches(query), PREFIX_SCORE)
+        if len(results) < limit:
+            add(self._substring_matches(query), SUBSTRING_SCORE)
+        if len(results) < limit:
+            for position, similarity in self._fuzzy_matches(query, limit):
+                add([position], round(FUZZY_WEIGHT * similarity, 4))
+
+        return results
+
+    def best_match(self, query: str):
+        results = self.search(query, limit=1)
+        return results[0][0] if results else None
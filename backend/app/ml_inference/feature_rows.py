@@ -0,0 +1,211 @@
+import math
+
+import numpy as np
+from scipy import sparse
+from sklearn.compose import ColumnTransformer
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder
+
+
+# -------------------------------------------------
+# COMPILED FEATURE-ROW BUILDERS
+# -------------------------------------------------
+# A fitted Pipeline(ColumnTransformer -> estimator) is turned into a
+# list of blocks, each writing its slice of the output row straight
+# from the request dict. No DataFrame is built, and the final
+# estimator sees exactly the row the ColumnTransformer would produce.
+
+
+class _OneHotBlock:
+    def __init__(self, columns, encoder, offset):
+        if encoder.drop_idx_ is not None or getattr(encoder, "_infrequent_enabled", False):
+            raise TypeError("OneHotEncoder with drop/infrequent categories is not supported")
+        # Unknown categories are skipped below; any other setting would
+        # make sklearn raise (or encode them) where this block does not
+        if encoder.handle_unknown != "ignore":
+            raise TypeError(f"OneHotEncoder(handle_unknown={encoder.handle_unknown!r}) is not supported")
+
+        self.columns = list(columns)
+        self.lookups = []
+
+        for categories in encoder.categories_:
+            self.lookups.append({
+                category: offset + i for i, category in enumerate(categories)
+            })
+            offset += len(categories)
+
+    def fill_dense(self, row, record):
+        for column, lookup in zip(self.columns, self.lookups):
+            # Unknown categories are ignored, like handle_unknown="ignore"
+            index = lookup.get(record[column])
+            if index is not None:
+                row[index] = 1.0
+
+    def sparse_entries(self, record):
+        indices = []
+        for column, lookup in zip(self.columns, self.lookups):
+            index = lookup.get(record[column])
+            if index is not None:
+                indices.append(index)
+        return indices, [1.0] * len(indices)
+
+
+class _PassthroughBlock:
+    def __init__(self, columns, offset):
+        self.columns = list(columns)
+        self.offset = offset
+
+    def fill_dense(self, row, record):
+        for i, column in enumerate(self.columns):
+            row[self.offset + i] = _to_float(column, record[column])
+
+    def sparse_entries(self, record):
+        indices, values = [], []
+        for i, column in enumerate(self.columns):
+            value = _to_float(column, record[column])
+            if value != 0.0:
+                indices.append(self.offset + i)
+                values.append(value)
+        return indices, values
+
+
+class _TfidfBlock:
+    def __init__(self, column, vectorizer, offset):
+        self.columns = [column]
+        self.vectorizer = vectorizer
+        self.offset = offset
+
+    def fill_dense(self, row, record):
+        vector = self.vectorizer.transform([record[self.columns[0]]])
+        row[self.offset + vector.indices] = vector.data
+
+    def sparse_entries(self, record):
+        vector = self.vectorizer.transform([record[self.columns[0]]])
+        return (vector.indices + self.offset).tolist(), vector.data.tolist()
+
+
+def _is_passthrough(transformer):
+    # Fitted ColumnTransformers store "passthrough" as an identity FunctionTransformer
+    if isinstance(transformer, str):
+        return transformer == "passthrough"
+    return isinstance(transformer, FunctionTransformer) and transformer.func is None
+
+
+def _to_float(column, value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Field '{column}' must be numeric, got {value!r}")
+
+
+class CompiledPipeline:
+    """
+    Single-row fast path for a fitted ``Pipeline`` whose first step is a
+    ``ColumnTransformer`` made of OneHotEncoder / TfidfVectorizer /
+    passthrough columns.
+
+    ``transform_one`` returns the same dense or CSR row the
+    ColumnTransformer would, so predictions match the DataFrame path.
+    """
+
+    def __init__(self, pipeline):
+        preprocessor = pipeline.steps[0][1]
+        if not isinstance(preprocessor, ColumnTransformer) or len(pipeline.steps) != 2:
+            raise TypeError("Expected Pipeline(ColumnTransformer, estimator)")
+
+        self.pipeline = pipeline
+        self.estimator = pipeline.steps[-1][1]
+        self.feature_names = list(pipeline.feature_names_in_)
+        self.sparse_output = preprocessor.sparse_output_
+        self.n_features = self.estimator.n_features_in_
+        self.blocks = []
+
+        for name, transformer, columns in preprocessor.transformers_:
+            if (isinstance(transformer, str) and transformer == "drop") or len(np.atleast_1d(columns)) == 0:
+                continue
+
+            offset = preprocessor.output_indices_[name].start
+
+            if _is_passthrough(transformer):
+                self.blocks.append(_PassthroughBlock(columns, offset))
+            elif isinstance(transformer, OneHotEncoder):
+                self.blocks.append(_OneHotBlock(columns, transformer, offset))
+            elif isinstance(transformer, TfidfVectorizer) and isinstance(columns, str):
+                self.blocks.append(_TfidfBlock(columns, transformer, offset))
+            else:
+                raise TypeError(f"Unsupported transformer in column '{name}': {transformer!r}")
+
+        self.required_columns = [c for block in self.blocks for c in block.columns]
+
+        # Preallocated template, copied per call so requests never share a row
+        self._dense_template = np.zeros((1, self.n_features), dtype=np.float64)
+
+    def _require_columns(self, record: dict):
+        missing = [c for c in self.required_columns if c not in record]
+        if missing:
+            raise KeyError(", ".join(missing))
+
+    def validate(self, record: dict):
+        """
+        Raise the KeyError / ValueError ``transform_one`` would for this
+        record (missing column, non-numeric or NaN numeric field)
+        without building the row.
+        """
+        self._require_columns(record)
+        for block in self.blocks:
+            if isinstance(block, _PassthroughBlock):
+                for column in block.columns:
+                    if math.isnan(_to_float(column, record[column])):
+                        raise ValueError(f"Field '{column}' must be numeric, got {record[column]!r}")
+
+    def transform_one(self, record: dict):
+        self._require_columns(record)
+
+        if not self.sparse_output:
+            row = self._dense_template.copy()
+            for block in self.blocks:
+                block.fill_dense(row[0], record)
+            return row
+
+        indices, values = [], []
+        for block in self.blocks:
+            block_indices, block_values = block.sparse_entries(record)
+            indices.extend(block_indices)
+            values.extend(block_values)
+
+        return sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float64),
+             np.asarray(indices, dtype=np.int32),
+             np.array([0, len(indices)], dtype=np.int32)),
+            shape=(1, self.n_features)
+        )
+
+    def transform_many(self, records):
+        rows = [self.transform_one(record) for record in records]
+        if self.sparse_output:
+            return sparse.vstack(rows, format="csr")
+        return np.vstack(rows)
+
+    def predict_one(self, record: dict):
+        return self.estimator.predict(self.transform_one(record))[0]
+
+    def predict_proba_one(self, record: dict):
+        return self.estimator.predict_proba(self.transform_one(record))[0]
+
+    def predict_many(self, records):
+        return self.estimator.predict(self.transform_many(records))
+
+    def predict_proba_many(self, records):
+        return self.estimator.predict_proba(self.transform_many(records))
+
+
+def compile_pipeline(pipeline):
+    """
+    Compile a pipeline into a CompiledPipeline, or return None when it
+    uses a step the builder does not understand (callers then keep
+    using the DataFrame path).
+    """
+    try:
+        return CompiledPipeline(pipeline)
+    except (TypeError, AttributeError):
+        return None
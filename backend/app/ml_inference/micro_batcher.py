@@ -0,0 +1,231 @@
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+from backend.app.utils.metrics import observe_batch, timed
+
+
+# -------------------------------------------------
+# IN-PROCESS MICRO-BATCHING
+# -------------------------------------------------
+# Request threads hand single items to a per-model MicroBatcher. With
+# no batch running and nothing queued, the item is scored right away in
+# the caller's thread. Otherwise it is queued and the caller blocks on a
+# Future: a background thread takes the first waiting item, collects
+# whatever else arrives within ``window_ms`` (or until ``max_batch``
+# items), runs one vectorized ``predict_batch`` call and fans the
+# results back out. So only contended requests pay the window, and only
+# a worker serving requests concurrently (threaded dev server, Gunicorn
+# gthread workers) ever batches.
+#
+# ML_BATCH_WINDOW_MS=0 disables batching: items are always scored inline.
+# So does disable_batching(), for processes that handle one task at a
+# time (Celery prefork workers, see celery_setup.py).
+
+DEFAULT_WINDOW_MS = float(os.getenv("ML_BATCH_WINDOW_MS", "2"))
+DEFAULT_MAX_BATCH = int(os.getenv("ML_BATCH_MAX_SIZE", "64"))
+
+# Set by disable_batching()
+_inline_only = False
+
+# Recent queueing delays kept for percentiles
+_DELAY_SAMPLES = 2048
+
+
+class MicroBatcher:
+    """
+    Args:
+        name (str): Shown in stats
+        predict_batch (callable): ``fn(list_of_items) -> list_of_results``,
+            same length and order as the input
+        window_ms (float): How long the first item of a batch waits for company
+        max_batch (int): Batch is dispatched as soon as it reaches this size
+    """
+
+    def __init__(self, name, predict_batch, window_ms=None, max_batch=None):
+        self.name = name
+        self.predict_batch = predict_batch
+        self.window_ms = DEFAULT_WINDOW_MS if window_ms is None else window_ms
+        self.max_batch = max(1, DEFAULT_MAX_BATCH if max_batch is None else max_batch)
+
+        self._lock = threading.Lock()
+        # Held while a batch (or an inline item) is being scored
+        self._busy = threading.Lock()
+        self._queue = None
+        self._pid = None
+        self._reset_stats()
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    def submit(self, item, timeout=None):
+        """
+        Score one item, batched with concurrent callers.
+
+        Raises whatever ``predict_batch`` raised for this item.
+        """
+        if self.window_ms <= 0 or _inline_only:
+            self._record([0.0])
+            return self._predict([item])[0]
+
+        pending = self._queue if self._pid == os.getpid() else None
+        if (pending is None or pending.empty()) and self._busy.acquire(blocking=False):
+            # Uncontended: nothing to batch with, don't wait for company
+            try:
+                self._record([0.0])
+                return self._predict([item])[0]
+            finally:
+                self._busy.release()
+
+        future = Future()
+        self._ensure_worker().put((time.perf_counter(), item, future))
+        return future.result(timeout)
+
+    def stats(self):
+        with self._lock:
+            delays = np.asarray(self._delays, dtype=np.float64) * 1000
+            sizes = dict(sorted(self._batch_sizes.items()))
+            batches, items = self._batches, self._items
+
+        delay_stats = None
+        if delays.size:
+            p50, p95, p99 = np.percentile(delays, [50, 95, 99])
+            delay_stats = {
+                "p50": round(float(p50), 3),
+                "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3),
+                "max": round(float(delays.max()), 3),
+            }
+
+        return {
+            "window_ms": self.window_ms,
+            "max_batch": self.max_batch,
+            "batches": batches,
+            "items": items,
+            "mean_batch_size": round(items / batches, 2) if batches else None,
+            "batch_sizes": sizes,
+            "queue_delay_ms": delay_stats,
+        }
+
+    # -------------------------
+    # Worker
+    # -------------------------
+
+    def _reset_stats(self):
+        self._batches = 0
+        self._items = 0
+        self._batch_sizes = {}
+        self._delays = deque(maxlen=_DELAY_SAMPLES)
+
+    def _ensure_worker(self):
+        # Threads don't survive fork: start one per (worker) process
+        pid = os.getpid()
+        if self._pid == pid:
+            return self._queue
+
+        with self._lock:
+            if self._pid != pid:
+                self._queue = queue.SimpleQueue()
+                if self._pid is not None:
+                    # Forked: the parent's numbers aren't ours
+                    self._reset_stats()
+                threading.Thread(
+                    target=self._run, args=(self._queue,),
+                    name=f"micro-batcher-{self.name}", daemon=True
+                ).start()
+                self._pid = pid
+            return self._queue
+
+    def _run(self, pending):
+        window = self.window_ms / 1000.0
+
+        while True:
+            first = pending.get()
+            with self._busy:
+                batch = [first]
+                deadline = first[0] + window
+
+                while len(batch) < self.max_batch:
+                    remaining = deadline - time.perf_counter()
+                    try:
+                        if remaining > 0:
+                            batch.append(pending.get(timeout=remaining))
+                        else:
+                            # Window is over; still take what's already queued
+                            batch.append(pending.get_nowait())
+                    except queue.Empty:
+                        break
+
+                self._execute(batch)
+
+    def _execute(self, batch):
+        started = time.perf_counter()
+        self._record([started - enqueued for enqueued, _, _ in batch])
+
+        items = [item for _, item, _ in batch]
+        try:
+            results = self._predict(items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"{self.name}: predict_batch returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][2].set_exception(e)
+                return
+            # Isolate the failing item(s): everyone else still gets a result
+            for _, item, future in batch:
+                try:
+                    future.set_result(self._predict([item])[0])
+                except Exception as item_error:
+                    future.set_exception(item_error)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def _predict(self, items):
+        observe_batch(self.name, len(items))
+        with timed("model", self.name):
+            return self.predict_batch(items)
+
+    def _record(self, delays):
+        with self._lock:
+            self._batches += 1
+            self._items += len(delays)
+            size = len(delays)
+            self._batch_sizes[size] = self._batch_sizes.get(size, 0) + 1
+            self._delays.extend(delays)
+
+
+# -------------------------------------------------
+# NAMED BATCHERS
+# -------------------------------------------------
+
+_batchers = {}
+
+
+def disable_batching():
+    """Score every item inline in this process (and in processes forked from it)."""
+    global _inline_only
+    _inline_only = True
+
+
+def register_batcher(name, predict_batch, **kwargs):
+    batcher = MicroBatcher(name, predict_batch, **kwargs)
+    _batchers[name] = batcher
+    return batcher
+
+
+def get_batcher(name):
+    return _batchers[name]
+
+
+def batching_stats():
+    return {name: batcher.stats() for name, batcher in _batchers.items()}
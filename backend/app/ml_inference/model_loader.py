@@ -1,5 +1,16 @@
+import hashlib
+import logging
 import os
+import threading
+import time
+import tracemalloc
+
 import joblib
+import pandas as pd
+
+from backend.app.ml_inference.array_artifacts import ARRAY_DIR, load_array_model, manifest_path
+
+logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -7,8 +18,312 @@ MODEL_DIR = os.path.abspath(
     os.path.join(BASE_DIR, "..", "..", "ml", "models")
 )
 
+# Prefer checksummed array artifacts (MODEL_DIR/arrays/) over pickles when exported
+USE_ARRAY_ARTIFACTS = os.getenv("MODEL_ARRAY_ARTIFACTS", "1") != "0"
+
+# Seconds between checks of loaded artifacts for on-disk changes
+ARTIFACT_CHECK_INTERVAL = float(os.getenv("MODEL_ARTIFACT_CHECK_SECONDS", "5"))
+
+
 def load_model(filename):
     path = os.path.join(MODEL_DIR, filename)
     if not os.path.exists(path):
         raise FileNotFoundError(f"Model file not found: {path}")
-    return joblib.load(path)
\ No newline at end of file
+    return joblib.load(path)
+
+
+# -------------------------------------------------
+# LAZY MODEL REGISTRY
+# -------------------------------------------------
+
+class ModelRegistry:
+    """
+    Process-wide registry that loads each model on first use.
+
+    Entries are registered with a loader ``fn(registry) -> object`` so
+    derived objects (compiled pipelines, indexes) can pull their inputs
+    from the registry too. ``warmup()`` loads everything up front, e.g.
+    in the Gunicorn master with ``preload_app`` so forked workers share
+    the loaded models copy-on-write.
+
+    Every loaded entry has a ``version()``: the content hash of its
+    artifact, or a hash of the versions it was derived from. At most
+    every ARTIFACT_CHECK_INTERVAL seconds, loaded artifacts (and the
+    pickles behind array artifacts) are stat'ed; a changed file drops
+    that model and everything derived from it, so the next ``get``
+    reloads them under a new version.
+    """
+
+    def __init__(self, check_interval=ARTIFACT_CHECK_INTERVAL):
+        self._loaders = {}
+        self._artifacts = {}
+        self._watched = {}       # name -> further files the loader reads
+        self._models = {}
+        self._stats = {}
+        self._versions = {}
+        self._deps = {}          # name -> registry entries its loader used
+        self._signatures = {}    # name -> ((path, mtime_ns, size), ...) at load
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self.check_interval = check_interval
+        self._next_check = time.monotonic() + check_interval
+
+    def register(self, name, loader, artifact=None, watch=()):
+        """
+        Args:
+            name (str): Registry key
+            loader (callable): ``loader(registry)`` returning the model
+            artifact (str | None): Backing file in MODEL_DIR, if any
+            watch (tuple[str]): Other files in MODEL_DIR the loader may
+                read; part of the version and checked for updates too
+        """
+        with self._lock:
+            self._loaders[name] = loader
+            self._artifacts[name] = artifact
+            self._watched[name] = tuple(watch)
+            self.invalidate(name)
+
+    def register_file(self, name, filename, reader=joblib.load):
+        """
+        Register a pickled artifact in MODEL_DIR. If it was exported to
+        ``arrays/`` (backend/ml/scripts/export_model_arrays.py), the
+        memory-mapped array version is loaded instead, as long as the
+        pickle is still the one it was exported from; a pickle replaced
+        since is loaded directly (with a warning) until it is re-exported.
+        """
+        path = os.path.join(MODEL_DIR, filename)
+        base_path = os.path.join(MODEL_DIR, ARRAY_DIR, os.path.splitext(filename)[0])
+
+        if USE_ARRAY_ARTIFACTS and os.path.exists(manifest_path(base_path)):
+            self.register(
+                name,
+                lambda _: _read_array_artifact(base_path, path, reader),
+                artifact=os.path.relpath(manifest_path(base_path), MODEL_DIR),
+                watch=(filename,)
+            )
+        else:
+            self.register(name, lambda _: _read_artifact(path, reader), artifact=filename)
+
+    def get(self, name):
+        if time.monotonic() >= self._next_check:
+            self.check_for_updates()
+
+        loading = getattr(self._local, "loading", None)
+        if loading:
+            # Called from another entry's loader: remember the dependency
+            self._deps[loading[-1]].add(name)
+
+        try:
+            return self._models[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if name not in self._models:
+                if name not in self._loaders:
+                    raise KeyError(f"Unknown model: {name}")
+                self._models[name] = self._load(name)
+            return self._models[name]
+
+    __getitem__ = get
+
+    def is_loaded(self, name) -> bool:
+        return name in self._models
+
+    def version(self, name) -> str:
+        """Content version of ``name``, loading it if needed."""
+        version = self._versions.get(name)
+        if version is None or name not in self._models:
+            with self._lock:
+                self.get(name)
+                version = self._versions[name]
+        return version
+
+    def invalidate(self, name):
+        """
+        Drop ``name`` and every loaded entry derived from it.
+
+        Returns:
+            list[str]: invalidated entries that were loaded
+        """
+        with self._lock:
+            dropped = []
+            pending = [name]
+            while pending:
+                current = pending.pop()
+                if self._models.pop(current, None) is not None:
+                    dropped.append(current)
+                self._versions.pop(current, None)
+                self._signatures.pop(current, None)
+                pending.extend(
+                    other for other, deps in self._deps.items()
+                    if current in deps and other in self._models
+                )
+            return dropped
+
+    def check_for_updates(self):
+        """
+        Stat every loaded artifact and invalidate the ones that changed
+        (or disappeared) since they were loaded.
+
+        Returns:
+            list[str]: invalidated entries
+        """
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            changed = [
+                name for name, signature in list(self._signatures.items())
+                if _file_signatures([entry[0] for entry in signature]) != signature
+            ]
+            return [dropped for name in changed for dropped in self.invalidate(name)]
+
+    def names(self):
+        return list(self._loaders)
+
+    def warmup(self, names=None):
+        """
+        Load ``names`` (default: every registered model) now, tracing
+        how much memory each one allocates. Lazy loads inside requests
+        skip the tracing since tracemalloc slows loading down a lot.
+
+        Returns:
+            dict: per-model stats, see ``stats()``
+        """
+        self._local.track_memory = True
+        try:
+            for name in names or self.names():
+                self.get(name)
+        finally:
+            self._local.track_memory = False
+        return self.stats()
+
+    def stats(self):
+        """
+        Load time (seconds) and traced memory (bytes, warmup only) per
+        loaded model. Nested loads are attributed to the model that was
+        loaded, not to the model whose loader triggered them.
+        """
+        return {
+            name: {
+                "loaded": self.is_loaded(name),
+                "version": self._versions.get(name),
+                **self._stats.get(name, {})
+            }
+            for name in self.names()
+        }
+
+    def _load(self, name):
+        # Time/memory spent loading dependencies inside this loader
+        parent_nested = getattr(self._local, "nested", (0.0, 0))
+        self._local.nested = (0.0, 0)
+
+        track_memory = getattr(self._local, "track_memory", False)
+        started_tracing = track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        artifact = self._artifacts[name]
+        paths = [
+            os.path.join(MODEL_DIR, filename)
+            for filename in ((artifact,) if artifact else ()) + self._watched[name]
+        ]
+        # Taken before reading, so a write racing the load is seen next check
+        signature = _file_signatures(paths)
+
+        self._deps[name] = set()
+        loading = self._local.__dict__.setdefault("loading", [])
+        loading.append(name)
+
+        try:
+            mem_before = tracemalloc.get_traced_memory()[0] if track_memory else 0
+            start = time.perf_counter()
+
+            model = self._loaders[name](self)
+
+            elapsed = time.perf_counter() - start
+            mem_used = tracemalloc.get_traced_memory()[0] - mem_before if track_memory else 0
+        finally:
+            loading.pop()
+            if started_tracing:
+                tracemalloc.stop()
+            nested_time, nested_mem = self._local.nested
+            self._local.nested = parent_nested
+
+        if paths:
+            self._signatures[name] = signature
+            self._versions[name] = _files_hash(paths)
+        else:
+            deps = "|".join(f"{dep}={self._versions.get(dep)}" for dep in sorted(self._deps[name]))
+            self._versions[name] = hashlib.sha256(deps.encode()).hexdigest()[:16]
+
+        self._stats[name] = {
+            "artifact": self._artifacts[name],
+            "load_seconds": round(elapsed - nested_time, 4),
+            "memory_bytes": max(0, mem_used - nested_mem) if track_memory else None,
+            "loaded_at": time.time(),
+            "pid": os.getpid(),
+        }
+        self._local.nested = (parent_nested[0] + elapsed, parent_nested[1] + mem_used)
+
+        return model
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return (path, None, None)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _file_signatures(paths):
+    return tuple(_file_signature(path) for path in paths)
+
+
+def _files_hash(paths):
+    if len(paths) == 1:
+        return _file_hash(paths[0])
+    hashes = "|".join(_file_hash(path) for path in paths if os.path.exists(path))
+    return hashlib.sha256(hashes.encode()).hexdigest()[:16]
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _read_artifact(path, reader):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Model file not found: {path}")
+    return reader(path)
+
+
+def _read_array_artifact(base_path, pickle_path, reader):
+    try:
+        return load_array_model(base_path, source=pickle_path)
+    except (OSError, ValueError) as e:
+        # Missing / corrupt / incompatible / stale export: keep serving from the pickle
+        if not os.path.exists(pickle_path):
+            raise
+        logger.warning("Falling back to %s: %s", pickle_path, e)
+        return reader(pickle_path)
+
+
+model_registry = ModelRegistry()
+
+# Raw artifacts in MODEL_DIR (derived objects are registered next to their users)
+model_registry.register_file("g1_model", "g1_model.pkl")
+model_registry.register_file("g2_model", "g2_model.pkl")
+model_registry.register_file("g3_model", "g3_model.pkl")
+model_registry.register_file("fake_review_model", "fake_review_hybrid_model.pkl")
+model_registry.register_file("course_tfidf", "course_recommender_tfidf.pkl")
+model_registry.register_file("course_dataset", "course_recommender_dataset.pkl", reader=pd.read_pickle)
+model_registry.register_file("stress_model", "stress_level_random_forest.pkl")
+model_registry.register_file("stress_scaler", "stress_level_scaler.pkl")
+model_registry.register_file("domain_model", "domain_model.pkl")
+model_registry.register_file("domain_vectorizer", "domain_vectorizer.pkl")
+model_registry.register_file("job_role_model", "job_role_model.pkl")
+model_registry.register_file("job_role_vectorizer", "job_role_vectorizer.pkl")
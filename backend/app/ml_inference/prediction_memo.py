@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import time
+
+from backend.app.config.extensions import cache
+from backend.app.ml_inference.lru_cache import LRUCache
+from backend.app.ml_inference.model_loader import model_registry
+
+
+# -------------------------------------------------
+# PREDICTION MEMOIZATION
+# -------------------------------------------------
+# For models that are pure functions of their features. Lookups go
+# in-process LRU -> Flask-Caching (Redis, shared by all workers) -> model.
+# Keys contain the registry version of the model, so a changed artifact
+# gets fresh keys as soon as the registry reloads it; stale entries just
+# age out of the LRU / expire in Redis.
+
+MEMO_LOCAL_SIZE = int(os.getenv("ML_MEMO_LOCAL_SIZE", "4096"))
+MEMO_REMOTE_TIMEOUT = int(os.getenv("ML_MEMO_REMOTE_TIMEOUT", "3600"))
+
+# After a Redis error, skip the shared tier for this long
+_REMOTE_RETRY_SECONDS = 30
+
+
+class PredictionMemo:
+    """
+    Args:
+        model_name (str): Registry entry whose version goes into the key
+        canonicalize (callable): ``fn(features) -> JSON-serializable``
+            stable form of the model input (field order, number types)
+    """
+
+    def __init__(self, model_name, canonicalize, local_size=MEMO_LOCAL_SIZE,
+                 remote_timeout=MEMO_REMOTE_TIMEOUT):
+        self.model_name = model_name
+        self.canonicalize = canonicalize
+        self.local = LRUCache(local_size)
+        self.remote_timeout = remote_timeout
+        self.remote_hits = 0
+        self.remote_errors = 0
+        self._remote_disabled_until = 0.0
+
+    def key(self, features):
+        canonical = json.dumps(self.canonicalize(features), separators=(",", ":"))
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"ml-memo:{self.model_name}:{model_registry.version(self.model_name)}:{digest}"
+
+    def get_or_compute(self, features, compute):
+        """
+        Memoized ``compute(features)``. Inputs that can't be
+        canonicalized go straight to ``compute`` (which reports the error).
+        """
+        try:
+            key = self.key(features)
+        except (KeyError, TypeError, ValueError):
+            return compute(features)
+
+        result = self.local.get(key)
+        if result is not None:
+            return result
+
+        result = self._remote_get(key)
+        if result is not None:
+            self.remote_hits += 1
+        else:
+            result = compute(features)
+            self._remote_set(key, result)
+
+        self.local.put(key, result)
+        return result
+
+    def stats(self):
+        return {
+            "version": (
+                model_registry.version(self.model_name)
+                if model_registry.is_loaded(self.model_name) else None
+            ),
+            "local": self.local.stats(),
+            "remote_hits": self.remote_hits,
+            "remote_errors": self.remote_errors,
+        }
+
+    # -------------------------
+    # Shared (Redis) tier
+    # -------------------------
+
+    def _remote_available(self):
+        return time.monotonic() >= self._remote_disabled_until
+
+    def _remote_failed(self):
+        self.remote_errors += 1
+        self._remote_disabled_until = time.monotonic() + _REMOTE_RETRY_SECONDS
+
+    def _remote_get(self, key):
+        if not self._remote_available():
+            return None
+        try:
+            return cache.get(key)
+        except Exception:
+            # Redis down or cache not initialised: serve from the model
+            self._remote_failed()
+            return None
+
+    def _remote_set(self, key, result):
+        if not self._remote_available():
+            return
+        try:
+            cache.set(key, result, timeout=self.remote_timeout)
+        except Exception:
+            self._remote_failed()
@@ -0,0 +1,244 @@
+import math
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfTransformer
+
+from backend.app.ml_inference.micro_batcher import register_batcher
+from backend.app.ml_inference.model_loader import model_registry
+from backend.app.utils.resume_document import ResumeDocument
+
+
+# -------------------------------------------------
+# SINGLE-PASS RESUME CLASSIFICATION
+# -------------------------------------------------
+# The domain and job-role vectorizers were fitted with the same analyzer
+# settings (only their vocabulary sizes differ), so a resume is analyzed
+# once and the shared term counts are mapped onto each vocabulary. The
+# resulting TF-IDF rows are identical to ``vectorizer.transform``.
+
+# Settings that only affect which vocabulary was learned, not how text
+# is turned into terms
+_VOCABULARY_PARAMS = {"max_features", "max_df", "min_df", "vocabulary", "dtype"}
+
+
+def _analysis_params(vectorizer):
+    return {
+        key: value for key, value in vectorizer.get_params().items()
+        if key not in _VOCABULARY_PARAMS
+    }
+
+
+class _VocabularyView:
+    """One vectorizer's vocabulary + IDF weighting over shared term counts."""
+
+    def __init__(self, vectorizer):
+        self.vocabulary = vectorizer.vocabulary_
+        self.n_features = len(vectorizer.vocabulary_)
+        self.dtype = vectorizer.dtype
+        # binary=True: every term present counts once, as in CountVectorizer
+        self.binary = vectorizer.binary
+        self.tfidf = TfidfTransformer(
+            norm=vectorizer.norm,
+            use_idf=vectorizer.use_idf,
+            smooth_idf=vectorizer.smooth_idf,
+            sublinear_tf=vectorizer.sublinear_tf,
+        )
+        if vectorizer.use_idf:
+            self.tfidf.idf_ = vectorizer.idf_
+
+        # One row needs none of TfidfTransformer's input validation; the
+        # inline path repeats its arithmetic in the same order (sequential
+        # sum of squares, like sklearn's l2 row normalization)
+        self.inline = self.dtype == np.float64 and vectorizer.norm in (None, "l2")
+        self.sublinear_tf = vectorizer.sublinear_tf
+        self.norm = vectorizer.norm
+        self.idf = vectorizer.idf_ if vectorizer.use_idf else None
+
+    def transform(self, term_counts):
+        columns = []
+        values = []
+        for term, count in term_counts.items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                columns.append(column)
+                values.append(1 if self.binary else count)
+
+        order = np.argsort(columns, kind="stable")
+        values = np.asarray(values, dtype=self.dtype)[order]
+        columns = np.asarray(columns, dtype=np.int32)[order]
+        indptr = np.array([0, len(columns)], dtype=np.int32)
+
+        if not self.inline:
+            counts = sparse.csr_matrix((values, columns, indptr), shape=(1, self.n_features))
+            return self.tfidf.transform(counts, copy=False)
+
+        if self.sublinear_tf:
+            np.log(values, values)
+            values += 1.0
+        if self.idf is not None:
+            values *= self.idf[columns]
+        if self.norm == "l2":
+            total = 0.0
+            for value in values.tolist():
+                total += value * value
+            if total != 0.0:
+                values /= math.sqrt(total)
+
+        return sparse.csr_matrix((values, columns, indptr), shape=(1, self.n_features))
+
+    def transform_many(self, term_counts_list):
+        """
+        Rows for several resumes from one sparse build and one
+        TfidfTransformer call, as ``vectorizer.transform`` does it.
+        """
+        columns = []
+        values = []
+        indptr = [0]
+        for term_counts in term_counts_list:
+            for term, count in term_counts.items():
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    columns.append(column)
+                    values.append(1 if self.binary else count)
+            indptr.append(len(columns))
+
+        counts = sparse.csr_matrix(
+            (np.asarray(values, dtype=self.dtype),
+             np.asarray(columns, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(term_counts_list), self.n_features)
+        )
+        counts.sort_indices()
+        return self.tfidf.transform(counts, copy=False)
+
+
+def _lowercase(text):
+    # A ResumeDocument's lowercase view is computed once for all parsers
+    if isinstance(text, ResumeDocument):
+        return text.lower
+    return text.lower() if text else text
+
+
+class ResumeClassifier:
+    """
+    Domain + top-N job roles from one tokenization of the resume.
+
+    Falls back to two independent ``transform`` calls if the vectorizers
+    analyze text differently.
+    """
+
+    def __init__(self, domain_model, domain_vectorizer, job_model, job_vectorizer):
+        self.domain_model = domain_model
+        self.domain_vectorizer = domain_vectorizer
+        self.job_model = job_model
+        self.job_vectorizer = job_vectorizer
+
+        self.shared = _analysis_params(domain_vectorizer) == _analysis_params(job_vectorizer)
+        if self.shared:
+            self.analyzer = domain_vectorizer.build_analyzer()
+            self.domain_view = _VocabularyView(domain_vectorizer)
+            self.job_view = _VocabularyView(job_vectorizer)
+
+    def vectorize(self, text: str):
+        """
+        Returns:
+            (domain_vector, job_vector): 1-row sparse TF-IDF matrices
+        """
+        if not self.shared:
+            return (
+                self.domain_vectorizer.transform([text]),
+                self.job_vectorizer.transform([text]),
+            )
+
+        term_counts = self._term_counts(text)
+        return self.domain_view.transform(term_counts), self.job_view.transform(term_counts)
+
+    def vectorize_many(self, texts):
+        """
+        Returns:
+            (domain_matrix, job_matrix): sparse TF-IDF rows, one per text,
+            each matrix built in one go rather than stacked row by row
+        """
+        if not self.shared:
+            return self.domain_vectorizer.transform(texts), self.job_vectorizer.transform(texts)
+
+        term_counts = [self._term_counts(text) for text in texts]
+        return self.domain_view.transform_many(term_counts), self.job_view.transform_many(term_counts)
+
+    def _term_counts(self, text):
+        term_counts = {}
+        for term in self.analyzer(text):
+            term_counts[term] = term_counts.get(term, 0) + 1
+        return term_counts
+
+    def classify(self, text: str, top_n: int = 3):
+        """
+        Returns:
+            dict: {"domain": str, "job_roles": list[str]}
+        """
+        return self.classify_many([text], top_n=top_n)[0]
+
+    def classify_many(self, texts, top_n: int = 3):
+        """
+        Classify several resumes with one predict call per model.
+
+        Args:
+            texts (list[str | ResumeDocument]): resume texts
+            top_n (int | list[int]): roles to return, per text or for all
+
+        Returns:
+            list[dict]: one {"domain", "job_roles"} per text, in order
+        """
+        if isinstance(top_n, int):
+            top_n = [top_n] * len(texts)
+
+        texts = [_lowercase(text) for text in texts]
+        results = [{"domain": "Unknown", "job_roles": []} for _ in texts]
+        positions = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not positions:
+            return results
+
+        if len(positions) == 1:
+            # One row: the inline path skips TfidfTransformer's overhead
+            domain_matrix, job_matrix = self.vectorize(texts[positions[0]].strip())
+        else:
+            domain_matrix, job_matrix = self.vectorize_many([texts[i].strip() for i in positions])
+
+        domains = self.domain_model.predict(domain_matrix)
+
+        scores = self.job_model.decision_function(job_matrix)
+        binary = scores.ndim == 1
+
+        for row, (pos, domain) in enumerate(zip(positions, domains)):
+            if binary:
+                job_roles = [self.job_model.classes_[0]]
+            else:
+                indices = np.argsort(scores[row])[::-1][:top_n[pos]]
+                job_roles = [self.job_model.classes_[i] for i in indices]
+            results[pos] = {"domain": domain, "job_roles": job_roles}
+
+        return results
+
+
+model_registry.register(
+    "resume_classifier",
+    lambda reg: ResumeClassifier(
+        reg.get("domain_model"),
+        reg.get("domain_vectorizer"),
+        reg.get("job_role_model"),
+        reg.get("job_role_vectorizer"),
+    )
+)
+
+
+def _classify_batch(items):
+    texts, top_ns = zip(*items)
+    return model_registry.get("resume_classifier").classify_many(list(texts), list(top_ns))
+
+
+_batcher = register_batcher("resume_classifier", _classify_batch)
+
+
+def classify_resume(text: str, top_n: int = 3):
+    return _batcher.submit((text, top_n))
@@ -1,12 +1,11 @@
-from backend.app.ml_inference.model_loader import load_model
+from backend.app.ml_inference.model_loader import model_registry
+from backend.app.utils.resume_document import as_document
 
-_domain_model = load_model("domain_model.pkl")
-_domain_vectorizer = load_model("domain_vectorizer.pkl")
-
-def predict_domain(text: str) -> str:
-    if not text or not text.strip():
+def predict_domain(text) -> str:
+    document = as_document(text)
+    if document.is_blank:
         return "Unknown"
 
-    text = text.lower().strip()
-    vector = _domain_vectorizer.transform([text])
-    return _domain_model.predict(vector)[0]
+    text = document.lower.strip()
+    vector = model_registry.get("domain_vectorizer").transform([text])
+    return model_registry.get("domain_model").predict(vector)[0]
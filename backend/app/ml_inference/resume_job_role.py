@@ -1,19 +1,21 @@
 import numpy as np
-from backend.app.ml_inference.model_loader import load_model
+from backend.app.ml_inference.model_loader import model_registry
+from backend.app.utils.resume_document import as_document
 
-_job_model = load_model("job_role_model.pkl")
-_job_vectorizer = load_model("job_role_vectorizer.pkl")
-
-def predict_job_roles(text: str, top_n: int = 3):
-    if not text or not text.strip():
+def predict_job_roles(text, top_n: int = 3):
+    document = as_document(text)
+    if document.is_blank:
         return []
 
-    text = text.lower().strip()
-    vector = _job_vectorizer.transform([text])
-    scores = _job_model.decision_function(vector)
+    job_model = model_registry.get("job_role_model")
+    job_vectorizer = model_registry.get("job_role_vectorizer")
+
+    text = document.lower.strip()
+    vector = job_vectorizer.transform([text])
+    scores = job_model.decision_function(vector)
 
     if scores.ndim == 1:
-        return [_job_model.classes_[0]]
+        return [job_model.classes_[0]]
 
     indices = np.argsort(scores[0])[::-1][:top_n]
-    return [_job_model.classes_[i] for i in indices]
\ No newline at end of file
+    return [job_model.classes_[i] for i in indices]
\ No newline at end of file
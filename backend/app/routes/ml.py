@@ -1,25 +1,154 @@
-from flask import Blueprint, request, jsonify
-import pickle, os, joblib
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from functools import partial
+import hashlib, io, itertools, json, math, os, re, time
 import pandas as pd
 import numpy as np
+from backend.app.ml_inference.model_loader import MODEL_DIR, load_model, model_registry
+from backend.app.ml_inference.feature_rows import compile_pipeline
+from backend.app.ml_inference.course_neighbors import course_neighbor_files, load_course_neighbors
+from backend.app.ml_inference.course_search import CourseNameIndex
+from backend.app.ml_inference.compiled_forest import CompiledForest, compile_forest
+from backend.app.ml_inference.lru_cache import LRUCache
+from backend.app.ml_inference.prediction_memo import PredictionMemo
+from backend.app.ml_inference.micro_batcher import batching_stats, get_batcher, register_batcher
+from backend.app.utils.metrics import observe_batch, timed
 
 ml = Blueprint('ml', __name__, template_folder='templates', url_prefix='/ml')
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-MODEL_DIR = os.path.join(BASE_DIR, "../../ml/models")
 
+# -------------------------------------------------
+# DERIVED MODELS (loaded lazily through the registry)
+# -------------------------------------------------
 
+# DataFrame-free single-row builders (None -> fall back to DataFrame path)
+ROW_BUILDERS = {
+    "g1_model": "g1_rows",
+    "g2_model": "g2_rows",
+    "g3_model": "g3_rows",
+    "fake_review_model": "fake_review_rows",
+}
+
+for _model_name, _rows_name in ROW_BUILDERS.items():
+    model_registry.register(
+        _rows_name,
+        lambda reg, model_name=_model_name: compile_pipeline(reg.get(model_name))
+    )
+
+# Memory-mapped CSR neighbors when converted, else the legacy dense pickle;
+# versioned by (and reloaded when someone swaps) the files it reads
+_neighbor_files = course_neighbor_files(MODEL_DIR)
+model_registry.register(
+    "course_neighbors",
+    lambda _: load_course_neighbors(MODEL_DIR),
+    artifact=_neighbor_files[0],
+    watch=_neighbor_files[1:]
+)
+
+# Exact / prefix / trigram index over clean_name
+model_registry.register(
+    "course_index",
+    lambda reg: CourseNameIndex(reg.get("course_dataset")["clean_name"])
+)
+
+# Scaler + random forest flattened into arrays, evaluated in one pass
+def _load_stress_forest(reg):
+    forest, scaler = reg.get("stress_model"), reg.get("stress_scaler")
+    if isinstance(forest, CompiledForest):
+        # Array artifact: already flattened
+        return forest.with_scaler(scaler)
+    return compile_forest(forest, scaler=scaler)
+
+
+model_registry.register("stress_forest", _load_stress_forest)
+
+# sklearn's Cython tree walk overtakes the array forest (numpy gathers
+# per tree level over rows x trees) at a few hundred rows: batches that
+# large go to the sklearn forest, loaded from the pickle on the first
+# one when the array artifact serves everything else
+STRESS_SKLEARN_MIN_ROWS = int(os.getenv("STRESS_SKLEARN_MIN_ROWS", "384"))
+
+
+def _load_stress_sklearn_forest(reg):
+    forest = reg.get("stress_model")
+    if isinstance(forest, CompiledForest):
+        return load_model("stress_level_random_forest.pkl")
+    return forest
+
+
+model_registry.register(
+    "stress_sklearn_forest", _load_stress_sklearn_forest, artifact="stress_level_random_forest.pkl"
+)
+
+
+def _stress_predict_with_proba(X):
+    """(labels, probabilities) for rows of raw answers, from whichever forest is faster for len(X)."""
+    compiled = model_registry.get("stress_forest")
+    if len(X) < STRESS_SKLEARN_MIN_ROWS:
+        return compiled.predict_with_proba(X)
+
+    forest = model_registry.get("stress_sklearn_forest")
+    probabilities = forest.predict_proba(compiled.standardize(X))
+    return forest.classes_.take(np.argmax(probabilities, axis=1), axis=0), probabilities
+
+
+def _predict_rows(model_name, records, proba=False):
+    rows = model_registry.get(ROW_BUILDERS[model_name])
+    if rows is not None:
+        return rows.predict_proba_many(records) if proba else rows.predict_many(records)
 
+    model = model_registry.get(model_name)
+    df = pd.DataFrame(records)
+    return model.predict_proba(df) if proba else model.predict(df)
 
 
-with open(os.path.join(MODEL_DIR, "g1_model.pkl"), "rb") as f:
-    g1_model = pickle.load(f)
+def _predict_stress_rows(rows):
+    labels, probabilities = _stress_predict_with_proba(np.array(rows, dtype=np.float64))
+    return [(label.item(), tuple(proba.tolist())) for label, proba in zip(labels, probabilities)]
 
-with open(os.path.join(MODEL_DIR, "g2_model.pkl"), "rb") as f:
-    g2_model = pickle.load(f)
 
-with open(os.path.join(MODEL_DIR, "g3_model.pkl"), "rb") as f:
-    g3_model = pickle.load(f)
+# -------------------------------------------------
+# MICRO-BATCHERS (concurrent single-row requests share one predict call)
+# -------------------------------------------------
+
+for _model_name in ("g1_model", "g2_model", "g3_model"):
+    register_batcher(_model_name, partial(_predict_rows, _model_name))
+
+register_batcher("fake_review_model", partial(_predict_rows, "fake_review_model", proba=True))
+register_batcher("stress_forest", _predict_stress_rows)
+
+
+# -------------------------------------------------
+# MEMOIZATION (pure models: same features + model version -> same result)
+# -------------------------------------------------
+
+def _canonical_value(value):
+    # 3 and 3.0 reach the model as the same feature value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _canonical_record(model_name, record):
+    columns = model_registry.get(model_name).feature_names_in_
+    return [_canonical_value(record[column]) for column in columns]
+
+
+MEMOS = {
+    name: PredictionMemo(name, partial(_canonical_record, name))
+    for name in ("g1_model", "g2_model", "g3_model")
+}
+MEMOS["stress_forest"] = PredictionMemo(
+    "stress_forest", lambda features: [float(value) for value in features]
+)
+
+
+def _predict_one(model_name, record):
+    submit = get_batcher(model_name).submit
+    memo = MEMOS.get(model_name)
+    if memo is None:
+        return submit(record)
+    return memo.get_or_compute(record, submit)
+
 
 def stage_detect(data):
     if "G1" not in data:
@@ -28,56 +157,146 @@ def stage_detect(data):
         return 2
     return 3
 
+# stage -> (registry model name, derived_from, stage label)
+CGPA_STAGES = {
+    1: ("g1_model", "Predicted G1", "Stage 1 (Early)"),
+    2: ("g2_model", "Predicted G2", "Stage 2 (Mid)"),
+    3: ("g3_model", "Predicted G3", "Stage 3 (Final)"),
+}
+
+MAX_CGPA_BATCH_SIZE = 10000
+
+
+def _cgpa_record_error(model_name, record):
+    """Why ``model_name`` can't score ``record`` (None when it can)."""
+    rows = model_registry.get(ROW_BUILDERS[model_name])
+    try:
+        if rows is not None:
+            rows.validate(record)
+        else:
+            missing = [c for c in model_registry.get(model_name).feature_names_in_ if c not in record]
+            if missing:
+                raise KeyError(", ".join(missing))
+    except KeyError as e:
+        return f"Missing field: {str(e)}"
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+def _cgpa_result(stage, prediction):
+    _, derived_from, label = CGPA_STAGES[stage]
+
+    # G1/G2 are on a 0-20 scale, the G3 model already predicts CGPA
+    cgpa = prediction if stage == 3 else (prediction / 20.0) * 10.0
+    cgpa = max(0.0, min(cgpa, 10.0))
+
+    return {
+        "predicted_cgpa": round(float(cgpa), 2),
+        "derived_from": derived_from,
+        "stage": label
+    }
+
+
 @ml.route("/predict-cgpa", methods=["POST"])
 def predict_cgpa():
     data = request.json
-    df = pd.DataFrame([data])
 
     stage = stage_detect(data)
+    model_name = CGPA_STAGES[stage][0]
 
-    if stage == 1:
-        g1 = g1_model.predict(df)[0]
-        cgpa = (g1 / 20.0) * 10.0
-        cgpa = max(0.0, min(cgpa, 10.0))
+    try:
+        prediction = _predict_one(model_name, data)
+    except KeyError as e:
+        return jsonify({"error": f"Missing field: {str(e)}"}), 400
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-        return jsonify({
-            "predicted_cgpa": round(float(cgpa), 2),
-            "derived_from": "Predicted G1",
-            "stage": "Stage 1 (Early)"
-        })
+    return jsonify(_cgpa_result(stage, prediction))
 
-    if stage == 2:
-        g2 = g2_model.predict(df)[0]
-        cgpa = (g2 / 20.0) * 10.0
-        cgpa = max(0.0, min(cgpa, 10.0))
 
+@ml.route("/predict-cgpa/batch", methods=["POST"])
+def predict_cgpa_batch():
+    """
+    Score a whole cohort in one request.
+
+    Accepts either a JSON list of student records or
+    {"students": [...]}. Rows are grouped by stage so each
+    stage model runs once on its slice; results keep input order.
+    Records with a missing or non-numeric feature get a per-item
+    error and the rest are still scored.
+    """
+    data = request.get_json(silent=True)
+    students = data.get("students") if isinstance(data, dict) else data
+
+    if not isinstance(students, list) or not students:
         return jsonify({
-            "predicted_cgpa": round(float(cgpa), 2),
-            "derived_from": "Predicted G2",
-            "stage": "Stage 2 (Mid)"
-        })
+            "error": "Expected a non-empty list of student records"
+        }), 400
 
-    cgpa = g3_model.predict(df)[0]
-    cgpa = max(0.0, min(cgpa, 10.0))
+    if len(students) > MAX_CGPA_BATCH_SIZE:
+        return jsonify({
+            "error": f"Batch too large (max {MAX_CGPA_BATCH_SIZE} records)"
+        }), 413
+
+    if not all(isinstance(row, dict) for row in students):
+        return jsonify({"error": "Every student record must be an object"}), 400
+
+    start = time.perf_counter()
+
+    stages = np.fromiter(
+        (stage_detect(row) for row in students), dtype=np.int8, count=len(students)
+    )
+    results = [None] * len(students)
+
+    for stage, (model_name, _, _) in CGPA_STAGES.items():
+        positions = []
+        for pos in np.flatnonzero(stages == stage):
+            error = _cgpa_record_error(model_name, students[pos])
+            if error:
+                results[pos] = {"error": error}
+            else:
+                positions.append(pos)
+        if not positions:
+            continue
+
+        df = pd.DataFrame([students[i] for i in positions])
+        observe_batch(model_name, len(df))
+        try:
+            with timed("model", model_name):
+                predictions = model_registry.get(model_name).predict(df)
+        except (KeyError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+
+        for pos, prediction in zip(positions, predictions):
+            results[pos] = _cgpa_result(stage, prediction)
+
+    elapsed = time.perf_counter() - start
 
     return jsonify({
-        "predicted_cgpa": round(float(cgpa), 2),
-        "derived_from": "Predicted G3",
-        "stage": "Stage 3 (Final)"
+        "results": results,
+        "count": len(results),
+        "elapsed_ms": round(elapsed * 1000, 2),
+        "rows_per_second": round(len(results) / elapsed, 1) if elapsed > 0 else None
     })
 
 
 @ml.route("/predict-pass", methods=["POST"])
 def predict_pass():
     data = request.json
-    df = pd.DataFrame([data])
 
     if stage_detect(data) != 3:
         return jsonify({
             "error": "Pass/Fail prediction requires G1 and G2"
         }), 400
 
-    cgpa = g3_model.predict(df)[0]
+    try:
+        cgpa = _predict_one("g3_model", data)
+    except KeyError as e:
+        return jsonify({"error": f"Missing field: {str(e)}"}), 400
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     cgpa = max(0.0, min(cgpa, 10.0))
 
     return jsonify({
@@ -88,87 +307,207 @@ def predict_pass():
 
 
 
-fake_review_pipeline = joblib.load(
-    os.path.join(MODEL_DIR, "fake_review_hybrid_model.pkl")
-)
+# -------------------------------------------------
+# FAKE REVIEW DETECTION
+# -------------------------------------------------
 
-@ml.route("/predict-fake-review", methods=["POST"])
-def predict_fake_review():
-    data = request.json
+FAKE_REVIEW_THRESHOLD = 0.70
+MAX_FAKE_REVIEW_BATCH_SIZE = 5000
+
+# Probabilities of recently seen reviews, keyed by fake_review_key()
+fake_review_cache = LRUCache(int(os.getenv("FAKE_REVIEW_CACHE_SIZE", "10000")))
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fake_review_key(record):
+    """
+    The TF-IDF step lowercases and tokenizes on word characters, so
+    case and whitespace runs don't change the prediction; category is
+    one-hot encoded and keeps its case. The model version is part of the
+    key, so a retrained model never serves cached probabilities.
+    """
+    text = _WHITESPACE.sub(" ", str(record["clean_text"]).lower()).strip()
+    raw = json.dumps(
+        [model_registry.version("fake_review_model"), text, record["rating"], record["category"]],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+
+def _fake_review_record(data):
+    """
+    Returns:
+        (record, error): model input row, or an error message
+    """
     review_text = data.get("review", "")
     rating = data.get("rating", None)
     category = data.get("category", "")
 
     if not review_text or rating is None or not category:
-        return jsonify({
-            "error": "Required fields: review, rating, category"
-        }), 400
+        return None, "Required fields: review, rating, category"
 
-    input_df = pd.DataFrame([{
+    # The model reads rating as a number; coercing here gives bad values
+    # a per-review error and lets "5" and 5 share a cache entry
+    try:
+        if isinstance(rating, bool):
+            raise ValueError
+        rating = float(rating)
+    except (TypeError, ValueError):
+        return None, f"Field 'rating' must be numeric, got {rating!r}"
+    if not math.isfinite(rating):
+        return None, f"Field 'rating' must be finite, got {rating!r}"
+
+    return {
         "clean_text": review_text,
         "rating": rating,
         "category": category
-    }])
+    }, None
 
-    proba = fake_review_pipeline.predict_proba(input_df)[0]
+
+def _fake_review_verdict(proba):
     confidence = float(max(proba))
     pred = int(proba[1] >= 0.5)
 
-    threshold = 0.70
-
-    if confidence < threshold:
-        return jsonify({
+    if confidence < FAKE_REVIEW_THRESHOLD:
+        return {
             "is_fake": 1,
             "is_truthful": 0,
             "label": "deceptive",
             "confidence": confidence,
             "note": "Low probability → treated as fake"
-        })
+        }
 
-    return jsonify({
+    return {
         "is_fake": int(pred == 0),
         "is_truthful": int(pred == 1),
         "label": "deceptive" if pred == 0 else "truthful",
         "confidence": confidence
-    })
+    }
 
 
+@ml.route("/predict-fake-review", methods=["POST"])
+def predict_fake_review():
+    data = request.json
 
+    record, error = _fake_review_record(data)
+    if error:
+        return jsonify({"error": error}), 400
 
-with open(os.path.join(MODEL_DIR, "course_recommender_tfidf.pkl"), "rb") as f:
-    course_tfidf = pickle.load(f)
+    key = fake_review_key(record)
+    proba = fake_review_cache.get(key)
 
-with open(os.path.join(MODEL_DIR, "course_similarity_matrix.pkl"), "rb") as f:
-    course_sim_matrix = pickle.load(f)
+    if proba is None:
+        try:
+            proba = _predict_one("fake_review_model", record)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        fake_review_cache.put(key, tuple(float(p) for p in proba))
 
-df_courses = pd.read_pickle(
-    os.path.join(MODEL_DIR, "course_recommender_dataset.pkl")
-)
+    return jsonify(_fake_review_verdict(proba))
 
-def get_course_recommendations(course_name, top_n=5):
-    course_name = course_name.lower()
 
-    # Match user input with dataset
-    matches = df_courses[df_courses["clean_name"].str.contains(course_name, case=False, na=False)]
+@ml.route("/predict-fake-review/batch", methods=["POST"])
+def predict_fake_review_batch():
+    """
+    Moderate a backlog of reviews in one request.
+
+    Accepts a JSON list of {review, rating, category} objects or
+    {"reviews": [...]}. Cached reviews are answered directly; the
+    remaining unique reviews are scored with one pipeline call.
+    Invalid entries get a per-item error; results keep input order.
+    """
+    data = request.get_json(silent=True)
+    reviews = data.get("reviews") if isinstance(data, dict) else data
+
+    if not isinstance(reviews, list) or not reviews:
+        return jsonify({"error": "Expected a non-empty list of reviews"}), 400
+
+    if len(reviews) > MAX_FAKE_REVIEW_BATCH_SIZE:
+        return jsonify({
+            "error": f"Batch too large (max {MAX_FAKE_REVIEW_BATCH_SIZE} reviews)"
+        }), 413
+
+    start = time.perf_counter()
+    results = [None] * len(reviews)
+    pending = {}            # key -> (record, [positions])
+    cache_hits = 0
+
+    for pos, item in enumerate(reviews):
+        if not isinstance(item, dict):
+            results[pos] = {"error": "Every review must be an object"}
+            continue
+
+        record, error = _fake_review_record(item)
+        if error:
+            results[pos] = {"error": error}
+            continue
+
+        key = fake_review_key(record)
+        if key in pending:
+            pending[key][1].append(pos)
+            continue
+
+        proba = fake_review_cache.get(key)
+        if proba is not None:
+            cache_hits += 1
+            results[pos] = _fake_review_verdict(proba)
+        else:
+            pending[key] = (record, [pos])
+
+    if pending:
+        pipeline = model_registry.get("fake_review_model")
+        observe_batch("fake_review_model", len(pending))
+        try:
+            with timed("model", "fake_review_model"):
+                probas = pipeline.predict_proba(
+                    pd.DataFrame([record for record, _ in pending.values()])
+                )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        for (key, (_, positions)), proba in zip(pending.items(), probas):
+            proba = tuple(float(p) for p in proba)
+            fake_review_cache.put(key, proba)
+            verdict = _fake_review_verdict(proba)
+            for pos in positions:
+                results[pos] = verdict
+
+    elapsed = time.perf_counter() - start
+
+    return jsonify({
+        "results": results,
+        "count": len(results),
+        "scored": len(pending),
+        "cache_hits": cache_hits,
+        "elapsed_ms": round(elapsed * 1000, 2)
+    })
+
 
-    if len(matches) == 0:
-        return None  # no match found
+@ml.route("/predict-fake-review/cache", methods=["GET"])
+def fake_review_cache_stats():
+    # Counters are per worker process
+    return jsonify({"pid": os.getpid(), **fake_review_cache.stats()})
 
-    idx = matches.index[0]
 
-    # Get similarity scores
-    sim_scores = list(enumerate(course_sim_matrix[idx]))
-    sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
 
-    # Top-N (skip itself)
-    sim_scores = sim_scores[1 : top_n + 1]
 
-    recommended_indices = [i[0] for i in sim_scores]
+COURSE_COLUMNS = ["Course Name", "University", "Difficulty Level", "Course Rating", "Skills"]
 
-    return df_courses.iloc[recommended_indices][
-        ["Course Name", "University", "Difficulty Level", "Course Rating", "Skills"]
-    ]
+
+def get_course_recommendations(course_name, top_n=5):
+    with timed("model", "course_recommender"):
+        # Best ranked match for the user input (exact > prefix > substring > fuzzy)
+        idx = model_registry.get("course_index").best_match(course_name)
+
+        if idx is None:
+            return None  # no match found
+
+        # Top-N most similar courses (itself excluded) from the neighbor table
+        recommended_indices = model_registry.get("course_neighbors").top_n(idx, top_n)
+
+    df_courses = model_registry.get("course_dataset")
+    return df_courses.iloc[recommended_indices][COURSE_COLUMNS]
 
 @ml.route("/recommend-courses", methods=["POST"])
 def recommend_courses_api():
@@ -180,6 +519,11 @@ def recommend_courses_api():
     if not course_name:
         return jsonify({"error": "Missing 'course_name' field"}), 400
 
+    try:
+        top_n = int(top_n)
+    except (TypeError, ValueError):
+        return jsonify({"error": "'top_n' must be an integer"}), 400
+
     recommendations = get_course_recommendations(course_name, top_n)
 
     if recommendations is None:
@@ -191,14 +535,33 @@ def recommend_courses_api():
     })
 
 
+MAX_AUTOCOMPLETE_LIMIT = 25
+
+@ml.route("/courses/autocomplete", methods=["GET"])
+def course_autocomplete():
+    query = request.args.get("q", "")
+    limit = request.args.get("limit", 8, type=int)
+    limit = max(1, min(limit, MAX_AUTOCOMPLETE_LIMIT))
+
+    if not query.strip():
+        return jsonify({"query": query, "suggestions": []})
+
+    matches = model_registry.get("course_index").search(query, limit=limit)
+    rows = model_registry.get("course_dataset").iloc[[position for position, _ in matches]]
+
+    return jsonify({
+        "query": query,
+        "suggestions": [
+            {
+                "course_name": row["Course Name"],
+                "university": row["University"],
+                "score": score
+            }
+            for (_, score), (_, row) in zip(matches, rows.iterrows())
+        ]
+    })
 
-rf_model = joblib.load(
-    os.path.join(MODEL_DIR, "stress_level_random_forest.pkl")
-)
 
-scaler = joblib.load(
-    os.path.join(MODEL_DIR, "stress_level_scaler.pkl")
-)
 
 # Stress level mapping
 stress_map = {
@@ -207,6 +570,47 @@ stress_map = {
     2: "High"
 }
 
+# Expected 20 features in correct order
+STRESS_FEATURES = [
+    "anxiety_level",
+    "self_esteem",
+    "mental_health_history",
+    "depression",
+    "headache",
+    "blood_pressure",
+    "sleep_quality",
+    "breathing_problem",
+    "noise_level",
+    "living_conditions",
+    "basic_needs",
+    "academic_performance",
+    "study_load",
+    "teacher_student_relationship",
+    "future_career_concerns",
+    "social_support",
+    "peer_pressure",
+    "extracurricular_activities",
+    "bullying",
+    "confidence_level"  # replace if different column
+]
+
+# Rows validated and scored per vectorized step in bulk requests
+STRESS_BATCH_CHUNK = 1000
+MAX_STRESS_JSON_ROWS = 10000
+
+
+def _stress_result(prediction, probabilities):
+    return {
+        "stress_level_numeric": int(prediction),
+        "stress_level": stress_map[prediction],
+        "confidence_scores": {
+            "Low": round(float(probabilities[0]), 3),
+            "Medium": round(float(probabilities[1]), 3),
+            "High": round(float(probabilities[2]), 3)
+        }
+    }
+
+
 @ml.route("/api/predict-stress", methods=["POST"])
 def predict_stress():
     try:
@@ -215,52 +619,163 @@ def predict_stress():
         if not data:
             return jsonify({"error": "No input data provided"}), 400
 
-        # Expected 20 features in correct order
-        features = [
-            data["anxiety_level"],
-            data["self_esteem"],
-            data["mental_health_history"],
-            data["depression"],
-            data["headache"],
-            data["blood_pressure"],
-            data["sleep_quality"],
-            data["breathing_problem"],
-            data["noise_level"],
-            data["living_conditions"],
-            data["basic_needs"],
-            data["academic_performance"],
-            data["study_load"],
-            data["teacher_student_relationship"],
-            data["future_career_concerns"],
-            data["social_support"],
-            data["peer_pressure"],
-            data["extracurricular_activities"],
-            data["bullying"],
-            data["confidence_level"]  # replace if different column
-        ]
-
-        # Convert to array
-        X = np.array(features).reshape(1, -1)
+        features = [data[name] for name in STRESS_FEATURES]
 
-        # Scale
-        X_scaled = scaler.transform(X)
+        # Scale + predict class and probabilities in one pass
+        label, probabilities = _predict_one("stress_forest", features)
 
-        # Predict
-        prediction = rf_model.predict(X_scaled)[0]
-        probabilities = rf_model.predict_proba(X_scaled)[0]
-
-        return jsonify({
-            "stress_level_numeric": int(prediction),
-            "stress_level": stress_map[prediction],
-            "confidence_scores": {
-                "Low": round(float(probabilities[0]), 3),
-                "Medium": round(float(probabilities[1]), 3),
-                "High": round(float(probabilities[2]), 3)
-            }
-        })
+        return jsonify(_stress_result(label, probabilities))
 
     except KeyError as e:
         return jsonify({"error": f"Missing field: {str(e)}"}), 400
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
+
+
+def _score_stress_chunk(frame, first_row):
+    """
+    Validate and score one chunk of questionnaire rows.
+
+    Missing / non-numeric cells are found column-wise in one step; the
+    valid rows are scaled and predicted with a single forest call.
+    """
+    X = frame.reindex(columns=STRESS_FEATURES).apply(pd.to_numeric, errors="coerce")
+    invalid = X.isna().to_numpy()
+    valid_rows = ~invalid.any(axis=1)
+
+    results = [None] * len(X)
+
+    if valid_rows.any():
+        observe_batch("stress_forest", int(valid_rows.sum()))
+        with timed("model", "stress_forest"):
+            labels, probabilities = _stress_predict_with_proba(
+                X.to_numpy(dtype=np.float64)[valid_rows]
+            )
+        for pos, label, proba in zip(np.flatnonzero(valid_rows), labels, probabilities):
+            results[pos] = {"row": first_row + int(pos), **_stress_result(label, proba)}
+
+    for pos in np.flatnonzero(~valid_rows):
+        fields = [STRESS_FEATURES[j] for j in np.flatnonzero(invalid[pos])]
+        results[pos] = {
+            "row": first_row + int(pos),
+            "error": f"Missing or non-numeric field(s): {', '.join(fields)}"
+        }
+
+    return results
+
+
+def _closing(chunks, stream):
+    try:
+        yield from chunks
+    finally:
+        stream.close()
+
+
+def _stream_stress_results(chunks):
+    start = time.perf_counter()
+    rows = errors = 0
+
+    try:
+        for frame in chunks:
+            for result in _score_stress_chunk(frame, rows):
+                errors += "error" in result
+                yield json.dumps(result) + "\n"
+            rows += len(frame)
+    except (ValueError, pd.errors.ParserError) as e:
+        yield json.dumps({"row": rows, "error": f"Could not parse input: {e}"}) + "\n"
+        errors += 1
+
+    yield json.dumps({
+        "summary": {
+            "rows": rows,
+            "errors": errors,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+    }) + "\n"
+
+
+@ml.route("/api/predict-stress/batch", methods=["POST"])
+def predict_stress_batch():
+    """
+    Bulk stress scoring for a whole class.
+
+    Accepts a JSON array of questionnaire responses (or {"responses": [...]}),
+    a CSV upload in the "file" field, or a raw text/csv body. CSV input is
+    read in chunks of STRESS_BATCH_CHUNK rows, so large uploads are never
+    held in memory at once. Results stream back as NDJSON, one line per
+    row in input order, followed by a summary line.
+    """
+    upload = request.files.get("file")
+
+    if upload is not None or request.mimetype == "text/csv":
+        if upload is not None:
+            # Flask closes request files as soon as the view returns, before
+            # the streamed response is consumed, so take the (spooled) file over
+            stream = upload.stream
+            upload.stream = io.BytesIO()
+        else:
+            stream = request.stream
+
+        try:
+            reader = pd.read_csv(stream, chunksize=STRESS_BATCH_CHUNK)
+            first = next(reader, None)
+        except (ValueError, pd.errors.ParserError) as e:
+            stream.close()
+            return jsonify({"error": f"Could not parse CSV: {e}"}), 400
+
+        missing = [] if first is None else [
+            name for name in STRESS_FEATURES if name not in first.columns
+        ]
+        if first is None or missing:
+            stream.close()
+            error = f"Missing column(s): {', '.join(missing)}" if missing else "CSV has no rows"
+            return jsonify({"error": error}), 400
+
+        chunks = _closing(itertools.chain([first], reader), stream)
+
+    else:
+        data = request.get_json(silent=True)
+        responses = data.get("responses") if isinstance(data, dict) else data
+
+        if not isinstance(responses, list) or not responses:
+            return jsonify({
+                "error": "Expected a JSON array of responses or a CSV file"
+            }), 400
+
+        if len(responses) > MAX_STRESS_JSON_ROWS:
+            return jsonify({
+                "error": f"Too many rows for JSON (max {MAX_STRESS_JSON_ROWS}); upload a CSV instead"
+            }), 413
+
+        if not all(isinstance(row, dict) for row in responses):
+            return jsonify({"error": "Every response must be an object"}), 400
+
+        chunks = (
+            pd.DataFrame(responses[i:i + STRESS_BATCH_CHUNK])
+            for i in range(0, len(responses), STRESS_BATCH_CHUNK)
+        )
+
+    return Response(
+        stream_with_context(_stream_stress_results(chunks)),
+        mimetype="application/x-ndjson"
+    )
+
+
+@ml.route("/models/stats", methods=["GET"])
+def model_stats():
+    return jsonify(model_registry.stats())
+
+
+@ml.route("/batching/stats", methods=["GET"])
+def micro_batching_stats():
+    # Batch-size distribution and queueing delay, per worker process
+    return jsonify({"pid": os.getpid(), "batchers": batching_stats()})
+
+
+@ml.route("/memo/stats", methods=["GET"])
+def memo_stats():
+    return jsonify({
+        "pid": os.getpid(),
+        "memos": {name: memo.stats() for name, memo in MEMOS.items()}
+    })
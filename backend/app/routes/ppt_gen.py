@@ -8,6 +8,8 @@ from flask import Blueprint, request, jsonify, send_file, current_app
 from pptx import Presentation
 from pptx.util import Pt, Inches
 
+from backend.app.utils.metrics import timed
+
 # load environment variables earlier in your app (e.g. with python-dotenv)
 ppt_bp = Blueprint("pptgen", __name__, url_prefix="/ppt")
 
@@ -38,9 +40,10 @@ def call_openrouter(openrouter_key, model, messages, timeout=PROMPT_TIMEOUT):
         "X-Title": "Mentora PPT Generator",
     }
     payload = {"model": model, "messages": messages}
-    resp = requests.post(url, headers=headers, json=payload, timeout=timeout)
-    resp.raise_for_status()
-    return resp.json()
+    with timed("llm", f"openrouter/{model}"):
+        resp = requests.post(url, headers=headers, json=payload, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
 
 def call_groq(groq_key, model, messages, timeout=PROMPT_TIMEOUT):
     url = "https://api.groq.com/openai/v1/chat/completions"
@@ -49,9 +52,10 @@ def call_groq(groq_key, model, messages, timeout=PROMPT_TIMEOUT):
         "Content-Type": "application/json",
     }
     payload = {"model": model, "messages": messages}
-    resp = requests.post(url, headers=headers, json=payload, timeout=timeout)
-    resp.raise_for_status()
-    return resp.json()
+    with timed("llm", f"groq/{model}"):
+        resp = requests.post(url, headers=headers, json=payload, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
 
 def call_model_with_fallback(openrouter_key, groq_key, prefer_openrouter_model, prefer_groq_models, messages):
     # 1) try openrouter
@@ -1,24 +1,46 @@
-from flask import Blueprint, json, request, jsonify, render_template, redirect, url_for,send_file,session
+from flask import Blueprint, json, request, jsonify, render_template, redirect, url_for,send_file,session,Response,make_response
 from dotenv import load_dotenv
 from openai import OpenAI
+import io
 import os
 import requests
 import markdown
-import tempfile
 import os
-import tempfile
 import redis
 import hashlib
+import logging
+import threading
+import zipfile
+from celery import chain
 from backend.app.utils.resume_parser import extract_text
-from backend.app.utils.skill_extractor import extract_skills
-from backend.app.utils.experience_parser import extract_experience
-from backend.app.utils.academic_parser import extract_academics
-from backend.app.scoring.ats_scorer import calculate_ats_score
-from backend.app.llm.resume_summary import generate_resume_summary
-from backend.app.llm.skill_level_inferencer import infer_skill_levels
-from backend.app.ml_inference.resume_domain import predict_domain
-from backend.app.ml_inference.resume_job_role import predict_job_roles
-from backend.app.async_celery.tasks import fetch_and_cache_jobs, job_cache_key
+from backend.app.utils.resume_cache import file_digest
+from backend.app.utils.bulk_ingest import (
+    CONTENT_TYPES,
+    OUTPUT_FORMATS,
+    BulkIngestError,
+    ingest,
+    write_rows,
+    zip_resumes,
+)
+from backend.app.utils.resume_pipeline import (
+    analyze_text,
+    cached_analysis,
+    cached_enrichment,
+    create_job,
+    enrich,
+    get_job,
+    unavailable_enrichment,
+    update_job,
+)
+from backend.app.async_celery.tasks import (
+    job_cache_key,
+    resume_analyze_stage,
+    resume_enrich_stage,
+    resume_extract_stage,
+    schedule_job_fetch,
+)
+from backend.app.utils.metrics import record_error, timed
+from werkzeug.exceptions import RequestEntityTooLarge
 
 
 from pptx import Presentation
@@ -27,6 +49,8 @@ from pptx.util import Pt, Inches
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 user = Blueprint('user', __name__, template_folder='templates', url_prefix='/user')
 
 @user.route('/profile', methods=['GET'])
@@ -112,22 +136,23 @@ def chat():
     ]
 
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {openrouter_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "http://localhost",
-                "X-Title": "My Flask App",
-            },
-            json={
-                "model": "openai/gpt-oss-120b:free",
-                "messages": formatted_messages
-            },
-            timeout=12
-        )
+        with timed("llm", "openrouter/openai/gpt-oss-120b:free"):
+            response = requests.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {openrouter_key}",
+                    "Content-Type": "application/json",
+                    "HTTP-Referer": "http://localhost",
+                    "X-Title": "My Flask App",
+                },
+                json={
+                    "model": "openai/gpt-oss-120b:free",
+                    "messages": formatted_messages
+                },
+                timeout=12
+            )
 
-        data = response.json()
+            data = response.json()
 
         if "error" in data:
             raise Exception(f"OpenRouter error: {data['error']}")
@@ -141,7 +166,7 @@ def chat():
         return jsonify(data)
 
     except Exception as e:
-        print("OpenRouter failed → Switching to GROQ:", e)
+        logger.warning("OpenRouter failed, switching to GROQ: %s", e)
 
     groq_models = [
         "llama-3.3-70b-versatile",
@@ -151,26 +176,27 @@ def chat():
 
     for model in groq_models:
         try:
-            print(f"Trying GROQ model: {model}")
-
-            groq_response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {groq_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": model,
-                    "messages": formatted_messages
-                },
-                timeout=12
-            )
-
-            data = groq_response.json()
-            print("GROQ RESPONSE:", data)
+            logger.debug("Trying GROQ model: %s", model)
+
+            with timed("llm", f"groq/{model}"):
+                groq_response = requests.post(
+                    "https://api.groq.com/openai/v1/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {groq_key}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "model": model,
+                        "messages": formatted_messages
+                    },
+                    timeout=12
+                )
+
+                data = groq_response.json()
 
             if "error" in data or "choices" not in data:
-                print(f"Model {model} failed → trying next model...\n")
+                record_error("llm", f"groq/{model}", "no_choices")
+                logger.warning("GROQ model %s failed, trying next model: %s", model, data.get("error"))
                 continue
 
             raw_text = data["choices"][0]["message"]["content"]
@@ -182,7 +208,7 @@ def chat():
             return jsonify(data)
 
         except Exception as e:
-            print(f"GROQ model {model} crashed → {e}")
+            logger.warning("GROQ model %s crashed: %s", model, e)
 
     return jsonify({
         "error": "All models failed (OpenRouter + Groq models)",
@@ -275,88 +301,201 @@ def submit_exam():
     active_submenu="exam"
     )
 
-@user.route("/api/resume/analyze", methods=["POST"])
-def analyze_resume():
-    if "file" not in request.files:
-        return jsonify({"error": "Resume file is required"}), 400
+# Uploads over this size are refused before the body is read
+RESUME_MAX_UPLOAD_BYTES = int(os.getenv("RESUME_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
 
-    file = request.files["file"]
-    if file.filename == "":
-        return jsonify({"error": "No file selected"}), 400
 
-    _, ext = os.path.splitext(file.filename)
+def _upload_too_large(max_bytes=RESUME_MAX_UPLOAD_BYTES):
+    return jsonify({"error": f"Resume file too large (max {max_bytes} bytes)"}), 413
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-        file.save(tmp.name)
-        temp_path = tmp.name
+
+def _resume_upload(max_bytes=RESUME_MAX_UPLOAD_BYTES):
+    """
+    Returns:
+        tuple: (FileStorage, None), or (None, error response) for a
+        missing or oversized upload
+    """
+    # Checked against Content-Length up front and while the multipart
+    # body is parsed (chunked uploads have no Content-Length)
+    if (request.content_length or 0) > max_bytes:
+        return None, _upload_too_large(max_bytes)
+    request.max_content_length = max_bytes
 
     try:
-        # -------- 1. Resume parsing --------
-        resume_text = extract_text(temp_path)
+        files = request.files
+    except RequestEntityTooLarge:
+        return None, _upload_too_large(max_bytes)
 
-        skills = extract_skills(resume_text)
-        experience = extract_experience(resume_text)
-        academics = extract_academics(resume_text)
+    if "file" not in files:
+        return None, (jsonify({"error": "Resume file is required"}), 400)
 
-        domain = predict_domain(resume_text)
-        job_roles = predict_job_roles(resume_text)
+    file = files["file"]
+    if file.filename == "":
+        return None, (jsonify({"error": "No file selected"}), 400)
 
-        ats_result = calculate_ats_score(
-            skills=skills,
-            experience=experience,
-            academics=academics,
-            domain=domain
-        )
+    return file, None
 
-        response = {
-            "domain": domain,
-            "job_roles": job_roles,
-            "skills": skills,
-            "experience": experience,
-            "academics": academics,
-            "ats_score": ats_result["ats_score"],
-            "score_breakdown": ats_result["breakdown"]
-        }
-
-        # -------- 2. LLM enrichment (SAFE) --------
-        try:
-            llm_context = {
-                "domain": domain,
-                "job_roles": job_roles,
-                "skills": skills,
-                "experience": experience,
-                "academics": academics,
-                "ats_score": ats_result["ats_score"]
-            }
-            response["summary"] = generate_resume_summary(llm_context)
-            response["skill_levels"] = infer_skill_levels(resume_text, skills)
-        except Exception:
-            response["summary"] = None
-            response["skill_levels"] = {}
 
-        # -------- 3. Background job fetching --------
-        cache_key = job_cache_key(job_roles, "india")
-
-        # Prevent duplicate Celery jobs
-        status = redis_client.get(cache_key + ":status")
-        if not status:
-            redis_client.setex(
-                cache_key + ":status",
-                JOB_CACHE_TTL,
-                "pending"
-            )
-            fetch_and_cache_jobs.delay(job_roles, "india")
+@user.route("/api/resume/analyze", methods=["POST"])
+def analyze_resume():
+    file, error = _resume_upload()
+    if error:
+        return error
+
+    try:
+        # Same bytes + same pipeline version -> same results
+        digest = file_digest(file.stream)
+        resume_text = None
+
+        # -------- 1. Resume parsing (cached) --------
+        response = cached_analysis(digest)
+        if response is None:
+            # Parsed straight from the upload stream, no temp file copy
+            resume_text = extract_text(file.stream, filename=file.filename)
+            response = analyze_text(resume_text, digest)
+
+        # -------- 2. LLM enrichment (concurrent, deadline-bound, cached separately) --------
+        enrichment = cached_enrichment(digest)
+        if enrichment is None:
+            try:
+                if resume_text is None:
+                    # Analysis was cached but the enrichment expired
+                    resume_text = extract_text(file.stream, filename=file.filename)
+                enrichment = enrich(response, resume_text, digest)
+            except Exception:
+                enrichment = unavailable_enrichment()
+        response.update(enrichment)
 
-        response["jobs_cache_key"] = cache_key
+        # -------- 3. Background job fetching --------
+        response["jobs_cache_key"] = schedule_job_fetch(response["job_roles"], "india")
 
         return jsonify(response), 200
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+
+# -------------------------------------------------
+# ASYNC RESUME ANALYSIS (submit / poll)
+# -------------------------------------------------
+# The upload is stored and handed to a Celery chain (extract -> analyze
+# -> enrich); the request itself only reads, hashes and enqueues it.
+# Clients poll /api/resume/jobs/<id>: a long-lived stream would hold one
+# of the few gthread worker threads for the whole analysis.
+
+
+@user.route("/api/resume/jobs", methods=["POST"])
+def submit_resume_job():
+    file, error = _resume_upload()
+    if error:
+        return error
+
+    data = file.read()
+    digest = file_digest(data)
+
+    analysis = cached_analysis(digest)
+    enrichment = cached_enrichment(digest) if analysis is not None else None
+
+    if analysis is not None and enrichment is not None:
+        # Fully cached: finished before it is returned
+        job_id = create_job(file.filename, digest)
+        update_job(job_id, "done", "enrich", analysis=analysis, enrichment=enrichment,
+                   jobs_cache_key=schedule_job_fetch(analysis["job_roles"], "india"))
+    else:
+        job_id = create_job(file.filename, digest, data)
+        try:
+            chain(
+                resume_extract_stage.s(job_id, file.filename),
+                resume_analyze_stage.s(job_id, digest),
+                resume_enrich_stage.s(job_id, digest),
+            ).apply_async()
+        except Exception as e:
+            # Broker down: don't leave a job queued forever
+            record_error("celery", "resume_job", type(e).__name__)
+            logger.error("Could not queue resume job %s: %s", job_id, e)
+            update_job(job_id, "failed", "queued", error="Could not queue the analysis")
+            return jsonify({"error": "Resume analysis is temporarily unavailable, please retry"}), 503
+
+    return jsonify({
+        "job_id": job_id,
+        "status_url": url_for("user.resume_job_status", job_id=job_id),
+    }), 202
+
+
+@user.route("/api/resume/jobs/<job_id>", methods=["GET"])
+def resume_job_status(job_id):
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired resume job"}), 404
+    return jsonify(job), 200
+
+
+# -------------------------------------------------
+# BULK RESUME ANALYSIS (placement cells)
+# -------------------------------------------------
+# A ZIP of resumes in, one result row per resume streamed back as NDJSON
+# (default) or CSV as soon as it is analyzed; ?llm=1 adds rate-limited
+# LLM enrichment. See utils/bulk_ingest.py (also usable as a CLI).
+#
+# A bulk request keeps its worker thread busy for minutes. Inside a web
+# worker it is analyzed inline by default (BULK_WEB_WORKERS=1; more
+# starts that many processes per request), and at most
+# BULK_WEB_CONCURRENCY run at once per worker process; others get a 429.
+# Large cohorts belong on the CLI, which uses a process per CPU.
+
+BULK_MAX_UPLOAD_BYTES = int(os.getenv("BULK_MAX_UPLOAD_BYTES", str(500 * 1024 * 1024)))
+BULK_WEB_WORKERS = int(os.getenv("BULK_WEB_WORKERS", "1"))
+BULK_WEB_CONCURRENCY = int(os.getenv("BULK_WEB_CONCURRENCY", "1"))
+
+_bulk_slots = threading.BoundedSemaphore(BULK_WEB_CONCURRENCY)
+
+
+@user.route("/api/resume/bulk", methods=["POST"])
+def bulk_analyze_resumes():
+    output_format = request.args.get("format", "ndjson")
+    if output_format not in OUTPUT_FORMATS:
+        return jsonify({"error": f"Unsupported format. Supported formats: {OUTPUT_FORMATS}"}), 400
+    llm = request.args.get("llm", "").lower() in ("1", "true", "yes")
+
+    if not _bulk_slots.acquire(blocking=False):
+        return jsonify({"error": "Another bulk analysis is running, please retry later"}), 429, {"Retry-After": "60"}
+    try:
+        response = make_response(_bulk_analysis(output_format, llm))
+    except BaseException:
+        _bulk_slots.release()
+        raise
+    # Held until the last row is sent (or the client goes away)
+    response.call_on_close(_bulk_slots.release)
+    return response
+
+
+def _bulk_analysis(output_format, llm):
+    file, error = _resume_upload(BULK_MAX_UPLOAD_BYTES)
+    if error:
+        return error
+    if not file.filename.lower().endswith(".zip"):
+        return jsonify({"error": "Bulk upload must be a .zip archive of PDF / DOCX resumes"}), 400
+
+    # Request teardown closes uploaded files before the response body is
+    # streamed: take over the (spooled) upload stream instead of copying it
+    archive_file, file.stream = file.stream, io.BytesIO()
+    try:
+        resumes = zip_resumes(archive_file)
+    except (BulkIngestError, zipfile.BadZipFile) as e:
+        archive_file.close()
+        return jsonify({"error": str(e)}), 400
+
+    response = Response(
+        write_rows(ingest(resumes, workers=BULK_WEB_WORKERS, llm=llm), output_format),
+        mimetype=CONTENT_TYPES[output_format],
+        headers={
+            "Content-Disposition": f"attachment; filename=resume_analysis.{output_format}",
+            "X-Accel-Buffering": "no",
+        },
+    )
+    response.call_on_close(archive_file.close)
+    return response
+
 
 redis_client = redis.Redis(
     host="localhost",
@@ -1,5 +1,7 @@
 # backend/app/scoring/ats_scorer.py
 
+from backend.app.utils.metrics import instrument
+
 # -------------------------------------------------
 # ATS WEIGHT CONFIGURATION
 # -------------------------------------------------
@@ -80,6 +82,7 @@ def _score_domain(domain: str) -> int:
 # FINAL ATS SCORE FUNCTION
 # -------------------------------------------------
 
+@instrument("scorer")
 def calculate_ats_score(
     skills: list,
     experience: dict,
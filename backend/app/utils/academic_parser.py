@@ -1,4 +1,8 @@
 import re
+from bisect import bisect_right
+from operator import itemgetter
+from backend.app.utils.metrics import instrument
+from backend.app.utils.resume_document import as_document
 
 
 # -------------------------------------------------
@@ -26,57 +30,318 @@ FIELD_PATTERNS = {
 }
 
 
+# -------------------------------------------------
+# SINGLE-PASS SCANNER
+# -------------------------------------------------
+# Every spelling of every degree and field pattern ("b.tech", "btech",
+# "bachelor of technology", ...) in one alternation, factored by common
+# prefixes, restricted to whole words: one scan lists each mention with
+# its position.
+#
+# The scan runs over a marked copy of the lowercase text in which every
+# character other than [a-z0-9.] is a NUL byte (same offsets). A
+# mention starts right after a NUL (not after a "."), and that single
+# literal lets the regex engine jump from separator to separator
+# instead of trying the alternation at every character. Words of a
+# multi-word spelling may be split by any separator (e.g. a line break
+# in "Bachelor of\nTechnology").
+
+
+def _spellings(pattern):
+    """
+    Every string ``pattern`` matches. Degree / field patterns are one
+    group of literal alternatives whose only optional parts are single
+    characters ("b.tech" / "btech").
+    """
+    spellings = []
+    for branch in pattern.strip("()").split("|"):
+        variants = [""]
+        i = 0
+        while i < len(branch):
+            escaped = branch[i] == "\\"
+            char = branch[i + escaped]
+            i += 1 + escaped
+            if branch[i:i + 1] == "?":
+                variants = [variant + tail for variant in variants for tail in ("", char)]
+                i += 1
+            else:
+                variants = [variant + char for variant in variants]
+        spellings.extend(variants)
+    return tuple(spellings)
+
+
+def _prefix_tree(words):
+    """Regex matching exactly ``words``, with shared prefixes factored out."""
+    tails = {}
+    for word in words:
+        tails.setdefault(word[:1], []).append(word[1:])
+    optional = "" in tails
+    branches = [re.escape(head) + _prefix_tree(rest) for head, rest in sorted(tails.items()) if head]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+
+_SPELLINGS = {
+    name: _spellings(pattern)
+    for patterns in (DEGREE_PATTERNS, FIELD_PATTERNS)
+    for name, pattern in patterns.items()
+}
+
+# Marked spelling -> ("degree" | "field", name)
+_MARKED_SPELLINGS = {
+    spelling.replace(" ", "\x00").encode(): ("degree" if name in DEGREE_PATTERNS else "field", name)
+    for name, spellings in _SPELLINGS.items()
+    for spelling in spellings
+}
+
+ACADEMIC_PATTERN = re.compile(
+    rb"\x00(" + _prefix_tree([spelling.decode("latin-1") for spelling in _MARKED_SPELLINGS]).encode("latin-1")
+    + rb")(?![a-z0-9])"
+)
+
+_WORD_BYTES = set(b"abcdefghijklmnopqrstuvwxyz0123456789.")
+_MARK_SEPARATORS = bytes(c if c in _WORD_BYTES else 0 for c in range(256))
+
+# Degree/field spellings that are also common words ("will be",
+# "contact me", "it was"): listed only when written in capitals
+_AMBIGUOUS_WORDS = {"be", "me", "it", "ai"}
+
+# Details looked up around each listed degree: its line and the next
+# two, up to the first line that starts another education entry (a
+# degree, a school-level line or a second institution)
+_DETAIL_LINES = 3
+
+INSTITUTION_KEYWORDS = re.compile(
+    r"\b(university|institute|college|school|academy|vidyalaya|iit|nit|iiit|bits)\b",
+    re.IGNORECASE
+)
+_SEGMENT_SPLIT = re.compile(r"[,|;\n•()\[\]–—]+")
+YEAR_PATTERN = re.compile(r"(?<!\d)(19[5-9]\d|20\d{2})(?!\d)")
+CGPA_PATTERN = re.compile(
+    r"(?:cgpa|cpi|sgpa|gpa)\s*(?:of\s*)?[:\-]?\s*(\d{1,2}(?:\.\d{1,3})?)(?:\s*/\s*(\d{1,2}(?:\.\d+)?))?"
+    r"|(\d{1,2}\.\d{1,3})\s*(?:/\s*(\d{1,2}(?:\.\d+)?)\s*)?(?:cgpa|cpi|sgpa|gpa)"
+)
+PERCENTAGE_PATTERN = re.compile(r"(?<![\d.])(\d{2}(?:\.\d{1,2})?|100)\s*%")
+SCHOOL_PATTERN = re.compile(
+    r"\b(?:class|std|grade)\.?\s*(?:x|xii|10|12)(?:th)?\b"
+    r"|\b(?:10th|12th|ssc|hsc|sslc|higher secondary|senior secondary|secondary school)\b"
+)
+# Where an institution name ends: the first grade or year after it
+_INSTITUTION_END = re.compile(
+    r"\b(?:cgpa|cpi|sgpa|gpa|percentage|grade)\b|\d+(?:\.\d+)?\s*(?:%|/)|(?<!\d)(?:19[5-9]\d|20\d{2})(?!\d)",
+    re.IGNORECASE
+)
+
+
+def _scan(document):
+    """
+    Returns:
+        list[tuple]: (kind, name, start, end) for every whole-word
+        degree / field mention
+    """
+    # "replace" turns each non-ASCII character into one "?": offsets stay put
+    marked = b"\x00" + document.lower.encode("ascii", "replace").translate(_MARK_SEPARATORS)
+    # The NUL before a mention sits at the mention's offset in ``lower``
+    return [
+        (*_MARKED_SPELLINGS[match.group(1)], match.start(), match.end() - 1)
+        for match in ACADEMIC_PATTERN.finditer(marked)
+    ]
+
+
+def _first_found(patterns, mentioned, lower):
+    """
+    First of ``patterns`` (priority order) found anywhere in the text,
+    even inside a word. A whole-word mention from the scan settles it;
+    otherwise the pattern's spellings are looked up as substrings.
+    ``mentioned`` only holds mentions spelled exactly as the pattern
+    (a line break inside "bachelor of technology" doesn't count here).
+    """
+    for name in patterns:
+        if name in mentioned:
+            return name
+        for spelling in _SPELLINGS[name]:
+            if spelling in lower:
+                return name
+    return None
+
+
+def _is_mention(document, start, end):
+    """Ambiguous short words ("be", "it") count only in capitals."""
+    text = document.lower
+    word = text[start:end].rstrip(".")
+    if word in _AMBIGUOUS_WORDS:
+        # Offsets are into the lowercase text; they only line up with
+        # the original when lowercasing kept every character's length
+        original = document.text[start:start + len(word)] if len(document.text) == len(text) else ""
+        return original.isupper()
+    return True
+
+
 # -------------------------------------------------
 # MAIN ACADEMIC PARSER
 # -------------------------------------------------
 
-def extract_academics(resume_text: str):
+@instrument("parser")
+def extract_academics(resume_text):
     """
-    Extract academic background from resume text.
+    Extract academic background from resume text (str or ResumeDocument).
 
     Returns:
         dict:
         {
           "degree": str | None,
           "field": str | None,
-          "education_level": str
+          "education_level": str,
+          "degrees": [
+            {
+              "degree": str,
+              "field": str | None,
+              "institution": str | None,
+              "year": int | None,
+              "cgpa": float | None,
+              "cgpa_scale": float | None,
+              "percentage": float | None
+            }
+          ]
         }
+
+    "degree" / "field" keep their original meaning: the first pattern,
+    in priority order, found anywhere in the text (even inside a word).
+    "degrees" lists every whole-word degree mention, in order.
     """
 
-    if not resume_text or not resume_text.strip():
+    document = as_document(resume_text)
+    if document.is_blank:
         return {
             "degree": None,
             "field": None,
-            "education_level": "Unknown"
+            "education_level": "Unknown",
+            "degrees": []
         }
 
-    text = resume_text.lower()
+    hits = _scan(document)
+    mentioned = {name for _, name, start, end in hits if document.lower[start:end] in _SPELLINGS[name]}
+    degree_found = _first_found(DEGREE_PATTERNS, mentioned, document.lower)
+    field_found = _first_found(FIELD_PATTERNS, mentioned, document.lower)
 
-    degree_found = None
-    field_found = None
+    education_level = _classify_education_level(degree_found)
 
-    # -------------------------
-    # Degree detection
-    # -------------------------
-    for degree, pattern in DEGREE_PATTERNS.items():
-        if re.search(pattern, text):
-            degree_found = degree
-            break
+    return {
+        "degree": degree_found,
+        "field": field_found,
+        "education_level": education_level,
+        "degrees": _list_degrees(document, hits)
+    }
+
+
+def _list_degrees(document, hits):
+    mentions = [hit for hit in hits if _is_mention(document, hit[2], hit[3])]
+    if not any(kind == "degree" for kind, _, _, _ in mentions):
+        return []
+
+    lines = document.lines
+    # (degree, index of its line) for every degree mention
+    degrees = [
+        (name, bisect_right(lines, start, key=itemgetter(0)) - 1)
+        for kind, name, start, _ in mentions if kind == "degree"
+    ]
+    fields = [(name, start) for kind, name, start, _ in mentions if kind == "field"]
+
+    entries = []
+    seen = set()
+    for i, (degree, line) in enumerate(degrees):
+        if (degree, line) in seen:
+            continue
+        seen.add((degree, line))
+
+        next_line = next((index for _, index in degrees[i + 1:] if index > line), None)
+        window_start = lines[line][0]
+        window_end = lines[_last_detail_line(document.lower, lines, line, next_line)][1]
+
+        field = next((name for name, pos in fields if window_start <= pos < window_end), None)
+        entries.append({
+            "degree": degree,
+            "field": field,
+            **_degree_details(document, window_start, window_end),
+        })
+
+    # The same degree in the summary and the education section: keep
+    # the mention with the most details
+    best = {}
+    for entry in entries:
+        filled = sum(value is not None for value in entry.values())
+        if entry["degree"] not in best or filled > best[entry["degree"]][0]:
+            best[entry["degree"]] = (filled, entry)
+    kept = {id(entry) for _, entry in best.values()}
+    return [entry for entry in entries if id(entry) in kept]
 
-    # -------------------------
-    # Field detection
-    # -------------------------
-    for field, pattern in FIELD_PATTERNS.items():
-        if re.search(pattern, text):
-            field_found = field
+
+def _last_detail_line(text, lines, first, next_degree):
+    """
+    Index of the last line of a degree's detail window: its line
+    (``first``) plus up to _DETAIL_LINES - 1 more, stopping before the
+    line of the next degree (``next_degree``), a Class X / XII line or
+    a second institution.
+    """
+    start, end = lines[first]
+    has_institution = INSTITUTION_KEYWORDS.search(text, start, end) is not None
+
+    last = first
+    for index in range(first + 1, min(first + _DETAIL_LINES, len(lines))):
+        if next_degree is not None and index >= next_degree:
             break
+        start, end = lines[index]
+        if SCHOOL_PATTERN.search(text, start, end):
+            break
+        if INSTITUTION_KEYWORDS.search(text, start, end):
+            if has_institution:
+                break
+            has_institution = True
+        last = index
+    return last
+
+
+def _institution(segment):
+    """An institution segment without the grades / years written after it."""
+    keyword = INSTITUTION_KEYWORDS.search(segment)
+    cut = _INSTITUTION_END.search(segment, keyword.end())
+    name = segment[:cut.start()] if cut else segment
+    return YEAR_PATTERN.sub("", name).strip(" -:") or None
 
-    education_level = _classify_education_level(degree_found)
+
+def _degree_details(document, start, end):
+    window = document.lower[start:end]
+    original = document.text[start:end] if len(document.text) == len(document.lower) else window
+
+    institution = next(
+        (_institution(segment) for segment in _SEGMENT_SPLIT.split(original)
+         if INSTITUTION_KEYWORDS.search(segment)),
+        None
+    )
+
+    years = [int(year) for year in YEAR_PATTERN.findall(window)]
+
+    cgpa = cgpa_scale = None
+    match = CGPA_PATTERN.search(window)
+    if match:
+        value, scale = (match.group(1), match.group(2)) if match.group(1) else (match.group(3), match.group(4))
+        cgpa = float(value)
+        cgpa_scale = float(scale) if scale else None
+
+    percentage = None
+    match = PERCENTAGE_PATTERN.search(window)
+    if match:
+        percentage = float(match.group(1))
 
     return {
-        "degree": degree_found,
-        "field": field_found,
-        "education_level": education_level
+        "institution": institution,
+        "year": max(years) if years else None,
+        "cgpa": cgpa,
+        "cgpa_scale": cgpa_scale,
+        "percentage": percentage,
     }
 
 
@@ -89,4 +354,4 @@ def _classify_education_level(degree: str | None) -> str:
         return "Postgraduate"
     if degree == "PhD":
         return "Doctorate"
-    return "Unknown"
\ No newline at end of file
+    return "Unknown"
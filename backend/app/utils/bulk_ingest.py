@@ -0,0 +1,387 @@
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+
+from backend.app.utils import resume_parser
+from backend.app.utils.resume_parser import SUPPORTED_EXTENSIONS, extract_text
+from backend.app.utils.resume_pipeline import LLM_CONTEXT_FIELDS, analyze_texts, enrich, unavailable_enrichment
+
+# -------------------------------------------------
+# BULK RESUME INGESTION (placement cells)
+# -------------------------------------------------
+# A ZIP archive or a directory of PDF / DOCX resumes is split into
+# chunks and analyzed across a process pool: extract_text, then the
+# skill / experience / academic parsers, the domain + job-role
+# classifier (one vectorized call per chunk) and the ATS scorer.
+# Rows come back as each chunk finishes and are written out as NDJSON
+# or CSV straight away. LLM enrichment is opt-in and rate limited.
+#
+# Used by POST /user/api/resume/bulk (inline by default, see
+# routes/user.py) and from the command line:
+#     python -m backend.app.utils.bulk_ingest resumes.zip -o results.csv
+
+# Default process count (CLI): one per CPU
+BULK_WORKERS = int(os.getenv("BULK_WORKERS", str(os.cpu_count() or 1)))
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "16"))
+
+# Archive limits, checked on the ZIP's central directory before anything
+# is decompressed (and again while reading, since headers can lie)
+BULK_MAX_FILES = int(os.getenv("BULK_MAX_FILES", "10000"))
+BULK_MAX_FILE_BYTES = int(os.getenv("BULK_MAX_FILE_BYTES", str(10 * 1024 * 1024)))
+BULK_MAX_TOTAL_BYTES = int(os.getenv("BULK_MAX_TOTAL_BYTES", str(4 * 1024 ** 3)))
+BULK_MAX_COMPRESSION_RATIO = int(os.getenv("BULK_MAX_COMPRESSION_RATIO", "100"))
+
+# Two LLM calls (summary + skill levels) per enriched resume
+BULK_LLM_CALLS_PER_MINUTE = float(os.getenv("BULK_LLM_CALLS_PER_MINUTE", "60"))
+BULK_LLM_CONCURRENCY = int(os.getenv("BULK_LLM_CONCURRENCY", "4"))
+
+OUTPUT_FORMATS = ("ndjson", "csv")
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+CSV_FIELDS = (
+    "file", "status", "error", "domain", "job_roles", "ats_score",
+    "experience_level", "total_experience", "degree", "field",
+    "education_level", "skills", "summary", "skill_levels",
+)
+
+
+class BulkIngestError(ValueError):
+    """The archive is rejected as a whole (too many / too large files, zip bomb)."""
+
+
+# -------------------------
+# Sources: (name, bytes | None, error | None)
+# -------------------------
+
+def _is_resume(name: str) -> bool:
+    base = os.path.basename(name)
+    return (
+        not name.startswith("__MACOSX/")
+        and not base.startswith(".")
+        and os.path.splitext(base)[1].lower() in SUPPORTED_EXTENSIONS
+    )
+
+
+def zip_resumes(archive_file):
+    """
+    Validate a ZIP of resumes and return a generator over its members.
+
+    Raises:
+        BulkIngestError: too many resumes, too much uncompressed data
+            or a suspicious compression ratio
+        zipfile.BadZipFile: not a ZIP archive
+    """
+    archive = zipfile.ZipFile(archive_file)
+    try:
+        members = _checked_members(archive)
+    except Exception:
+        archive.close()
+        raise
+    return _read_members(archive, members)
+
+
+def _checked_members(archive):
+    members = [info for info in archive.infolist() if not info.is_dir() and _is_resume(info.filename)]
+    if len(members) > BULK_MAX_FILES:
+        raise BulkIngestError(f"Too many resumes in archive ({len(members)}, max {BULK_MAX_FILES})")
+
+    total = sum(info.file_size for info in members)
+    if total > BULK_MAX_TOTAL_BYTES:
+        raise BulkIngestError(f"Archive expands to {total} bytes (max {BULK_MAX_TOTAL_BYTES})")
+
+    for info in members:
+        if info.file_size > BULK_MAX_COMPRESSION_RATIO * max(info.compress_size, 1):
+            raise BulkIngestError(f"Suspicious compression ratio for {info.filename}")
+    return members
+
+
+def _read_members(archive, members):
+    with archive:
+        for info in members:
+            if info.file_size > BULK_MAX_FILE_BYTES:
+                yield info.filename, None, f"File too large (max {BULK_MAX_FILE_BYTES} bytes)"
+                continue
+            try:
+                with archive.open(info) as member:
+                    data = member.read(BULK_MAX_FILE_BYTES + 1)
+            except (RuntimeError, zipfile.BadZipFile, EOFError, NotImplementedError) as e:
+                # Encrypted, corrupt or unsupported compression
+                yield info.filename, None, str(e)
+                continue
+            if len(data) > BULK_MAX_FILE_BYTES:
+                yield info.filename, None, f"File too large (max {BULK_MAX_FILE_BYTES} bytes)"
+                continue
+            yield info.filename, data, None
+
+
+def directory_resumes(path: str):
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            relative = os.path.relpath(file_path, path)
+            if not _is_resume(relative):
+                continue
+            if os.path.getsize(file_path) > BULK_MAX_FILE_BYTES:
+                yield relative, None, f"File too large (max {BULK_MAX_FILE_BYTES} bytes)"
+                continue
+            with open(file_path, "rb") as f:
+                yield relative, f.read(), None
+
+
+# -------------------------
+# Analysis (process pool)
+# -------------------------
+
+def _error_row(name, error):
+    return {"file": name, "status": "error", "error": error}
+
+
+def analyze_chunk(items, keep_text=False):
+    """
+    Returns:
+        list[dict]: one row per (name, data, error) item: "ok" rows carry
+        the analysis fields (plus "_text" when ``keep_text``)
+    """
+    rows = []
+    names = []
+    texts = []
+    for name, data, error in items:
+        if error is not None:
+            rows.append(_error_row(name, error))
+            continue
+        try:
+            texts.append(extract_text(data, filename=name))
+            names.append(name)
+        except Exception as e:
+            rows.append(_error_row(name, str(e)))
+
+    try:
+        analyses = analyze_texts(texts)
+    except Exception as e:
+        return rows + [_error_row(name, str(e)) for name in names]
+
+    for name, text, analysis in zip(names, texts, analyses):
+        row = {"file": name, "status": "ok", **analysis}
+        if keep_text:
+            row["_text"] = text
+        rows.append(row)
+    return rows
+
+
+def _init_worker():
+    # Already one process per core: no page-parallel PDFs inside a worker
+    resume_parser.PDF_WORKERS = 1
+
+
+def _chunks(resumes, size):
+    chunk = []
+    for item in resumes:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _analyze_all(resumes, workers, chunk_size, keep_text):
+    chunks = _chunks(resumes, chunk_size)
+    if workers < 2:
+        for chunk in chunks:
+            yield from analyze_chunk(chunk, keep_text)
+        return
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=_init_worker,
+    )
+    try:
+        # A couple of chunks queued per worker; the rest stay unread
+        in_flight = set()
+        for chunk in chunks:
+            in_flight.add(pool.submit(analyze_chunk, chunk, keep_text))
+            if len(in_flight) >= 2 * workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        for future in as_completed(in_flight):
+            yield from future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+# -------------------------
+# Optional LLM enrichment (rate limited)
+# -------------------------
+
+class RateLimiter:
+    """Spaces calls evenly at ``per_minute``; shared by all enrichment threads."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, calls: int = 1):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + calls * self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _enrich_row(row, limiter):
+    text = row.pop("_text")
+    limiter.acquire(2)
+    try:
+        row.update(enrich({key: row[key] for key in LLM_CONTEXT_FIELDS}, text))
+    except Exception:
+        row.update(unavailable_enrichment())
+    return row
+
+
+def ingest(resumes, workers=BULK_WORKERS, chunk_size=BULK_CHUNK_SIZE, llm=False,
+           llm_calls_per_minute=BULK_LLM_CALLS_PER_MINUTE):
+    """
+    Analyze (name, bytes, error) items from ``zip_resumes`` /
+    ``directory_resumes``.
+
+    Yields:
+        dict: one row per resume, in completion order
+    """
+    rows = _analyze_all(resumes, workers, chunk_size, keep_text=llm)
+    if not llm:
+        yield from rows
+        return
+
+    limiter = RateLimiter(llm_calls_per_minute)
+    with ThreadPoolExecutor(max_workers=BULK_LLM_CONCURRENCY, thread_name_prefix="bulk-llm") as pool:
+        enriching = set()
+        for row in rows:
+            if row["status"] != "ok":
+                yield row
+                continue
+            enriching.add(pool.submit(_enrich_row, row, limiter))
+            done = {future for future in enriching if future.done()}
+            enriching -= done
+            for future in done:
+                yield future.result()
+        for future in as_completed(enriching):
+            yield future.result()
+
+
+# -------------------------
+# Output
+# -------------------------
+
+def _joined(values):
+    return "; ".join(str(value) for value in values)
+
+
+def _csv_record(row):
+    experience = row.get("experience") or {}
+    academics = row.get("academics") or {}
+    skill_levels = row.get("skill_levels") or {}
+    return [
+        row["file"],
+        row["status"],
+        row.get("error", ""),
+        row.get("domain", ""),
+        _joined(row.get("job_roles", [])),
+        row.get("ats_score", ""),
+        experience.get("experience_level", ""),
+        experience.get("total_experience", ""),
+        academics.get("degree") or "",
+        academics.get("field") or "",
+        academics.get("education_level", ""),
+        _joined(row.get("skills", [])),
+        row.get("summary") or "",
+        _joined(f"{skill}: {level}" for skill, level in skill_levels.items()),
+    ]
+
+
+def write_rows(rows, output_format="ndjson"):
+    """Yields the rows as NDJSON lines or CSV lines (header first)."""
+    if output_format == "ndjson":
+        for row in rows:
+            yield json.dumps(row) + "\n"
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    for row in rows:
+        writer.writerow(_csv_record(row))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+# -------------------------
+# Command line
+# -------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze a ZIP archive or directory of resumes in parallel.")
+    parser.add_argument("source", help="ZIP archive or directory of PDF / DOCX resumes")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS,
+                        help="output format (default: from the output file name, else ndjson)")
+    parser.add_argument("--workers", type=int, default=BULK_WORKERS)
+    parser.add_argument("--chunk-size", type=int, default=BULK_CHUNK_SIZE)
+    parser.add_argument("--llm", action="store_true", help="add LLM summaries and skill levels")
+    parser.add_argument("--llm-calls-per-minute", type=float, default=BULK_LLM_CALLS_PER_MINUTE)
+    args = parser.parse_args(argv)
+
+    output_format = args.format or ("csv" if (args.output or "").lower().endswith(".csv") else "ndjson")
+    if args.llm:
+        from dotenv import load_dotenv
+        load_dotenv()
+
+    try:
+        if os.path.isdir(args.source):
+            resumes = directory_resumes(args.source)
+        else:
+            resumes = zip_resumes(args.source)
+    except (BulkIngestError, zipfile.BadZipFile, OSError) as e:
+        parser.error(str(e))
+
+    counts = {"ok": 0, "error": 0}
+
+    def counted(rows):
+        for row in rows:
+            counts[row["status"]] += 1
+            yield row
+
+    start = time.perf_counter()
+    rows = ingest(resumes, workers=args.workers, chunk_size=args.chunk_size, llm=args.llm,
+                  llm_calls_per_minute=args.llm_calls_per_minute)
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for chunk in write_rows(counted(rows), output_format):
+            out.write(chunk)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    total = counts["ok"] + counts["error"]
+    print(f"{total} resumes ({counts['error']} failed) in {elapsed:.2f} s, "
+          f"{total / elapsed if elapsed else 0:.1f} resumes/s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import re
+from backend.app.utils.metrics import instrument
+from backend.app.utils.resume_document import as_document
 
 
 # -------------------------------------------------
@@ -16,12 +18,13 @@ DATE_RANGE_PATTERN = re.compile(
 )
 
 
-def extract_experience(resume_text: str):
+@instrument("parser")
+def extract_experience(resume_text):
     """
     Extract total years of experience from resume text.
 
     Args:
-        resume_text (str)
+        resume_text (str | ResumeDocument)
 
     Returns:
         dict:
@@ -31,20 +34,19 @@ def extract_experience(resume_text: str):
             }
     """
 
-    if not resume_text or not resume_text.strip():
+    document = as_document(resume_text)
+    if document.is_blank:
         return {
             "total_experience": 0.0,
             "experience_level": "Unknown"
         }
 
-    text = resume_text.lower()
-
     years_found = []
 
     # -------------------------
     # 1. Explicit year mentions
     # -------------------------
-    for match in YEAR_PATTERN.findall(text):
+    for match in document.findall(YEAR_PATTERN):
         try:
             years = float(match[0])
             years_found.append(years)
@@ -55,7 +57,7 @@ def extract_experience(resume_text: str):
     # 2. Date range estimation
     # Example: 2019 - 2023
     # -------------------------
-    for match in DATE_RANGE_PATTERN.findall(text):
+    for match in document.findall(DATE_RANGE_PATTERN):
         start_year = int(match[0])
         end = match[1]
 
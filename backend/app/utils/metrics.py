@@ -0,0 +1,147 @@
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+# -------------------------------------------------
+# PROMETHEUS INSTRUMENTATION
+# -------------------------------------------------
+# Stage timers (model calls, parsers, scorer, LLM providers) and
+# per-endpoint request timers, exported at /metrics.
+#
+# Under Gunicorn, PROMETHEUS_MULTIPROC_DIR (set in gunicorn.conf.py)
+# makes every worker write its samples to files in that directory;
+# /metrics aggregates all of them, whichever worker answers.
+
+# Model calls are sub-millisecond, LLM calls take seconds
+STAGE_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+STAGE_SECONDS = Histogram(
+    "mentora_stage_duration_seconds",
+    "Time spent in one model call, parser, scorer or LLM provider request",
+    ["kind", "name"],
+    buckets=STAGE_BUCKETS,
+)
+
+STAGE_ERRORS = Counter(
+    "mentora_stage_errors_total",
+    "Failed stage calls by error type",
+    ["kind", "name", "error"],
+)
+
+BATCH_SIZE = Histogram(
+    "mentora_model_batch_size",
+    "Items per vectorized model call",
+    ["name"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 1024, 4096),
+)
+
+CACHE_LOOKUPS = Counter(
+    "mentora_cache_lookups_total",
+    "Result cache lookups by outcome (hit, miss, error)",
+    ["cache", "result"],
+)
+
+REQUEST_SECONDS = Histogram(
+    "mentora_http_request_duration_seconds",
+    "Request latency by endpoint",
+    ["endpoint", "method", "status"],
+    buckets=STAGE_BUCKETS,
+)
+
+
+@contextmanager
+def timed(kind, name):
+    """
+    Time the block as stage ``kind``/``name``; exceptions are counted
+    (by class name) and re-raised.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        STAGE_ERRORS.labels(kind, name, type(e).__name__).inc()
+        raise
+    finally:
+        STAGE_SECONDS.labels(kind, name).observe(time.perf_counter() - start)
+
+
+def instrument(kind, name=None):
+    """Decorator form of ``timed``; ``name`` defaults to the function name."""
+    def decorator(fn):
+        label = name or fn.__name__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed(kind, label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_error(kind, name, error):
+    """Count a failure that didn't raise (e.g. an LLM reply without choices)."""
+    STAGE_ERRORS.labels(kind, name, error).inc()
+
+
+def record_cache(cache, result):
+    """Count one lookup in result cache ``cache``: "hit", "miss" or "error"."""
+    CACHE_LOOKUPS.labels(cache, result).inc()
+
+
+def observe_batch(name, size):
+    BATCH_SIZE.labels(name).observe(size)
+
+
+# -------------------------
+# Flask integration
+# -------------------------
+
+def _collect():
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def init_metrics(app):
+    @app.before_request
+    def _start_timer():
+        g._metrics_start = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        start = g.pop("_metrics_start", None)
+        if start is not None:
+            # Route pattern, not the raw path, to keep label cardinality bounded
+            endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+            REQUEST_SECONDS.labels(endpoint, request.method, str(response.status_code)).observe(
+                time.perf_counter() - start
+            )
+        return response
+
+    @app.route("/metrics", methods=["GET"])
+    def metrics():
+        return Response(_collect(), mimetype=CONTENT_TYPE_LATEST)
+
+
+def mark_process_dead(pid):
+    """Gunicorn ``child_exit`` hook: drop a dead worker's live-gauge files."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+from backend.app.config.extensions import cache
+from backend.app.llm import llm_router
+from backend.app.llm.prompts import SKILL_LEVEL_PROMPT, SUMMARY_PROMPT
+from backend.app.ml_inference import resume_classifier  # noqa: F401  registers "resume_classifier"
+from backend.app.ml_inference.model_loader import model_registry
+from backend.app.utils import resume_parser
+from backend.app.utils.metrics import record_cache
+from backend.app.utils.skill_extractor import TAXONOMY_VERSION
+
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------------------------
+# CONTENT-ADDRESSED RESUME RESULTS
+# -------------------------------------------------
+# Students re-upload the same file again and again. Results are keyed by
+# the SHA-256 of the uploaded bytes plus a version of everything that
+# produced them, so a re-upload skips extraction, the classifiers, the
+# scorer and the LLM calls. A new taxonomy, a reloaded model, another
+# PDF engine or a new prompt changes the version and therefore the keys;
+# entries of old versions simply expire.
+#
+# Deterministic results (parsers, classifier, ATS score) and the LLM
+# enrichment (summary, skill levels) are stored separately: the former
+# only change with the pipeline, the latter are worth refreshing sooner.
+
+RESUME_CACHE_TTL = int(os.getenv("RESUME_CACHE_TTL", str(7 * 24 * 3600)))
+RESUME_LLM_CACHE_TTL = int(os.getenv("RESUME_LLM_CACHE_TTL", str(24 * 3600)))
+
+# Bump whenever parser / scorer code changes what analyze_resume returns
+PIPELINE_REVISION = "1"
+
+_CHUNK_SIZE = 1 << 16
+
+# After a Redis error, skip the cache for this long
+_RETRY_SECONDS = 30
+_disabled_until = 0.0
+
+
+def file_digest(source) -> str:
+    """SHA-256 of a resume's bytes (bytes or a seekable binary stream, rewound after)."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+
+    digest = hashlib.sha256()
+    source.seek(0)
+    for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def _short_hash(*parts) -> str:
+    return hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()[:16]
+
+
+def pipeline_version() -> str:
+    """Version of the deterministic analysis (loads the classifier if needed)."""
+    return _short_hash(
+        PIPELINE_REVISION,
+        TAXONOMY_VERSION,
+        model_registry.version("resume_classifier"),
+        resume_parser.PDF_ENGINE,
+    )
+
+
+def llm_version(pipeline: str) -> str:
+    """Version of the LLM enrichment: its inputs plus the prompts and models."""
+    return _short_hash(
+        pipeline,
+        SUMMARY_PROMPT,
+        SKILL_LEVEL_PROMPT,
+        llm_router.OPENROUTER_MODEL,
+        json.dumps(llm_router.GROQ_MODELS),
+    )
+
+
+def analysis_key(digest: str, pipeline: str) -> str:
+    return f"resume:analysis:{pipeline}:{digest}"
+
+
+def llm_key(digest: str, pipeline: str) -> str:
+    return f"resume:llm:{llm_version(pipeline)}:{digest}"
+
+
+# -------------------------
+# Redis access
+# -------------------------
+# Lookups never fail a request: with Redis down the pipeline just runs.
+
+def get(kind: str, key: str):
+    global _disabled_until
+    if time.monotonic() < _disabled_until:
+        return None
+    try:
+        value = cache.get(key)
+    except Exception as e:
+        _disabled_until = time.monotonic() + _RETRY_SECONDS
+        record_cache(f"resume_{kind}", "error")
+        logger.warning("Resume cache unavailable: %s", e)
+        return None
+    record_cache(f"resume_{kind}", "hit" if value is not None else "miss")
+    return value
+
+
+def put(kind: str, key: str, value):
+    global _disabled_until
+    if time.monotonic() < _disabled_until:
+        return
+    timeout = RESUME_LLM_CACHE_TTL if kind == "llm" else RESUME_CACHE_TTL
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception as e:
+        _disabled_until = time.monotonic() + _RETRY_SECONDS
+        record_cache(f"resume_{kind}", "error")
+        logger.warning("Resume cache unavailable: %s", e)
@@ -0,0 +1,162 @@
+import re
+from functools import cached_property
+
+
+# -------------------------------------------------
+# SHARED RESUME VIEWS
+# -------------------------------------------------
+# analyze_resume runs the skill, experience and academic parsers plus
+# the domain/job-role classifier over the same text. Each of them used
+# to lowercase / normalize / scan the whole resume on its own; a
+# ResumeDocument computes every view once, on first use, and the
+# parsers share it. All parsers still accept a plain string.
+
+# Characters kept by the skill normalization; everything else is a space
+_NON_SKILL_CHARS = re.compile(r"[^a-z0-9+ ]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Runs of word characters and runs of anything else (in normalized text)
+RUN_PATTERN = re.compile(r"[a-z0-9]+|[^a-z0-9]+")
+
+# A line that is only a known heading (optionally followed by ":");
+# matched between a line's offsets, so no "^"
+SECTION_HEADINGS = {
+    "summary": ("summary", "profile", "objective", "about me", "professional summary"),
+    "education": ("education", "academics", "academic background", "qualifications",
+                  "educational qualifications"),
+    "experience": ("experience", "work experience", "professional experience",
+                   "employment", "employment history", "internships", "internship"),
+    "skills": ("skills", "technical skills", "key skills", "core competencies"),
+    "projects": ("projects", "academic projects", "personal projects"),
+    "certifications": ("certifications", "certificates", "courses"),
+    "achievements": ("achievements", "awards", "honors", "accomplishments"),
+}
+_HEADING_LINE = re.compile(
+    r"\s*(?P<heading>" + "|".join(
+        re.escape(heading)
+        for headings in SECTION_HEADINGS.values() for heading in headings
+    ) + r")\s*:?\s*$"
+)
+_HEADING_SECTIONS = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase, keep only [a-z0-9+ ] and collapse whitespace (the form
+    skills are matched in).
+    """
+    return _normalize_lower(text.lower())
+
+
+def _normalize_lower(lower: str) -> str:
+    return _WHITESPACE.sub(" ", _NON_SKILL_CHARS.sub(" ", lower)).strip()
+
+
+class ResumeDocument:
+    """
+    One resume's text with lazily computed, cached views.
+
+    Views: ``lower``, ``normalized``, ``tokens``, ``runs``, ``lines``
+    (with their character offsets) and ``sections``; ``findall``,
+    ``finditer`` and ``search`` cache regex hits over the lowercase
+    text per pattern.
+    """
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self._findall = {}
+        self._finditer = {}
+        self._search = {}
+
+    def __str__(self):
+        return self.text
+
+    @cached_property
+    def is_blank(self) -> bool:
+        return not self.text.strip()
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def normalized(self) -> str:
+        return _normalize_lower(self.lower)
+
+    @cached_property
+    def tokens(self) -> list:
+        return self.normalized.split()
+
+    @cached_property
+    def runs(self) -> list:
+        """Alternating word / separator runs of ``normalized``."""
+        return RUN_PATTERN.findall(self.normalized)
+
+    @cached_property
+    def lines(self) -> list:
+        """
+        Returns:
+            list[tuple[int, int]]: (start, end) offsets of every line in
+            ``lower`` (line breaks excluded)
+        """
+        bounds = []
+        start = 0
+        for line in self.lower.splitlines(keepends=True):
+            bounds.append((start, start + len(line.rstrip("\r\n"))))
+            start += len(line)
+        return bounds
+
+    @cached_property
+    def sections(self) -> dict:
+        """
+        Returns:
+            dict: section name -> (start, end) offsets in ``lower`` of
+            the section body, for every heading line found (first
+            occurrence wins)
+        """
+        headings = []
+        for start, end in self.lines:
+            match = _HEADING_LINE.match(self.lower, start, end)
+            if match:
+                headings.append((_HEADING_SECTIONS[match.group("heading")], start, end))
+
+        sections = {}
+        for i, (name, _, heading_end) in enumerate(headings):
+            body_end = headings[i + 1][1] if i + 1 < len(headings) else len(self.lower)
+            sections.setdefault(name, (heading_end, body_end))
+        return sections
+
+    def section(self, name: str):
+        """Lowercase text of section ``name``, or None if there is no such heading."""
+        bounds = self.sections.get(name)
+        return self.lower[bounds[0]:bounds[1]] if bounds else None
+
+    def findall(self, pattern: re.Pattern) -> list:
+        """``pattern.findall`` over the lowercase text, cached per pattern."""
+        hits = self._findall.get(pattern)
+        if hits is None:
+            hits = self._findall[pattern] = pattern.findall(self.lower)
+        return hits
+
+    def finditer(self, pattern: re.Pattern) -> list:
+        """All ``pattern`` match objects over the lowercase text, cached per pattern."""
+        hits = self._finditer.get(pattern)
+        if hits is None:
+            hits = self._finditer[pattern] = list(pattern.finditer(self.lower))
+        return hits
+
+    def search(self, pattern: re.Pattern):
+        """``pattern.search`` over the lowercase text, cached per pattern."""
+        if pattern not in self._search:
+            self._search[pattern] = pattern.search(self.lower)
+        return self._search[pattern]
+
+
+def as_document(resume) -> ResumeDocument:
+    """Wrap a plain string; documents pass through unchanged."""
+    if isinstance(resume, ResumeDocument):
+        return resume
+    return ResumeDocument(resume)
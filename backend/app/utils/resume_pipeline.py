@@ -0,0 +1,319 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+import redis
+from flask import current_app, has_app_context
+
+from backend.app.llm.resume_summary import generate_resume_summary
+from backend.app.llm.skill_level_inferencer import infer_skill_levels
+from backend.app.ml_inference.model_loader import model_registry
+from backend.app.ml_inference.resume_classifier import classify_resume
+from backend.app.scoring.ats_scorer import calculate_ats_score
+from backend.app.utils import resume_cache
+from backend.app.utils.academic_parser import extract_academics
+from backend.app.utils.experience_parser import extract_experience
+from backend.app.utils.resume_cache import analysis_key, llm_key, pipeline_version
+from backend.app.utils.resume_document import ResumeDocument
+from backend.app.utils.metrics import record_error
+from backend.app.utils.skill_extractor import extract_skills
+
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------------------------
+# RESUME ANALYSIS STAGES
+# -------------------------------------------------
+# Shared by the synchronous /api/resume/analyze route and the Celery
+# chain behind /api/resume/jobs (async_celery/tasks.py):
+#   extract (resume_parser.extract_text) -> analyze -> enrich
+
+LLM_CONTEXT_FIELDS = ("domain", "job_roles", "skills", "experience", "academics", "ats_score")
+
+EMPTY_ENRICHMENT = {"summary": None, "skill_levels": {}}
+
+# The summary and skill-level calls are independent: both run at once
+# on a bounded pool, sharing one deadline (seconds)
+LLM_ENRICH_DEADLINE = float(os.getenv("RESUME_LLM_DEADLINE", "15"))
+LLM_ENRICH_WORKERS = int(os.getenv("RESUME_LLM_WORKERS", "8"))
+
+# Celery stages have no request waiting on them: wait long enough for
+# call_llm to go through OpenRouter and every Groq fallback (12 s each),
+# so a job isn't finished with fields still pending
+LLM_ASYNC_ENRICH_DEADLINE = float(os.getenv("RESUME_ASYNC_LLM_DEADLINE", "60"))
+
+
+def cached_analysis(digest: str):
+    return resume_cache.get("analysis", analysis_key(digest, pipeline_version()))
+
+
+def cached_enrichment(digest: str):
+    return resume_cache.get("llm", llm_key(digest, pipeline_version()))
+
+
+def analyze_text(resume_text: str, digest: str | None = None) -> dict:
+    """
+    Parsers, classifier and ATS score (no LLM calls); cached under the
+    file digest when one is given.
+    """
+    # Lowercase / normalized views shared by every parser below
+    document = ResumeDocument(resume_text)
+    analysis = _analyze(document, classify_resume(document))
+
+    if digest is not None:
+        resume_cache.put("analysis", analysis_key(digest, pipeline_version()), analysis)
+    return analysis
+
+
+def analyze_texts(resume_texts: list) -> list:
+    """
+    ``analyze_text`` for many resumes at once (bulk ingestion): one
+    vectorized classifier call for all of them instead of one
+    micro-batched call each. Nothing is cached.
+    """
+    documents = [ResumeDocument(text) for text in resume_texts]
+    if not documents:
+        return []
+    classifications = model_registry.get("resume_classifier").classify_many(documents)
+    return [
+        _analyze(document, classification)
+        for document, classification in zip(documents, classifications)
+    ]
+
+
+def _analyze(document: ResumeDocument, classification: dict) -> dict:
+    skills = extract_skills(document)
+    experience = extract_experience(document)
+    academics = extract_academics(document)
+    domain = classification["domain"]
+
+    ats_result = calculate_ats_score(
+        skills=skills,
+        experience=experience,
+        academics=academics,
+        domain=domain
+    )
+
+    return {
+        "domain": domain,
+        "job_roles": classification["job_roles"],
+        "skills": skills,
+        "experience": experience,
+        "academics": academics,
+        "ats_score": ats_result["ats_score"],
+        "score_breakdown": ats_result["breakdown"]
+    }
+
+
+def enrich(analysis: dict, resume_text: str, digest: str | None = None,
+           deadline: float | None = None) -> dict:
+    """
+    LLM summary and skill levels, requested concurrently.
+
+    Args:
+        deadline (float | None): Seconds to wait for both
+            (default: RESUME_LLM_DEADLINE)
+
+    Returns:
+        dict: ``summary`` and ``skill_levels`` (empty until ready) plus
+        ``enrichment_status``: field -> "ready", "pending" (still
+        running at the deadline) or "unavailable" (every provider
+        failed). Only a fully ready enrichment is cached; calls still
+        pending at the deadline keep running and cache it if they
+        finish, so a re-upload can pick it up.
+    """
+    deadline_at = time.monotonic() + (LLM_ENRICH_DEADLINE if deadline is None else deadline)
+    llm_context = {key: analysis[key] for key in LLM_CONTEXT_FIELDS}
+
+    pool = _llm_pool()
+    futures = {
+        "summary": pool.submit(generate_resume_summary, llm_context, deadline=deadline_at),
+        "skill_levels": pool.submit(infer_skill_levels, resume_text, analysis["skills"],
+                                    deadline=deadline_at),
+    }
+    wait(futures.values(), timeout=max(deadline_at - time.monotonic(), 0))
+
+    enrichment, status = _collect_enrichment(futures)
+    if digest is None:
+        return enrichment
+
+    if all(state == "ready" for state in status.values()):
+        resume_cache.put("llm", llm_key(digest, pipeline_version()), enrichment)
+    elif "pending" in status.values() and "unavailable" not in status.values():
+        _cache_when_ready(futures, digest)
+    return enrichment
+
+
+def unavailable_enrichment() -> dict:
+    """What ``enrich`` returns when it could not run at all."""
+    return {**EMPTY_ENRICHMENT, "enrichment_status": {name: "unavailable" for name in EMPTY_ENRICHMENT}}
+
+
+def _collect_enrichment(futures):
+    enrichment = dict(EMPTY_ENRICHMENT)
+    status = {}
+    for name, future in futures.items():
+        if not future.done():
+            status[name] = "pending"
+            continue
+        try:
+            enrichment[name] = future.result()
+            status[name] = "ready"
+        except Exception as e:
+            status[name] = "unavailable"
+            record_error("llm", f"enrich/{name}", type(e).__name__)
+            logger.warning("Resume %s unavailable: %s", name, e)
+    enrichment["enrichment_status"] = status
+    return enrichment, status
+
+
+def _cache_when_ready(futures, digest):
+    # Pool threads have no app context of their own (the cache needs one)
+    app = current_app._get_current_object() if has_app_context() else None
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        enrichment, status = _collect_enrichment(futures)
+        if app is None or any(state != "ready" for state in status.values()):
+            return
+        with app.app_context():
+            resume_cache.put("llm", llm_key(digest, pipeline_version()), enrichment)
+
+    for future in futures.values():
+        future.add_done_callback(on_done)
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def _llm_pool():
+    # One pool per (Gunicorn worker) process; threads don't survive fork
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool_pid != pid:
+        with _pool_lock:
+            if _pool_pid != pid:
+                _pool = ThreadPoolExecutor(
+                    max_workers=LLM_ENRICH_WORKERS,
+                    thread_name_prefix="resume-llm",
+                )
+                _pool_pid = pid
+    return _pool
+
+
+# -------------------------------------------------
+# JOB STATE (submit / poll)
+# -------------------------------------------------
+# resume-job:<id>         hash: status, stage, error, partial results (JSON)
+# resume-job:<id>:upload  the uploaded bytes, removed by the extract stage
+#
+# status: queued -> running -> done | failed; stage: extract -> analyze
+# -> enrich. Each stage stores its result as soon as it has one, so a
+# poll after "analyze" already sees the ATS score.
+
+RESUME_JOB_TTL = int(os.getenv("RESUME_JOB_TTL", "3600"))
+
+_RESULT_FIELDS = ("analysis", "enrichment", "jobs_cache_key")
+
+redis_client = redis.Redis(
+    host="localhost",
+    port=6379,
+    db=2,
+)
+
+
+def job_key(job_id: str) -> str:
+    return f"resume-job:{job_id}"
+
+
+def create_job(filename: str, digest: str, data: bytes | None = None) -> str:
+    """A new queued job; ``data`` (the upload) is kept for the extract stage."""
+    job_id = uuid.uuid4().hex
+    key = job_key(job_id)
+    with redis_client.pipeline() as pipe:
+        pipe.hset(key, mapping={
+            "status": "queued",
+            "stage": "queued",
+            "filename": filename,
+            "digest": digest,
+            "updated_at": time.time(),
+        })
+        pipe.expire(key, RESUME_JOB_TTL)
+        if data is not None:
+            pipe.setex(key + ":upload", RESUME_JOB_TTL, data)
+        pipe.execute()
+    return job_id
+
+
+def take_upload(job_id: str) -> bytes:
+    """The job's uploaded bytes, deleted from Redis as they are read."""
+    data = redis_client.getdel(job_key(job_id) + ":upload")
+    if data is None:
+        raise LookupError(f"Upload for resume job {job_id} has expired")
+    return data
+
+
+def update_job(job_id: str, status: str, stage: str, error: str | None = None, **results):
+    """Record a status change (plus any partial results)."""
+    fields = {"status": status, "stage": stage, "updated_at": time.time()}
+    if error is not None:
+        fields["error"] = error
+    for name, value in results.items():
+        fields[name] = json.dumps(value)
+
+    key = job_key(job_id)
+    with redis_client.pipeline() as pipe:
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, RESUME_JOB_TTL)
+        pipe.execute()
+
+
+def get_job(job_id: str):
+    """
+    Returns:
+        dict | None: status, stage, error and the results merged so far
+        (analysis fields, then summary / skill_levels, jobs_cache_key)
+    """
+    raw = redis_client.hgetall(job_key(job_id))
+    if not raw:
+        return None
+    raw = {name.decode(): value.decode() for name, value in raw.items()}
+
+    result = {}
+    for name in _RESULT_FIELDS:
+        if name in raw:
+            value = json.loads(raw[name])
+            result.update(value if isinstance(value, dict) else {name: value})
+
+    job = {
+        "job_id": job_id,
+        "status": raw["status"],
+        "stage": raw["stage"],
+        "result": result,
+    }
+    if "error" in raw:
+        job["error"] = raw["error"]
+    return job
+
+
+@contextmanager
+def job_stage(job_id: str, stage: str):
+    """Mark ``stage`` running; an exception marks the job failed and is re-raised."""
+    update_job(job_id, "running", stage)
+    try:
+        yield
+    except Exception as e:
+        update_job(job_id, "failed", stage, error=str(e))
+        raise
@@ -1,88 +1,203 @@
-import re
+import json
+import os
+from backend.app.utils.metrics import instrument
+from backend.app.utils.resume_document import RUN_PATTERN, as_document, normalize_text
+
+TAXONOMY_PATH = os.getenv(
+    "SKILL_TAXONOMY_PATH",
+    os.path.abspath(os.path.join(
+        os.path.dirname(__file__), "..", "..", "ml", "data", "skill_taxonomy.json"
+    ))
+)
 
 # -------------------------------------------------
-# MASTER CS SKILL LIST (CURATED & EXPLAINABLE)
+# NORMALIZATION UTILITIES
 # -------------------------------------------------
 
-CS_SKILLS = {
-    # Programming Languages
-    "Python", "Java", "C", "C++", "JavaScript", "TypeScript", "Go", "Rust",
+def _normalize_text(text: str) -> str:
+    """
+    Normalize text for reliable matching.
+    """
+    return normalize_text(text)
 
-    # Data Science & ML
-    "Machine Learning", "Deep Learning", "Data Science", "Statistics",
-    "Pandas", "NumPy", "Scikit Learn", "TensorFlow", "PyTorch",
-    "NLP", "Computer Vision",
 
-    # Web Development
-    "HTML", "CSS", "React", "Angular", "Vue", "Node", "Express",
-    "Django", "Flask", "REST API",
+def _normalize_skill(skill: str) -> str:
+    """
+    Normalize skill names and aliases exactly like resume text, so
+    "Node.js" or "CI/CD" match "node js" / "ci cd" in the text.
+    """
+    return _normalize_text(skill)
 
-    # Databases
-    "SQL", "MySQL", "PostgreSQL", "MongoDB", "Redis",
 
-    # Cloud & DevOps
-    "AWS", "Azure", "GCP", "Docker", "Kubernetes",
-    "CI CD", "Jenkins", "GitHub Actions", "Terraform",
+# -------------------------------------------------
+# MULTI-PATTERN MATCHER
+# -------------------------------------------------
 
-    # Software Engineering
-    "Data Structures", "Algorithms", "OOP", "System Design",
-    "Design Patterns", "Microservices",
+# Normalized text only contains [a-z0-9+ ]. A regex word boundary sits
+# exactly where a run of word characters meets a run of anything else,
+# so a skill matches r"\b<skill>\b" iff its runs equal consecutive
+# runs of the text. Matching is one walk over the text's runs through
+# a trie of skill runs, independent of the number of skills.
+_SKILLS_KEY = None  # trie node key holding the skills that end there
 
-    # Tools
-    "Git", "GitHub", "Linux", "Shell Scripting"
-}
 
+def _is_word_run(run: str) -> bool:
+    return run[0].isalnum()
 
-# -------------------------------------------------
-# NORMALIZATION UTILITIES
-# -------------------------------------------------
 
-def _normalize_text(text: str) -> str:
+class SkillMatcher:
     """
-    Normalize text for reliable matching.
+    Finds every skill that a word-boundary regex per normalized term
+    would find, in one pass over the text.
+
+    ``terms`` is either an iterable of skill names or a mapping of
+    term (name or alias) -> canonical skill name.
     """
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9+ ]", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
 
+    def __init__(self, terms):
+        if not isinstance(terms, dict):
+            terms = {term: term for term in terms}
+
+        # Single-word terms (most of them) are found by one set
+        # intersection; only multi-run terms need the trie walk
+        self.words = {}
+        self.trie = {}
+        for term, skill in terms.items():
+            runs = RUN_PATTERN.findall(_normalize_skill(term))
+            if not runs:
+                continue
+            if len(runs) == 1 and _is_word_run(runs[0]):
+                skills = self.words.setdefault(runs[0], [])
+            else:
+                node = self.trie
+                for run in runs:
+                    node = node.setdefault(run, {})
+                skills = node.setdefault(_SKILLS_KEY, [])
+            if skill not in skills:
+                skills.append(skill)
+
+    def find(self, normalized_text: str):
+        """
+        Returns:
+            set: skills occurring in ``normalized_text``
+        """
+        return self.find_runs(RUN_PATTERN.findall(normalized_text))
+
+    def find_runs(self, runs):
+        """``find`` over already split runs (``ResumeDocument.runs``)."""
+        last = len(runs) - 1
+        found = set()
+
+        for run in self.words.keys() & set(runs):
+            found.update(self.words[run])
+
+        trie = self.trie
+        for start in [i for i, run in enumerate(runs) if run in trie]:
+            node = trie[runs[start]]
+            # A skill starting with "+" needs a word character before it
+            if start == 0 and not _is_word_run(runs[0]):
+                continue
+
+            end = start
+            while True:
+                skills = node.get(_SKILLS_KEY)
+                # ...and one ending with "+" needs a word character after it
+                if skills and (end < last or _is_word_run(runs[end])):
+                    found.update(skills)
+                end += 1
+                if end > last:
+                    break
+                node = node.get(runs[end])
+                if node is None:
+                    break
+
+        return found
 
-def _normalize_skill(skill: str) -> str:
+
+# -------------------------------------------------
+# SKILL TAXONOMY (backend/ml/data/skill_taxonomy.json)
+# -------------------------------------------------
+
+# Shorter aliases ("js", "ml") are ordinary words or abbreviations in
+# too many resumes to count as a skill on their own
+MIN_ALIAS_LENGTH = 3
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
     """
-    Normalize skill names to match normalized resume text.
+    Load and validate the skill taxonomy file.
+
+    Returns:
+        dict: {"version": str, "skills": [{"name", "category", "aliases"}]}
+    """
+    with open(path, encoding="utf-8") as f:
+        taxonomy = json.load(f)
+
+    owners = {}
+    for entry in taxonomy["skills"]:
+        if not entry.get("name") or not entry.get("category"):
+            raise ValueError(f"Taxonomy entry needs a name and a category: {entry}")
+
+        for alias in entry.get("aliases", []):
+            if len(_normalize_skill(alias).replace(" ", "")) < MIN_ALIAS_LENGTH:
+                raise ValueError(
+                    f"Alias {alias!r} ({entry['name']}) is shorter than {MIN_ALIAS_LENGTH} characters"
+                )
+
+        for term in [entry["name"], *entry.get("aliases", [])]:
+            key = _normalize_skill(term)
+            if not key:
+                raise ValueError(f"Skill term {term!r} ({entry['name']}) is empty once normalized")
+            owner = owners.setdefault(key, entry["name"])
+            if owner != entry["name"]:
+                raise ValueError(
+                    f"Skill term {term!r} maps to both {owner!r} and {entry['name']!r}"
+                )
+
+    return taxonomy
+
+
+def compile_taxonomy(taxonomy):
+    """
+    Returns:
+        SkillMatcher: every name and alias -> canonical skill name
     """
-    return skill.lower().replace(".", "").strip()
+    terms = {}
+    for entry in taxonomy["skills"]:
+        for term in [entry["name"], *entry.get("aliases", [])]:
+            terms[term] = entry["name"]
+    return SkillMatcher(terms)
+
+
+TAXONOMY = load_taxonomy()
+TAXONOMY_VERSION = TAXONOMY["version"]
+
+# Canonical skill names, and the category of each
+CS_SKILLS = {entry["name"] for entry in TAXONOMY["skills"]}
+SKILL_CATEGORIES = {entry["name"]: entry["category"] for entry in TAXONOMY["skills"]}
+
+_MATCHER = compile_taxonomy(TAXONOMY)
 
 
 # -------------------------------------------------
 # MAIN SKILL EXTRACTION FUNCTION
 # -------------------------------------------------
 
-def extract_skills(resume_text: str):
+@instrument("parser")
+def extract_skills(resume_text):
     """
-    Extract CS-related skills from resume text.
+    Extract CS-related skills from resume text. Aliases ("sklearn",
+    "k8s", "postgres") are reported under their canonical name.
 
     Args:
-        resume_text (str): Raw resume text
+        resume_text (str | ResumeDocument): Raw resume text
 
     Returns:
-        list: Sorted list of unique skills found
+        list: Sorted list of unique canonical skills found
     """
 
-    if not resume_text or not resume_text.strip():
+    document = as_document(resume_text)
+    if document.is_blank:
         return []
 
-    normalized_text = _normalize_text(resume_text)
-
-    found_skills = set()
-
-    for skill in CS_SKILLS:
-        skill_norm = _normalize_skill(skill)
-
-        # Word-boundary aware matching
-        pattern = r"\b" + re.escape(skill_norm) + r"\b"
-
-        if re.search(pattern, normalized_text):
-            found_skills.add(skill)
-
-    return sorted(found_skills)
+    return sorted(_MATCHER.find_runs(document.runs))
@@ -0,0 +1,137 @@
+"""
+Academic parsing: one search per degree/field pattern vs the single-pass scanner.
+
+Checks that extract_academics returns the same "degree" / "field" as
+the previous pattern-by-pattern search on resume-length texts built
+from domain_dataset.csv with education lines mixed in, plus a fuzz
+set of short texts made of pattern fragments, and checks the listed
+degree details on a few education sections (school lines and grades
+next to a degree). Then times, over the same texts (resumes per
+second, as in bulk cohort processing):
+
+- the previous "degree" / "field" search alone (reference),
+- the same plus one whole-word search per pattern to find every degree
+  / field mention, the input "degrees" needs,
+- extract_academics, which gets both from a single scan and also reads
+  each listed degree's details; it must not be slower than the search
+  per pattern.
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_academic_parser
+"""
+
+import argparse
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.app.utils.academic_parser import DEGREE_PATTERNS, FIELD_PATTERNS, extract_academics
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+EDUCATION_LINES = [
+    "B.Tech in Computer Science, IIT Bombay, 2018 - 2022, CGPA 8.6/10",
+    "Bachelor of Engineering (Information Technology), Pune University, 2016, 74%",
+    "M.Sc Data Science | University of Delhi | 2023 | 8.1 CGPA",
+    "MCA, NIT Trichy, 2021", "PhD in Machine Learning (pursuing)",
+    "Master of Technology in Software Engineering, 2020",
+]
+# Education sections -> (degree, institution, year, cgpa, percentage) per listed degree
+DETAIL_CASES = {
+    "B.Tech in Computer Science\nIIT Bombay, 2018 - 2022, CGPA 8.6/10\nClass XII, DPS R.K. Puram, 2018, 92.4%":
+        [("B.Tech", "IIT Bombay", 2022, 8.6, None)],
+    "B.Tech Computer Science, NIT Trichy 2022\nClass XII CBSE 92.4%":
+        [("B.Tech", "NIT Trichy", 2022, None, None)],
+    "M.Tech, Indian Institute of Science  GPA 9.1\nB.Tech, NIT Trichy, 2019, 8.2 CGPA":
+        [("M.Tech", "Indian Institute of Science", None, 9.1, None),
+         ("B.Tech", "NIT Trichy", 2019, 8.2, None)],
+    "M.Tech CSE\nIndian Institute of Science 2021 GPA 9.1\nDelhi Public School, 2015, 95%":
+        [("M.Tech", "Indian Institute of Science", 2021, 9.1, None)],
+}
+FRAGMENTS = ["b", "e", ".", "tech", "m", "sc", "ca", "ph", "d", "it", "ai", "cse", " ", "be", "me"]
+
+
+def legacy_academics(text):
+    """The pattern-by-pattern search the scanner replaces (reference output)."""
+    text = text.lower()
+    degree = next((d for d, p in DEGREE_PATTERNS.items() if re.search(p, text)), None)
+    field = next((f for f, p in FIELD_PATTERNS.items() if re.search(p, text)), None)
+    return degree, field
+
+
+def legacy_mentions(text):
+    """``legacy_academics`` plus every whole-word mention, one search per pattern."""
+    degree, field = legacy_academics(text)
+    lower = text.lower()
+    mentions = sorted(
+        (match.start(), name)
+        for patterns in (DEGREE_PATTERNS, FIELD_PATTERNS)
+        for name, pattern in patterns.items()
+        for match in re.finditer(rf"(?<![a-z0-9.]){pattern}(?![a-z0-9])", lower)
+    )
+    return degree, field, mentions
+
+
+def make_resumes(n, rows_per_resume, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = pd.read_csv(os.path.join(REPO_ROOT, "domain_dataset.csv"))["text"].dropna().astype(str).tolist()
+    return [
+        "\n".join([*rng.choice(rows, size=rows_per_resume),
+                   *rng.choice(EDUCATION_LINES, size=rng.integers(0, 3))])
+        for _ in range(n)
+    ]
+
+
+def fuzz_texts(n, seed=1):
+    rng = np.random.default_rng(seed)
+    return ["".join(rng.choice(FRAGMENTS, size=rng.integers(1, 10))) for _ in range(n)]
+
+
+def run(n, rows_per_resume, repeat):
+    resumes = make_resumes(n, rows_per_resume)
+
+    for text in [*resumes, *fuzz_texts(20000)]:
+        result = extract_academics(text)
+        if (result["degree"], result["field"]) != legacy_academics(text):
+            raise AssertionError(f"scanner differs from pattern-by-pattern search on {text!r}")
+
+    for text, expected in DETAIL_CASES.items():
+        listed = [
+            (entry["degree"], entry["institution"], entry["year"], entry["cgpa"], entry["percentage"])
+            for entry in extract_academics(text)["degrees"]
+        ]
+        if listed != expected:
+            raise AssertionError(f"degree details {listed} != {expected} for {text!r}")
+
+    def resumes_per_second(fn):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for text in resumes:
+                fn(text)
+            best = min(best, time.perf_counter() - start)
+        return n / best
+
+    listed = np.mean([len(extract_academics(text)["degrees"]) for text in resumes])
+    print(f"{n} resumes of ~{np.mean([len(t) for t in resumes]):.0f} chars, "
+          f"{listed:.1f} degrees listed per resume; degree/field identical")
+    print(f"{'degree/field only':<26}{resumes_per_second(legacy_academics):>10.0f} resumes/s   (reference)")
+    per_pattern = resumes_per_second(legacy_mentions)
+    print(f"{'pattern by pattern':<26}{per_pattern:>10.0f} resumes/s   (+ every mention)")
+    scanner = resumes_per_second(extract_academics)
+    print(f"{'single-pass scanner':<26}{scanner:>10.0f} resumes/s   (+ every mention, degree details)")
+    if scanner < per_pattern:
+        raise AssertionError("single-pass scanner is slower than one search per pattern")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=30, help="dataset rows joined per resume")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.resumes, args.rows, args.repeat)
@@ -0,0 +1,90 @@
+"""
+Bulk resume ingestion throughput: resumes per second through bulk_ingest.
+
+Builds a ZIP of --resumes one-page PDF resumes from domain_dataset.csv
+(plus a few broken members that must come back as error rows), runs
+bulk_ingest.ingest over it with 1 and with --workers processes, and
+checks that both runs return the same rows. LLM enrichment is off.
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_bulk_ingest
+    python -m backend.benchmarks.bench_bulk_ingest --resumes 5000 --workers 8
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import textwrap
+import time
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from backend.app.utils.bulk_ingest import ingest, zip_resumes
+from backend.benchmarks.bench_pdf_extraction import LINES_PER_PAGE, write_pdf
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+EXTRA_LINES = [
+    "EDUCATION", "B.Tech in Computer Science, 2018 - 2022, CGPA 8.4",
+    "EXPERIENCE", "Software Engineer, 2022 - present", "3+ years of experience with Python and k8s",
+]
+BROKEN = {"broken/not_a_pdf.pdf": b"plain text, not a PDF", "broken/empty.docx": b""}
+
+
+def make_archive(path, n, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = pd.read_csv(os.path.join(REPO_ROOT, "domain_dataset.csv"))["text"].dropna().astype(str).tolist()
+    with tempfile.TemporaryDirectory() as directory, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        pdf_path = os.path.join(directory, "resume.pdf")
+        for i in range(n):
+            lines = [line for row in rng.choice(rows, size=8) for line in textwrap.wrap(row, 90)]
+            write_pdf(pdf_path, [(EXTRA_LINES + lines)[:LINES_PER_PAGE]])
+            archive.write(pdf_path, f"resumes/resume_{i:05d}.pdf")
+        for name, data in BROKEN.items():
+            archive.writestr(name, data)
+
+
+def _run(path, workers, chunk_size):
+    with open(path, "rb") as f:
+        archive = io.BytesIO(f.read())
+    start = time.perf_counter()
+    rows = list(ingest(zip_resumes(archive), workers=workers, chunk_size=chunk_size))
+    return time.perf_counter() - start, sorted(rows, key=lambda row: row["file"])
+
+
+def run(n, workers, chunk_size):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "resumes.zip")
+        make_archive(path, n)
+        size = os.path.getsize(path)
+
+        results = {}
+        for count in sorted({1, workers}):
+            results[count] = _run(path, count, chunk_size)
+
+    baseline = results[1][1]
+    for count, (_, rows) in results.items():
+        if rows != baseline:
+            raise AssertionError(f"{count} workers return different rows than 1 worker")
+    errors = sum(row["status"] == "error" for row in baseline)
+    if errors != len(BROKEN):
+        raise AssertionError(f"expected {len(BROKEN)} error rows, got {errors}")
+
+    print(f"{len(baseline)} resumes ({size / 1e6:.1f} MB zip, {errors} broken); rows identical across runs "
+          f"({os.cpu_count()} CPUs here)")
+    for count, (elapsed, _) in results.items():
+        print(f"{count:>3} worker(s) {elapsed:>8.2f} s {len(baseline) / elapsed:>9.1f} resumes/s "
+              f"{elapsed / len(baseline) * 5000 / 60:>7.1f} min per 5,000")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=16)
+    args = parser.parse_args()
+
+    run(args.resumes, args.workers, args.chunk_size)
@@ -0,0 +1,88 @@
+"""
+Single-row latency: pandas.DataFrame path vs compiled feature rows.
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_feature_rows --repeat 2000
+"""
+
+import argparse
+import os
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from backend.app.ml_inference.feature_rows import CompiledPipeline
+from backend.app.ml_inference.model_loader import load_model
+
+DATA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "ml", "data")
+)
+
+
+def _student_records():
+    df = pd.read_csv(os.path.join(DATA_DIR, "student_performance.csv"))
+    for col in ("G1", "G2"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df.dropna().drop(columns=["G3"]).to_dict(orient="records")
+
+
+def _review_records():
+    texts = [
+        "great product works exactly as described would buy again",
+        "terrible quality broke after two days do not recommend",
+        "this is the best purchase i have ever made in my entire life amazing",
+    ]
+    return [
+        {"clean_text": t, "rating": r, "category": "Electronics_5"}
+        for t, r in zip(texts, (5, 1, 5))
+    ]
+
+
+def _time_per_call(fn, records, repeat):
+    n = len(records)
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn(records[i % n])
+    return (time.perf_counter() - start) / repeat
+
+
+def run(repeat):
+    cases = [
+        ("g1_model", "predict", _student_records()),
+        ("g2_model", "predict", _student_records()),
+        ("g3_model", "predict", _student_records()),
+        ("fake_review_hybrid_model", "predict_proba", _review_records()),
+    ]
+
+    print(f"{'model':<28}{'dataframe (us)':>16}{'compiled (us)':>16}{'speedup':>10}")
+
+    for name, method, records in cases:
+        pipeline = load_model(f"{name}.pkl")
+        compiled = CompiledPipeline(pipeline)
+
+        slow = getattr(pipeline, method)
+        fast = compiled.predict_one if method == "predict" else compiled.predict_proba_one
+
+        # Sanity check: both paths must agree exactly
+        for record in records[:50]:
+            expected = slow(pd.DataFrame([record]))[0]
+            assert np.array_equal(fast(record), expected), name
+
+        df_time = _time_per_call(lambda r: slow(pd.DataFrame([r])), records, repeat)
+        fast_time = _time_per_call(fast, records, repeat)
+
+        print(
+            f"{name:<28}{df_time * 1e6:>16.1f}{fast_time * 1e6:>16.1f}"
+            f"{df_time / fast_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=UserWarning)
+    run(args.repeat)
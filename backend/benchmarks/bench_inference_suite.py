@@ -0,0 +1,351 @@
+"""
+Latency / throughput suite for every ML entry point.
+
+Each entry point is timed at batch sizes 1, 32 and 1024 (p50/p95/p99
+per call and items per second). Inputs come from the datasets in
+backend/ml/data (or the repo root): student_performance.csv for the
+CGPA stages, domain_dataset.csv and job_role_dataset.csv for the resume
+models (several rows joined into one resume-length text),
+StressLevelDataset.csv for the stress forest.
+Missing text/stress datasets fall back to inputs generated from the
+model vocabularies / questionnaire ranges; entry points whose model
+artifacts are missing are skipped.
+
+Results are written as JSON; pass a previous run as --baseline to flag
+regressions (exit code 1 when any p50 or throughput is worse than
+--tolerance).
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_inference_suite --output bench.json
+    python -m backend.benchmarks.bench_inference_suite --baseline bench.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+from backend.app.ml_inference.model_loader import model_registry
+from backend.app.ml_inference import resume_classifier  # noqa: F401  registers "resume_classifier"
+from backend.app.ml_inference.resume_domain import predict_domain
+from backend.app.ml_inference.resume_job_role import predict_job_roles
+from backend.app.routes.ml import ROW_BUILDERS, STRESS_FEATURES, get_course_recommendations
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Datasets live in backend/ml/data; the resume datasets sit in the repo root
+DATA_DIRS = [os.path.join(REPO_ROOT, "backend", "ml", "data"), REPO_ROOT]
+
+BATCH_SIZES = [1, 32, 1024]
+
+# Resume-length inputs: this many dataset rows joined per text
+ROWS_PER_RESUME = (5, 15)
+
+# Upper bound of each questionnaire answer, in model feature order
+STRESS_FEATURE_MAX = np.array([21, 30, 1, 27, 5, 3, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 3, 5, 5, 5])
+
+
+# -------------------------------------------------
+# INPUTS
+# -------------------------------------------------
+
+def _read_csv(name):
+    for directory in DATA_DIRS:
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            return pd.read_csv(path)
+    return None
+
+
+def _resume_texts(csv_name, vectorizer_name, n, rng):
+    df = _read_csv(csv_name)
+    if df is not None and "text" in df:
+        rows = df["text"].dropna().astype(str).tolist()
+        source = csv_name
+    else:
+        # No dataset: sentences made of the model's own vocabulary
+        rows = [" ".join(rng.choice(list(model_registry.get(vectorizer_name).vocabulary_), 12))
+                for _ in range(500)]
+        source = f"{vectorizer_name} vocabulary"
+
+    low, high = ROWS_PER_RESUME
+    texts = [
+        " ".join(rng.choice(rows, size=rng.integers(low, high + 1)))
+        for _ in range(n)
+    ]
+    return texts, source
+
+
+def _student_records(stage, n, rng):
+    df = _read_csv("student_performance.csv")
+    # Stage 1 predicts G1 (no grades known), stage 2 knows G1, stage 3 knows G1 + G2
+    drop = {1: ["G1", "G2", "G3"], 2: ["G2", "G3"], 3: ["G3"]}[stage]
+    df = df.drop(columns=drop)
+    for column in ("G1", "G2"):
+        if column in df:
+            df[column] = pd.to_numeric(df[column], errors="coerce").fillna(0)
+    sample = df.iloc[rng.integers(0, len(df), size=n)]
+    return sample.to_dict(orient="records"), "student_performance.csv"
+
+
+def _stress_rows(n, rng):
+    df = _read_csv("StressLevelDataset.csv")
+    if df is not None and set(STRESS_FEATURES) <= set(df.columns):
+        X = df[STRESS_FEATURES].to_numpy(dtype=np.float64)
+        return X[rng.integers(0, len(X), size=n)], "StressLevelDataset.csv"
+
+    X = rng.integers(0, STRESS_FEATURE_MAX + 1, size=(n, len(STRESS_FEATURE_MAX)))
+    return X.astype(np.float64), "questionnaire ranges"
+
+
+def _course_names(n, rng):
+    names = model_registry.get("course_dataset")["Course Name"].dropna().tolist()
+    return [names[i] for i in rng.integers(0, len(names), size=n)], "course_recommender_dataset.pkl"
+
+
+def _course_queries(n, rng):
+    """Autocomplete queries: full names, prefixes, one-typo names and no-match strings."""
+    names, source = _course_names(n, rng)
+    letters = list("abcdefghijklmnopqrstuvwxyz")
+    queries = []
+    for i, name in enumerate(names):
+        kind = i % 4
+        if kind == 0:
+            queries.append(name)
+        elif kind == 1:
+            queries.append(name[:max(3, len(name) // 2)])
+        elif kind == 2:
+            typo = int(rng.integers(0, len(name)))
+            queries.append(name[:typo] + rng.choice(letters) + name[typo + 1:])
+        else:
+            # Nothing in the catalog is close: every tier comes up empty
+            queries.append(" ".join("".join(rng.choice(list("qxzjvkw"), size=5)) for _ in range(2)))
+    return queries, source
+
+
+# -------------------------------------------------
+# ENTRY POINTS: name -> (inputs(n, rng), run(batch))
+# -------------------------------------------------
+# ``run`` takes a list/array of inputs and scores them the way the app
+# does: batch size 1 goes through the single-item function the routes
+# call, larger batches through the vectorized path where one exists.
+
+def _predict_domain(texts):
+    if len(texts) == 1:
+        return [predict_domain(texts[0])]
+    vectorizer = model_registry.get("domain_vectorizer")
+    return model_registry.get("domain_model").predict(
+        vectorizer.transform([t.lower().strip() for t in texts])
+    )
+
+
+def _predict_job_roles(texts):
+    if len(texts) == 1:
+        return [predict_job_roles(texts[0])]
+    model = model_registry.get("job_role_model")
+    scores = model.decision_function(
+        model_registry.get("job_role_vectorizer").transform([t.lower().strip() for t in texts])
+    )
+    return [model.classes_[np.argsort(row)[::-1][:3]] for row in scores]
+
+
+def _classify_resume(texts):
+    return model_registry.get("resume_classifier").classify_many(list(texts))
+
+
+def _cgpa_stage(stage):
+    model_name = f"g{stage}_model"
+
+    def run(records):
+        if len(records) == 1:
+            rows = model_registry.get(ROW_BUILDERS[model_name])
+            if rows is not None:
+                return [rows.predict_one(records[0])]
+        return model_registry.get(model_name).predict(pd.DataFrame(records))
+
+    return run
+
+
+def _stress_forest(X):
+    return model_registry.get("stress_forest").predict_with_proba(X)
+
+
+def _course_search(queries):
+    index = model_registry.get("course_index")
+    return [index.search(query, limit=10) for query in queries]
+
+
+def _course_recommendations(names):
+    return [get_course_recommendations(name, top_n=5) for name in names]
+
+
+ENTRY_POINTS = {
+    "predict_domain": (
+        lambda n, rng: _resume_texts("domain_dataset.csv", "domain_vectorizer", n, rng),
+        _predict_domain,
+    ),
+    "predict_job_roles": (
+        lambda n, rng: _resume_texts("job_role_dataset.csv", "job_role_vectorizer", n, rng),
+        _predict_job_roles,
+    ),
+    "classify_resume": (
+        lambda n, rng: _resume_texts("domain_dataset.csv", "domain_vectorizer", n, rng),
+        _classify_resume,
+    ),
+    "cgpa_stage1": (lambda n, rng: _student_records(1, n, rng), _cgpa_stage(1)),
+    "cgpa_stage2": (lambda n, rng: _student_records(2, n, rng), _cgpa_stage(2)),
+    "cgpa_stage3": (lambda n, rng: _student_records(3, n, rng), _cgpa_stage(3)),
+    "stress_forest": (_stress_rows, _stress_forest),
+    "course_recommendations": (_course_names, _course_recommendations),
+    "course_search": (_course_queries, _course_search),
+}
+
+
+# -------------------------------------------------
+# MEASUREMENT
+# -------------------------------------------------
+
+def _measure(run, inputs, batch_size, min_time, min_calls, max_calls):
+    n = len(inputs)
+    run(inputs[:batch_size])  # warm caches / lazy loads
+
+    latencies = []
+    start = time.perf_counter()
+    offset = 0
+    while len(latencies) < max_calls and (
+        len(latencies) < min_calls or time.perf_counter() - start < min_time
+    ):
+        if offset + batch_size > n:
+            offset = 0
+        batch = inputs[offset:offset + batch_size]
+        offset += batch_size
+
+        t0 = time.perf_counter()
+        run(batch)
+        latencies.append(time.perf_counter() - t0)
+
+    latencies = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        "calls": len(latencies),
+        "p50_ms": round(float(p50), 4),
+        "p95_ms": round(float(p95), 4),
+        "p99_ms": round(float(p99), 4),
+        "mean_ms": round(float(latencies.mean()), 4),
+        "throughput_per_s": round(batch_size * 1000 / float(latencies.mean()), 1),
+    }
+
+
+def run_suite(names, batch_sizes, min_time, min_calls, max_calls, seed=0):
+    results = {}
+    sources = {}
+    pool_size = 2 * max(batch_sizes)
+
+    for name in names:
+        make_inputs, run = ENTRY_POINTS[name]
+        rng = np.random.default_rng(seed)
+        try:
+            inputs, source = make_inputs(pool_size, rng)
+        except (FileNotFoundError, KeyError) as e:
+            print(f"{name:<24} skipped: {e}")
+            continue
+
+        sources[name] = source
+        results[name] = {}
+        for batch_size in batch_sizes:
+            stats = _measure(run, inputs, batch_size, min_time, min_calls, max_calls)
+            results[name][str(batch_size)] = stats
+            print(
+                f"{name:<24}{batch_size:>6}{stats['p50_ms']:>11.3f}{stats['p95_ms']:>11.3f}"
+                f"{stats['p99_ms']:>11.3f}{stats['throughput_per_s']:>14.1f}"
+            )
+
+    return results, sources
+
+
+def _metadata(sources):
+    return {
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "inputs": sources,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns:
+        list[str]: regressions, one line each
+    """
+    regressions = []
+    print(f"\n{'vs baseline':<24}{'batch':>6}{'p50':>11}{'throughput':>14}")
+
+    for name, by_size in results.items():
+        for size, stats in by_size.items():
+            base = baseline.get("results", {}).get(name, {}).get(size)
+            if base is None:
+                continue
+            p50_change = stats["p50_ms"] / base["p50_ms"] - 1 if base["p50_ms"] else 0.0
+            tput_change = stats["throughput_per_s"] / base["throughput_per_s"] - 1 \
+                if base["throughput_per_s"] else 0.0
+            flag = ""
+            if p50_change > tolerance or tput_change < -tolerance:
+                flag = "  REGRESSION"
+                regressions.append(
+                    f"{name} @ {size}: p50 {p50_change:+.0%}, throughput {tput_change:+.0%}"
+                )
+            print(f"{name:<24}{size:>6}{p50_change:>+11.0%}{tput_change:>+14.0%}{flag}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(ENTRY_POINTS), default=list(ENTRY_POINTS))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=BATCH_SIZES)
+    parser.add_argument("--min-time", type=float, default=1.0,
+                        help="seconds spent per entry point and batch size")
+    parser.add_argument("--min-calls", type=int, default=20)
+    parser.add_argument("--max-calls", type=int, default=5000)
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown before a result counts as a regression")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    print(f"{'entry point':<24}{'batch':>6}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'items/s':>14}")
+    results, sources = run_suite(
+        args.only, args.batch_sizes, args.min_time, args.min_calls, args.max_calls
+    )
+    report = {"meta": _metadata(sources), "results": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Resume LLM enrichment latency: sequential calls vs the concurrent enrich().
+
+Simulates the providers behind call_llm with a latency distribution
+(log-normal around --median seconds, plus a --slow share of requests
+that take the full provider timeout) by replacing requests.post in
+llm_router for the duration of the run. Reports p50 / p95 / max
+end-to-end latency of the summary + skill-level enrichment, run one
+after the other (the old analyze_resume) and concurrently with the
+shared deadline.
+
+Times are scaled by --scale so a run takes seconds; pass --scale 1 for
+real-time latencies.
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_llm_enrichment
+    python -m backend.benchmarks.bench_llm_enrichment --requests 200 --slow 0.1
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from backend.app.llm import llm_router
+from backend.app.llm.resume_summary import generate_resume_summary
+from backend.app.llm.skill_level_inferencer import infer_skill_levels
+from backend.app.utils import resume_pipeline
+
+ANALYSIS = {
+    "domain": "Web Development",
+    "job_roles": ["Backend Developer", "Full Stack Developer"],
+    "skills": ["Python", "Flask", "SQL", "Docker"],
+    "experience": {"experience_level": "Fresher", "years": 0},
+    "academics": {"degree": "B.Tech", "field": "Computer Science"},
+    "ats_score": 72,
+}
+RESUME_TEXT = "Python developer. Built Flask APIs backed by SQL, shipped with Docker."
+
+
+class _Response:
+    def __init__(self, content):
+        self._content = content
+
+    def json(self):
+        return {"choices": [{"message": {"content": self._content}}]}
+
+
+def _fake_post(rng, median, slow, scale):
+    def post(url, headers=None, json=None, timeout=None):
+        if rng.random() < slow:
+            # A stalled provider: the request runs into its timeout
+            time.sleep(timeout * scale)
+            raise TimeoutError("simulated provider timeout")
+        time.sleep(rng.lognormal(np.log(median), 0.5) * scale)
+        prompt = json["messages"][0]["content"]
+        return _Response('{"Python": "Advanced"}' if "STRICT JSON" in prompt else "Summary.")
+    return post
+
+
+def sequential():
+    llm_context = {key: ANALYSIS[key] for key in resume_pipeline.LLM_CONTEXT_FIELDS}
+    try:
+        generate_resume_summary(llm_context)
+        infer_skill_levels(RESUME_TEXT, ANALYSIS["skills"])
+    except Exception:
+        pass
+
+
+def concurrent(deadline):
+    # No digest: nothing is cached between runs
+    return resume_pipeline.enrich(ANALYSIS, RESUME_TEXT, deadline=deadline)
+
+
+def _percentiles(samples):
+    samples = np.asarray(samples)
+    return np.percentile(samples, 50), np.percentile(samples, 95), samples.max()
+
+
+def run(n, median, slow, scale, seed=0):
+    original_post = llm_router.requests.post
+    llm_router.requests.post = _fake_post(np.random.default_rng(seed), median, slow, scale)
+    # Provider timeouts shrink with the simulated latencies
+    timeout_default = llm_router.call_llm.__defaults__
+    llm_router.call_llm.__defaults__ = (timeout_default[0] * scale, None)
+    deadline = resume_pipeline.LLM_ENRICH_DEADLINE * scale
+
+    try:
+        timings = {"sequential": [], "concurrent": []}
+        pending = 0
+        for _ in range(n):
+            start = time.perf_counter()
+            sequential()
+            timings["sequential"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            enrichment = concurrent(deadline)
+            timings["concurrent"].append(time.perf_counter() - start)
+            pending += "pending" in enrichment["enrichment_status"].values()
+    finally:
+        llm_router.requests.post = original_post
+        llm_router.call_llm.__defaults__ = timeout_default
+
+    print(f"{n} enrichments, provider median {median:.1f} s, {slow:.0%} stalled requests, "
+          f"times in real-world seconds (scale {scale})")
+    print(f"{'':<12}{'p50':>9}{'p95':>9}{'max':>9}")
+    for name, samples in timings.items():
+        p50, p95, worst = (t / scale for t in _percentiles(samples))
+        print(f"{name:<12}{p50:>8.2f}s{p95:>8.2f}s{worst:>8.2f}s")
+    print(f"concurrent runs returning a pending field at the "
+          f"{resume_pipeline.LLM_ENRICH_DEADLINE:.0f} s deadline: {pending}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--median", type=float, default=3.0, help="median provider latency (s)")
+    parser.add_argument("--slow", type=float, default=0.05, help="share of stalled provider requests")
+    parser.add_argument("--scale", type=float, default=0.01, help="simulated time / real time")
+    args = parser.parse_args()
+
+    # Every simulated stall would log a provider warning
+    logging.disable(logging.WARNING)
+    run(args.requests, args.median, args.slow, args.scale)
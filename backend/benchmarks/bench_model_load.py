@@ -0,0 +1,96 @@
+"""
+Model load time: pickles (joblib) vs checksummed array artifacts.
+
+Times each exported model both ways in this process, then the cold
+start of a fresh interpreter warming the same registry entries with
+MODEL_ARRAY_ARTIFACTS=0 and =1. Export first:
+    python -m backend.ml.scripts.export_model_arrays
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_model_load
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import warnings
+
+from backend.app.ml_inference.array_artifacts import ARRAY_DIR, load_array_model, manifest_path
+from backend.app.ml_inference.model_loader import MODEL_DIR, load_model
+
+# Registry entry -> pickle, for everything the array format covers
+EXPORTABLE = {
+    "course_tfidf": "course_recommender_tfidf.pkl",
+    "domain_model": "domain_model.pkl",
+    "domain_vectorizer": "domain_vectorizer.pkl",
+    "job_role_model": "job_role_model.pkl",
+    "job_role_vectorizer": "job_role_vectorizer.pkl",
+    "stress_model": "stress_level_random_forest.pkl",
+    "stress_scaler": "stress_level_scaler.pkl",
+}
+
+_COLD_START = """
+import time, warnings
+warnings.filterwarnings("ignore")
+start = time.perf_counter()
+from backend.app.ml_inference.model_loader import model_registry
+model_registry.warmup({names!r})
+print(time.perf_counter() - start)
+"""
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _cold_start(names, use_arrays, repeat):
+    env = dict(os.environ, MODEL_ARRAY_ARTIFACTS="1" if use_arrays else "0")
+    code = _COLD_START.format(names=names)
+    times = [
+        float(subprocess.run(
+            [sys.executable, "-c", code], env=env, check=True,
+            capture_output=True, text=True
+        ).stdout.strip().splitlines()[-1])
+        for _ in range(repeat)
+    ]
+    return min(times)
+
+
+def run(repeat):
+    exported = {
+        name: filename for name, filename in EXPORTABLE.items()
+        if os.path.exists(manifest_path(
+            os.path.join(MODEL_DIR, ARRAY_DIR, os.path.splitext(filename)[0])
+        ))
+    }
+    if not exported:
+        sys.exit("No array artifacts found; run backend.ml.scripts.export_model_arrays first")
+
+    print(f"{'model':<22}{'pickle':>12}{'arrays':>12}")
+    for name, filename in exported.items():
+        base_path = os.path.join(MODEL_DIR, ARRAY_DIR, os.path.splitext(filename)[0])
+        pickle_time = _best_of(lambda: load_model(filename), repeat)
+        array_time = _best_of(lambda: load_array_model(base_path), repeat)
+        print(f"{name:<22}{pickle_time * 1e3:>9.2f} ms{array_time * 1e3:>9.2f} ms")
+
+    names = list(exported)
+    cold_pickle = _cold_start(names, use_arrays=False, repeat=3)
+    cold_arrays = _cold_start(names, use_arrays=True, repeat=3)
+    print(f"{'cold start':<22}{cold_pickle * 1e3:>9.0f} ms{cold_arrays * 1e3:>9.0f} ms"
+          "   (fresh interpreter: imports + loads)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=UserWarning)
+    run(args.repeat)
@@ -0,0 +1,146 @@
+"""
+PDF text extraction: pdfplumber layout engine vs the fast pdfium engine.
+
+Times the layout engine on each sample resume in one process and
+page-parallel (the process pool used for layout documents of
+RESUME_PDF_PARALLEL_MIN_PAGES pages or more), the fast engine in one
+process, and reports how many of the layout engine's words the fast
+engine also finds.
+
+Without --pdf-dir, sample resumes of 1, 2, 4 and 8 pages are generated
+from domain_dataset.csv (plain Helvetica text PDFs).
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_pdf_extraction
+    python -m backend.benchmarks.bench_pdf_extraction --pdf-dir path/to/resumes
+"""
+
+import argparse
+import os
+import tempfile
+import textwrap
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.app.utils import resume_parser
+from backend.app.utils.resume_parser import _extract_page_range, _extract_pages, _page_count
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+LINES_PER_PAGE = 60
+
+
+# -------------------------------------------------
+# SAMPLE RESUMES
+# -------------------------------------------------
+
+def _escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path, pages):
+    """Minimal PDF: one Helvetica text block per page (pages: list of line lists)."""
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % i for i in page_ids)
+           + b"] /Count %d >>" % len(pages),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, lines in zip(page_ids, pages):
+        stream = ("BT /F1 10 Tf 12 TL 50 800 Td "
+                  + " T* ".join(f"({_escape(line)}) Tj" for line in lines)
+                  + " ET").encode("latin-1", "replace")
+        objects[page_id] = (b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (page_id + 1))
+        objects[page_id + 1] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(out)
+        out += b"%d 0 obj\n" % number + objects[number] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offsets[n] for n in sorted(objects))
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def make_samples(directory, page_counts, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = pd.read_csv(os.path.join(REPO_ROOT, "domain_dataset.csv"))["text"].dropna().astype(str).tolist()
+    paths = []
+    for pages in page_counts:
+        lines = [
+            line
+            for row in rng.choice(rows, size=pages * LINES_PER_PAGE)
+            for line in textwrap.wrap(row, 90)
+        ][:pages * LINES_PER_PAGE]
+        path = os.path.join(directory, f"resume_{pages}p.pdf")
+        write_pdf(path, [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)])
+        paths.append(path)
+    return paths
+
+
+# -------------------------------------------------
+# MEASUREMENT
+# -------------------------------------------------
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def _word_recall(fast, layout):
+    layout_words = set(layout.lower().split())
+    return len(layout_words & set(fast.lower().split())) / len(layout_words) if layout_words else 1.0
+
+
+def run(paths, repeat):
+    # Let the parallel path kick in for every multi-page sample
+    resume_parser.PDF_PARALLEL_MIN_PAGES = 2
+
+    print(f"{'file':<24}{'pages':>6}{'layout':>11}{'layout ||':>11}{'fast':>11}"
+          f"{'speedup':>9}{'recall':>8}")
+    for path in paths:
+        pages = _page_count(path)
+        timings = {
+            "layout": _best_of(lambda: _extract_page_range(path, "layout", 0, pages), repeat),
+            "layout ||": _best_of(lambda: _extract_pages(path, "layout"), repeat) if pages > 1 else None,
+            "fast": _best_of(lambda: _extract_pages(path, "fast"), repeat),
+        }
+        recall = _word_recall(
+            "\n".join(_extract_page_range(path, "fast", 0, pages)),
+            "\n".join(_extract_page_range(path, "layout", 0, pages)),
+        )
+        cells = "".join(f"{t:>8.1f} ms" if t is not None else f"{'-':>11}" for t in timings.values())
+        print(f"{os.path.basename(path)[:23]:<24}{pages:>6}{cells}"
+              f"{timings['layout'] / timings['fast']:>8.0f}x{recall:>8.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pdf-dir", help="directory of sample resume PDFs")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="page counts of the generated samples")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.pdf_dir:
+        paths = sorted(
+            os.path.join(args.pdf_dir, name) for name in os.listdir(args.pdf_dir)
+            if name.lower().endswith(".pdf")
+        )
+        run(paths, args.repeat)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            run(make_samples(directory, args.pages), args.repeat)
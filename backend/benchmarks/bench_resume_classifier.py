@@ -0,0 +1,123 @@
+"""
+Resume classification: two vectorizer passes vs one shared tokenization.
+
+Checks that domain and job roles are identical, then times both paths
+per resume. Pass real resumes with --pdf; otherwise synthetic resumes of
+--pages pages (~450 words each) are generated from the model vocabularies.
+
+Then times batches of one-page resumes (--batch sizes, as bulk analysis
+sends them): one ``transform`` per vectorizer over the whole batch vs
+``classify_many``.
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_resume_classifier --pages 2 10 40
+    python -m backend.benchmarks.bench_resume_classifier --pdf cv1.pdf cv2.pdf
+"""
+
+import argparse
+import random
+import time
+import warnings
+
+from backend.app.ml_inference.model_loader import model_registry
+from backend.app.ml_inference.resume_classifier import ResumeClassifier, classify_resume
+from backend.app.ml_inference.resume_domain import predict_domain
+from backend.app.ml_inference.resume_job_role import predict_job_roles
+
+WORDS_PER_PAGE = 450
+
+FILLER = (
+    "responsible for the design and delivery of projects with cross functional "
+    "teams, improved reliability, mentored junior members and wrote documentation"
+).split()
+
+
+def _synthetic_resume(pages, seed=0):
+    rng = random.Random(seed)
+    terms = [
+        term
+        for name in ("domain_vectorizer", "job_role_vectorizer")
+        for term in model_registry.get(name).vocabulary_
+    ]
+    words = [
+        rng.choice(terms) if rng.random() < 0.3 else rng.choice(FILLER)
+        for _ in range(pages * WORDS_PER_PAGE)
+    ]
+    return " ".join(words)
+
+
+def _separate(text):
+    return {"domain": predict_domain(text), "job_roles": predict_job_roles(text)}
+
+
+def _separate_many(texts, top_n=3):
+    domains = model_registry.get("domain_model").predict(
+        model_registry.get("domain_vectorizer").transform(texts)
+    )
+    job_model = model_registry.get("job_role_model")
+    scores = job_model.decision_function(model_registry.get("job_role_vectorizer").transform(texts))
+    return [
+        {"domain": domain, "job_roles": [job_model.classes_[i] for i in row.argsort()[::-1][:top_n]]}
+        for domain, row in zip(domains, scores)
+    ]
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(resumes, repeat):
+    model_registry.warmup(["resume_classifier"])
+
+    print(f"{'resume':<24}{'chars':>9}{'separate':>12}{'shared':>12}{'saving':>9}")
+    for label, text in resumes:
+        assert classify_resume(text) == _separate(text), f"{label}: result mismatch"
+
+        separate = _best_of(lambda: _separate(text), repeat)
+        shared = _best_of(lambda: classify_resume(text), repeat)
+        print(
+            f"{label:<24}{len(text):>9}{separate * 1e3:>9.2f} ms{shared * 1e3:>9.2f} ms"
+            f"{(1 - shared / separate) * 100:>8.0f}%"
+        )
+
+
+def run_batches(sizes, repeat):
+    classifier = model_registry.get("resume_classifier")
+    assert isinstance(classifier, ResumeClassifier)
+
+    print(f"\n{'batch':<24}{'separate':>12}{'shared':>12}{'saving':>9}   (resumes/s)")
+    for size in sizes:
+        texts = [_synthetic_resume(1, seed=seed) for seed in range(size)]
+        assert classifier.classify_many(texts) == _separate_many(texts), f"batch {size}: result mismatch"
+
+        separate = _best_of(lambda: _separate_many(texts), repeat)
+        shared = _best_of(lambda: classifier.classify_many(texts), repeat)
+        print(
+            f"{size:<24}{size / separate:>12.0f}{size / shared:>12.0f}"
+            f"{(1 - shared / separate) * 100:>8.0f}%"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 5, 10, 40])
+    parser.add_argument("--pdf", nargs="+", default=[])
+    parser.add_argument("--batch", type=int, nargs="+", default=[16, 256, 1024])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    if args.pdf:
+        from backend.app.utils.resume_parser import extract_text
+        resumes = [(path[-24:], extract_text(path)) for path in args.pdf]
+    else:
+        resumes = [(f"{pages} page(s)", _synthetic_resume(pages)) for pages in args.pages]
+
+    run(resumes, args.repeat)
+    run_batches(args.batch, max(1, args.repeat // 5))
@@ -0,0 +1,109 @@
+"""
+Resume analysis CPU time: raw text per parser vs one shared ResumeDocument.
+
+Runs the parsers analyze_resume uses (skills, experience, academics,
+domain + job roles) over resume-length texts built from
+domain_dataset.csv, once handing every parser the raw string (each
+lowercases / normalizes / scans on its own) and once handing them the
+same ResumeDocument. Outputs must be identical.
+
+Each pass analyzes every resume twice in a row (raw, then shared), so
+machine noise hits both sides alike; each parser's time is summed per
+pass with perf_counter_ns and the median over the passes is reported,
+per parser and in total.
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_resume_document
+"""
+
+import argparse
+import os
+import statistics
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from backend.app.ml_inference.model_loader import model_registry
+from backend.app.ml_inference import resume_classifier  # noqa: F401  registers "resume_classifier"
+from backend.app.utils.academic_parser import extract_academics
+from backend.app.utils.experience_parser import extract_experience
+from backend.app.utils.resume_document import ResumeDocument
+from backend.app.utils.skill_extractor import extract_skills
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+EXTRA_LINES = [
+    "EDUCATION", "B.Tech in Computer Science, 2018 - 2022, CGPA 8.4",
+    "EXPERIENCE", "Software Engineer, 2022 - present", "3+ years of experience with Python and k8s",
+]
+
+
+def make_resumes(n, rows_per_resume, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = pd.read_csv(os.path.join(REPO_ROOT, "domain_dataset.csv"))["text"].dropna().astype(str).tolist()
+    return [
+        "\n".join([*rng.choice(rows, size=rows_per_resume), *EXTRA_LINES])
+        for _ in range(n)
+    ]
+
+
+def parsers(classifier):
+    return {
+        "skills": extract_skills,
+        "experience": extract_experience,
+        "academics": extract_academics,
+        "domain + job roles": classifier.classify,
+    }
+
+
+def analyze(resume, classifier):
+    return tuple(parse(resume) for parse in parsers(classifier).values())
+
+
+def run(n, rows_per_resume, repeat):
+    resumes = make_resumes(n, rows_per_resume)
+    classifier = model_registry.get("resume_classifier")
+    steps = parsers(classifier)
+
+    for text in resumes:
+        if analyze(text, classifier) != analyze(ResumeDocument(text), classifier):
+            raise AssertionError("ResumeDocument changes a parser's output")
+
+    def timed_analysis(resume, spent):
+        for name, parse in steps.items():
+            start = time.perf_counter_ns()
+            parse(resume)
+            spent[name] += time.perf_counter_ns() - start
+
+    passes = {"raw": [], "shared": []}
+    for _ in range(repeat):
+        raw, shared = dict.fromkeys(steps, 0), dict.fromkeys(steps, 0)
+        for text in resumes:
+            timed_analysis(text, raw)
+            timed_analysis(ResumeDocument(text), shared)
+        passes["raw"].append(raw)
+        passes["shared"].append(shared)
+
+    def median_us(mode, name=None):
+        totals = [sum(spent.values()) if name is None else spent[name] for spent in passes[mode]]
+        return statistics.median(totals) / n / 1e3
+
+    print(f"{n} resumes of ~{np.mean([len(t) for t in resumes]):.0f} chars; outputs identical; "
+          f"median of {repeat} passes")
+    print(f"{'us / resume':<20}{'raw text':>10}{'shared':>10}")
+    for name in [*steps, None]:
+        raw, shared = median_us("raw", name), median_us("shared", name)
+        print(f"{name or 'total':<20}{raw:>10.1f}{shared:>10.1f}   ({shared / raw - 1:+.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=20, help="dataset rows joined per resume")
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=UserWarning)
+    run(args.resumes, args.rows, args.repeat)
@@ -0,0 +1,161 @@
+"""
+Skill extraction: one regex per skill vs the compiled SkillMatcher.
+
+Builds a synthetic taxonomy (CS_SKILLS padded to --skills entries with
+multi-word, dotted and "+"-suffixed names) and long resumes that mix
+taxonomy entries, filler words and punctuation. Both implementations
+must return identical results on every resume (plus a fuzz set of
+short texts over a tiny alphabet). The regex loop is timed on that
+single checking pass (it takes seconds per resume at this taxonomy
+size); the matcher is best of --repeat.
+
+--scaling then times the matcher alone on the same resumes with
+taxonomies from the shipped skill_taxonomy.json up to 50,000 entries.
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_skill_matcher
+    python -m backend.benchmarks.bench_skill_matcher --skills 5000 --words 5000
+    python -m backend.benchmarks.bench_skill_matcher --scaling
+"""
+
+import argparse
+import re
+import time
+
+import numpy as np
+
+from backend.app.utils.skill_extractor import (
+    CS_SKILLS,
+    SkillMatcher,
+    _normalize_skill,
+    _normalize_text,
+)
+
+SYLLABLES = ["ka", "lo", "mi", "net", "py", "sql", "dev", "ops", "go", "js", "tor", "ix"]
+FILLER = ["developed", "team", "using", "and", "with", "projects", "built", "the", "for", "data"]
+PUNCTUATION = [",", ".", " / ", " - ", "; ", " (", ") ", "\n", " + ", "++"]
+
+
+def legacy_extract(resume_text, skills):
+    """The per-skill regex loop SkillMatcher replaces (reference output)."""
+    if not resume_text or not resume_text.strip():
+        return []
+
+    normalized_text = _normalize_text(resume_text)
+    found_skills = set()
+    for skill in skills:
+        pattern = r"\b" + re.escape(_normalize_skill(skill)) + r"\b"
+        if re.search(pattern, normalized_text):
+            found_skills.add(skill)
+    return sorted(found_skills)
+
+
+def matcher_extract(resume_text, matcher):
+    if not resume_text or not resume_text.strip():
+        return []
+    return sorted(matcher.find(_normalize_text(resume_text)))
+
+
+def _word(rng):
+    return "".join(rng.choice(SYLLABLES, size=rng.integers(1, 4)))
+
+
+def make_taxonomy(n, rng):
+    skills = set(CS_SKILLS)
+    while len(skills) < n:
+        name = " ".join(_word(rng) for _ in range(rng.integers(1, 4)))
+        shape = rng.integers(0, 6)
+        if shape == 0:
+            name += "++"
+        elif shape == 1:
+            name = name.replace(" ", ".", 1)
+        elif shape == 2:
+            name = name.title()
+        skills.add(name)
+    return sorted(skills)
+
+
+def make_resume(skills, n_words, rng):
+    parts = []
+    for _ in range(n_words):
+        roll = rng.random()
+        if roll < 0.05:
+            parts.append(str(rng.choice(skills)))
+        elif roll < 0.5:
+            parts.append(_word(rng))
+        else:
+            parts.append(str(rng.choice(FILLER)))
+        parts.append(str(rng.choice(PUNCTUATION)) if rng.random() < 0.2 else " ")
+    return "".join(parts)
+
+
+def fuzz_texts(n, rng):
+    alphabet = list("ab+ c.")
+    return ["".join(rng.choice(alphabet, size=rng.integers(0, 12))) for _ in range(n)]
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_skills, n_resumes, n_words, repeat, seed=0):
+    rng = np.random.default_rng(seed)
+    skills = make_taxonomy(n_skills, rng)
+    resumes = [make_resume(skills, n_words, rng) for _ in range(n_resumes)]
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(skills)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    fuzz_skills = ["a", "b", "a b", "a+", "+a", "a++", "b+ a", "c", "c++", "a.b", "+", " a"]
+    fuzz_matcher = SkillMatcher(fuzz_skills)
+    for text in fuzz_texts(5000, rng):
+        if legacy_extract(text, fuzz_skills) != matcher_extract(text, fuzz_matcher):
+            raise AssertionError(f"matcher differs from regex loop on {text!r}")
+
+    start = time.perf_counter()
+    expected = [legacy_extract(text, skills) for text in resumes]
+    legacy = (time.perf_counter() - start) / n_resumes
+    if expected != [matcher_extract(text, matcher) for text in resumes]:
+        raise AssertionError("matcher differs from regex loop on a generated resume")
+
+    hits = np.mean([len(found) for found in expected])
+    print(f"{len(skills)} skills, {n_resumes} resumes of ~{np.mean([len(t) for t in resumes]):.0f} chars, "
+          f"{hits:.0f} skills found per resume; outputs identical")
+    print(f"matcher build: {build_ms:.1f} ms (once per process)")
+
+    compiled = _best_of(lambda: [matcher_extract(t, matcher) for t in resumes], repeat) / n_resumes
+    print(f"{'regex per skill':<18}{legacy * 1e3:>10.2f} ms / resume")
+    print(f"{'SkillMatcher':<18}{compiled * 1e3:>10.2f} ms / resume   ({legacy / compiled:.0f}x)")
+    return resumes
+
+
+def run_scaling(resumes, repeat, sizes=(len(CS_SKILLS), 1000, 5000, 20000, 50000), seed=1):
+    print(f"\n{'taxonomy size':<18}{'build':>10}{'match':>20}")
+    for size in sizes:
+        skills = make_taxonomy(size, np.random.default_rng(seed))
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build = time.perf_counter() - start
+        per_resume = _best_of(lambda: [matcher_extract(t, matcher) for t in resumes], repeat) / len(resumes)
+        print(f"{len(skills):<18}{build * 1e3:>7.1f} ms{per_resume * 1e3:>10.2f} ms / resume")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--skills", type=int, default=5000)
+    parser.add_argument("--resumes", type=int, default=10)
+    parser.add_argument("--words", type=int, default=3000, help="words per generated resume")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scaling", action="store_true",
+                        help="also time the matcher with taxonomies up to 50,000 entries")
+    args = parser.parse_args()
+
+    resumes = run(args.skills, args.resumes, args.words, args.repeat)
+    if args.scaling:
+        run_scaling(resumes, args.repeat)
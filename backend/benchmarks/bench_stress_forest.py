@@ -0,0 +1,74 @@
+"""
+Stress model: sklearn scaler + RandomForest vs the array-compiled forest.
+
+Checks that both return identical classes and probabilities, then
+times single-row and batch scoring.
+
+Run from the repo root:
+    python -m backend.benchmarks.bench_stress_forest --rows 5000
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from backend.app.ml_inference.compiled_forest import compile_forest
+from backend.app.ml_inference.model_loader import load_model
+
+# Upper bound of each questionnaire answer, in model feature order
+FEATURE_MAX = np.array([21, 30, 1, 27, 5, 3, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 3, 5, 5, 5])
+
+
+def _questionnaire_rows(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, FEATURE_MAX + 1, size=(n, len(FEATURE_MAX))).astype(np.float64)
+
+
+def _sklearn_path(forest, scaler, X):
+    X_scaled = scaler.transform(X)
+    return forest.predict(X_scaled), forest.predict_proba(X_scaled)
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_rows, repeat):
+    forest = load_model("stress_level_random_forest.pkl")
+    scaler = load_model("stress_level_scaler.pkl")
+    compiled = compile_forest(forest, scaler=scaler)
+
+    X = _questionnaire_rows(n_rows)
+
+    labels, proba = compiled.predict_with_proba(X)
+    ref_labels, ref_proba = _sklearn_path(forest, scaler, X)
+    assert np.array_equal(labels, ref_labels), "class mismatch"
+    assert np.array_equal(proba, ref_proba), "probability mismatch"
+    print(f"identical output on {n_rows} rows")
+
+    one = X[:1]
+    single_sklearn = _best_of(lambda: _sklearn_path(forest, scaler, one), repeat)
+    single_compiled = _best_of(lambda: compiled.predict_with_proba(one), repeat)
+    batch_sklearn = _best_of(lambda: _sklearn_path(forest, scaler, X), 3)
+    batch_compiled = _best_of(lambda: compiled.predict_with_proba(X), 3)
+
+    print(f"{'':<12}{'sklearn':>14}{'compiled':>14}")
+    print(f"{'1 row':<12}{single_sklearn * 1e3:>11.3f} ms{single_compiled * 1e3:>11.3f} ms")
+    print(f"{f'{n_rows} rows':<12}{batch_sklearn * 1e3:>11.1f} ms{batch_compiled * 1e3:>11.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=UserWarning)
+    run(args.rows, args.repeat)
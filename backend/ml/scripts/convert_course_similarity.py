@@ -0,0 +1,50 @@
+"""
+Convert the dense course_similarity_matrix.pkl into the memory-mapped
+CSR neighbor artifact (course_similarity_csr/).
+
+Run from the repo root:
+    python -m backend.ml.scripts.convert_course_similarity --top-k 50 --threshold 0.05
+"""
+
+import argparse
+import os
+import pickle
+
+from backend.app.ml_inference.course_neighbors import (
+    CSR_SIMILARITY_DIR,
+    DEFAULT_TOP_K,
+    DENSE_SIMILARITY_FILE,
+    save_csr_neighbors,
+)
+from backend.app.ml_inference.model_loader import MODEL_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", default=os.path.join(MODEL_DIR, DENSE_SIMILARITY_FILE))
+    parser.add_argument("--output", default=os.path.join(MODEL_DIR, CSR_SIMILARITY_DIR))
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K,
+                        help="neighbors kept per course")
+    parser.add_argument("--threshold", type=float, default=0.0,
+                        help="drop neighbors with similarity below this value")
+    args = parser.parse_args()
+
+    with open(args.input, "rb") as f:
+        sim_matrix = pickle.load(f)
+
+    meta = save_csr_neighbors(sim_matrix, args.output, k=args.top_k, threshold=args.threshold)
+
+    dense_bytes = sim_matrix.nbytes
+    csr_bytes = sum(
+        os.path.getsize(os.path.join(args.output, name))
+        for name in os.listdir(args.output)
+    )
+
+    print(f"Courses:    {meta['n_courses']}")
+    print(f"Stored:     {meta['nnz']} neighbors (top {meta['top_k']}, >= {meta['threshold']})")
+    print(f"Dense size: {dense_bytes / 1e6:.1f} MB")
+    print(f"CSR size:   {csr_bytes / 1e6:.1f} MB -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
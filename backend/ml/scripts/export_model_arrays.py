@@ -0,0 +1,83 @@
+"""
+Export pickled models in MODEL_DIR to checksummed array artifacts
+(MODEL_DIR/arrays/<name>.npz + <name>.json).
+
+Supported: TF-IDF vectorizers, linear models (LogisticRegression,
+LinearSVC, LinearRegression), StandardScaler and RandomForestClassifier
+(as flattened tree arrays). Other pickles (pipelines, datasets) are
+skipped and keep loading through joblib. Every export is loaded back
+and checked against the pickle before the next one.
+
+Run from the repo root:
+    python -m backend.ml.scripts.export_model_arrays
+    python -m backend.ml.scripts.export_model_arrays domain_model.pkl job_role_model.pkl
+"""
+
+import argparse
+import os
+import warnings
+
+import numpy as np
+
+from backend.app.ml_inference.array_artifacts import (
+    ARRAY_DIR,
+    codec_for,
+    export_model,
+    load_array_model,
+)
+from backend.app.ml_inference.compiled_forest import compile_forest
+from backend.app.ml_inference.model_loader import MODEL_DIR, load_model
+
+
+def _check_round_trip(kind, original, loaded):
+    """Loaded model must give exactly the pickle's outputs."""
+    if kind == "tfidf_vectorizer":
+        docs = [" ".join(list(original.vocabulary_)[i::7]) for i in range(7)]
+        a, b = original.transform(docs), loaded.transform(docs)
+        same = (a != b).nnz == 0
+    elif kind == "standard_scaler":
+        X = np.random.default_rng(0).normal(size=(64, original.n_features_in_))
+        same = np.array_equal(original.transform(X), loaded.transform(X))
+    elif kind == "linear_model":
+        X = np.random.default_rng(0).random((64, original.n_features_in_))
+        method = "decision_function" if hasattr(original, "classes_") else "predict"
+        same = np.array_equal(getattr(original, method)(X), getattr(loaded, method)(X))
+    else:
+        compiled = compile_forest(original)
+        same = all(
+            np.array_equal(getattr(compiled, name), getattr(loaded, name))
+            for name in ("feature", "threshold", "left", "right", "value", "roots")
+        )
+
+    if not same:
+        raise AssertionError(f"{kind}: exported model output differs from the pickle")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*",
+                        help="pickles in MODEL_DIR to export (default: all supported)")
+    parser.add_argument("--output", default=os.path.join(MODEL_DIR, ARRAY_DIR))
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    files = args.files or sorted(f for f in os.listdir(MODEL_DIR) if f.endswith(".pkl"))
+
+    for filename in files:
+        model = load_model(filename)
+        kind = codec_for(model)
+        if kind is None:
+            print(f"skip    {filename:<36} ({type(model).__name__} has no array codec)")
+            continue
+
+        base_path = os.path.join(args.output, os.path.splitext(filename)[0])
+        manifest = export_model(model, base_path, source=os.path.join(MODEL_DIR, filename))
+        _check_round_trip(kind, model, load_array_model(base_path))
+
+        size = os.path.getsize(os.path.join(args.output, manifest["npz"]))
+        print(f"export  {filename:<36} {kind:<18} {len(manifest['arrays'])} arrays, {size / 1e3:.0f} kB")
+
+
+if __name__ == "__main__":
+    main()
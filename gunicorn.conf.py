@@ -0,0 +1,49 @@
+# gunicorn -c gunicorn.conf.py backend.app.app:app
+
+import gc
+import glob
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+
+# Threaded workers let concurrent /ml requests in one process meet in
+# the micro-batchers (ml_inference/micro_batcher.py)
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+timeout = 60
+
+# Import the app (and the model registry) once in the master so the
+# models warmed below are shared copy-on-write by every forked worker.
+preload_app = True
+
+# Workers write Prometheus samples here so /metrics can aggregate them
+# (backend/app/utils/metrics.py). Set and cleared before the app is
+# imported; stale files from a previous run would keep old counters.
+# Only the *.db sample files go: the directory may be one an operator
+# pointed us at.
+PROMETHEUS_DIR = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/mentora-prometheus")
+os.makedirs(PROMETHEUS_DIR, exist_ok=True)
+for _stale in glob.glob(os.path.join(PROMETHEUS_DIR, "*.db")):
+    os.remove(_stale)
+
+
+def when_ready(server):
+    from backend.app.ml_inference.model_loader import model_registry
+
+    stats = model_registry.warmup()
+    for name, info in stats.items():
+        server.log.info(
+            "model %s loaded in %.3fs (%s bytes)",
+            name, info.get("load_seconds", 0.0), info.get("memory_bytes")
+        )
+
+    # Move everything allocated so far out of the GC's reach, so
+    # collections in workers don't touch (and copy) the shared pages.
+    gc.freeze()
+
+
+def child_exit(server, worker):
+    from backend.app.utils.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)